@@ -285,3 +285,11 @@ document.addEventListener('DOMContentLoaded', () => {
     // Initial load
     loadDevotionals();
 });
+
+if ('serviceWorker' in navigator) {
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register('/sw.js').catch(error => {
+            console.warn("Service worker registration failed:", error);
+        });
+    });
+}
@@ -0,0 +1,187 @@
+(function () {
+  // Client for the prebuilt index written by tools/search_index.py.
+  // Tokenizing and stemming must stay in step with the Python side.
+  const STOP_WORDS = new Set([
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "he", "his",
+    "i", "in", "is", "it", "me", "my", "not", "of", "on", "or", "shall", "so", "that",
+    "the", "their", "them", "they", "this", "thou", "thy", "to", "unto", "was", "we",
+    "which", "with", "ye", "you",
+  ]);
+  const SUFFIX_RULES = [
+    ["ations", ""],
+    ["ation", ""],
+    ["ness", ""],
+    ["ment", ""],
+    ["ings", ""],
+    ["ing", ""],
+    ["edst", ""],
+    ["eth", ""],
+    ["est", ""],
+    ["ies", "i"],
+    ["ied", "i"],
+    ["ed", ""],
+    ["es", ""],
+    ["ly", ""],
+    ["s", ""],
+  ];
+  const MIN_STEM_LENGTH = 3;
+  const MONTH_NAMES = [
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+  ];
+
+  const stemToken = (token) => {
+    for (const [suffix, replacement] of SUFFIX_RULES) {
+      if (token.endsWith(suffix) && token.length - suffix.length >= MIN_STEM_LENGTH) {
+        token = token.slice(0, -suffix.length) + replacement;
+        break;
+      }
+    }
+    if (token.length > MIN_STEM_LENGTH && token.endsWith("e")) {
+      token = token.slice(0, -1);
+    }
+    if (token.length > MIN_STEM_LENGTH && token.endsWith("y")) {
+      token = `${token.slice(0, -1)}i`;
+    }
+    return token;
+  };
+
+  const tokenize = (text) => {
+    const folded = text.toLowerCase().replace(/[’']/g, "");
+    const tokens = folded.match(/[a-z0-9]+/g) || [];
+    return tokens.filter((token) => !STOP_WORDS.has(token)).map(stemToken);
+  };
+
+  const deltaDecode = (deltas) => {
+    let current = 0;
+    return deltas.map((delta) => {
+      current += delta;
+      return current;
+    });
+  };
+
+  const createSearch = (basePath) => {
+    const cache = new Map();
+    const fetchJson = (name) => {
+      if (!cache.has(name)) {
+        cache.set(
+          name,
+          fetch(`${basePath}${name}.json`).then((response) => {
+            if (!response.ok) {
+              throw new Error(`Failed to load search data ${name}: ${response.status}`);
+            }
+            return response.json();
+          })
+        );
+      }
+      return cache.get(name);
+    };
+
+    const search = async (query) => {
+      const terms = tokenize(query);
+      if (!terms.length) {
+        return [];
+      }
+
+      const meta = await fetchJson("meta");
+      const shardNames = new Set(meta.shards);
+      let matches = null;
+
+      for (const term of terms) {
+        const prefix = term.slice(0, meta.prefix_length);
+        const shard = shardNames.has(prefix) ? await fetchJson(prefix) : {};
+        const ordinals = new Set(deltaDecode(shard[term] || []));
+        matches = matches === null ? ordinals : new Set([...matches].filter((ordinal) => ordinals.has(ordinal)));
+        if (!matches.size) {
+          return [];
+        }
+      }
+
+      // Doc metadata is chunked by ordinal range; only the chunks holding a match are fetched.
+      const ordinals = [...matches].sort((a, b) => a - b);
+      return Promise.all(
+        ordinals.map(async (ordinal) => {
+          const chunk = await fetchJson(`docs-${Math.floor(ordinal / meta.docs_chunk_size)}`);
+          const [mmdd, title] = chunk[ordinal % meta.docs_chunk_size];
+          return { mmdd, title };
+        })
+      );
+    };
+
+    return { search, tokenize };
+  };
+
+  const describeEntry = (mmdd) => {
+    const monthName = MONTH_NAMES[Number(mmdd.slice(0, 2)) - 1];
+    const day = Number(mmdd.slice(2));
+    return {
+      href: `entries/${monthName}-${day}/`,
+      displayDate: `${monthName[0].toUpperCase()}${monthName.slice(1)} ${day}`,
+    };
+  };
+
+  const bindSearchForm = () => {
+    const form = document.getElementById("searchForm");
+    if (!form) {
+      return;
+    }
+    const input = document.getElementById("searchInput");
+    const results = document.getElementById("searchResults");
+    const client = createSearch(form.dataset.searchPath);
+    let latestQuery = 0;
+
+    const showMessage = (text) => {
+      const item = document.createElement("li");
+      item.className = "search-result search-result--empty";
+      item.textContent = text;
+      results.replaceChildren(item);
+    };
+
+    form.addEventListener("submit", async (event) => {
+      event.preventDefault();
+      const queryId = ++latestQuery;
+      if (!input.value.trim()) {
+        results.replaceChildren();
+        results.classList.add("hidden");
+        return;
+      }
+      results.classList.remove("hidden");
+      let matches;
+      try {
+        matches = await client.search(input.value);
+      } catch (error) {
+        console.error("Search failed:", error);
+        if (queryId === latestQuery) {
+          showMessage("Search is unavailable right now.");
+        }
+        return;
+      }
+      if (queryId !== latestQuery) {
+        return;
+      }
+      if (!matches.length) {
+        showMessage("No entries match that search.");
+        return;
+      }
+
+      results.replaceChildren(
+        ...matches.map(({ mmdd, title }) => {
+          const { href, displayDate } = describeEntry(mmdd);
+          const item = document.createElement("li");
+          item.className = "search-result";
+          const link = document.createElement("a");
+          link.href = href;
+          link.textContent = title;
+          const date = document.createElement("span");
+          date.className = "search-result-date";
+          date.textContent = displayDate;
+          item.append(link, date);
+          return item;
+        })
+      );
+    });
+  };
+
+  window.LincolnSearch = { createSearch, tokenize };
+  document.addEventListener("DOMContentLoaded", bindSearchForm);
+})();
@@ -1,3 +1,11 @@
+if ("serviceWorker" in navigator) {
+  window.addEventListener("load", () => {
+    navigator.serviceWorker.register("/sw.js").catch((error) => {
+      console.warn("Static entry nav: service worker registration failed.", error);
+    });
+  });
+}
+
 document.addEventListener("DOMContentLoaded", () => {
   const pickerWrap = document.querySelector('.date-picker-wrap[data-entry-mmdd]');
 
@@ -8,6 +16,7 @@ document.addEventListener("DOMContentLoaded", () => {
 
   const dateInput = pickerWrap.querySelector(".nav-date-input");
   const currentDateDisplay = pickerWrap.querySelector(".current-date-display");
+  const entryNav = pickerWrap.closest(".entry-nav");
   const entryMmdd = pickerWrap.dataset.entryMmdd;
   const routesPath = pickerWrap.dataset.routesPath;
 
@@ -63,10 +72,153 @@ document.addEventListener("DOMContentLoaded", () => {
     return routeMapPromise;
   };
 
-  const currentYearDate = buildCurrentYearDate(entryMmdd);
-  if (currentYearDate) {
-    dateInput.value = toDateInputValue(currentYearDate);
-    currentDateDisplay.title = `Current page date: ${currentDateDisplay.textContent}`;
+  const showEntryDate = (mmdd) => {
+    const currentYearDate = buildCurrentYearDate(mmdd);
+    if (currentYearDate) {
+      dateInput.value = toDateInputValue(currentYearDate);
+      currentDateDisplay.title = `Current page date: ${currentDateDisplay.textContent}`;
+    }
+  };
+
+  showEntryDate(entryMmdd);
+
+  // Each entry page has a fragment.json beside it with the article and head metadata, so
+  // moving between days swaps the article in place instead of reloading the page shell.
+  const fragmentCache = new Map();
+  const loadFragment = (href) => {
+    const fragmentUrl = new URL("fragment.json", new URL(href, window.location.href)).toString();
+    if (!fragmentCache.has(fragmentUrl)) {
+      const request = fetch(fragmentUrl).then((response) => {
+        if (!response.ok) {
+          throw new Error(`Failed to load entry fragment: ${response.status}`);
+        }
+
+        return response.json();
+      });
+      request.catch(() => fragmentCache.delete(fragmentUrl));
+      fragmentCache.set(fragmentUrl, request);
+    }
+
+    return fragmentCache.get(fragmentUrl);
+  };
+
+  const setAttribute = (selector, name, value) => {
+    const element = document.querySelector(selector);
+    if (element) {
+      element.setAttribute(name, value);
+    }
+  };
+
+  const applyFragment = (fragment) => {
+    const article = document.querySelector(".entry-card");
+    const template = document.createElement("template");
+    template.innerHTML = fragment.article.trim();
+    const nextArticle = template.content.firstElementChild;
+
+    if (!article || !nextArticle) {
+      throw new Error("Entry article is missing.");
+    }
+
+    article.replaceWith(nextArticle);
+    document.title = fragment.title;
+    setAttribute('link[rel="canonical"]', "href", fragment.canonical);
+    setAttribute('meta[name="description"]', "content", fragment.description);
+    setAttribute('meta[property="og:title"]', "content", fragment.title);
+    setAttribute('meta[property="og:description"]', "content", fragment.description);
+    setAttribute('meta[property="og:url"]', "content", fragment.canonical);
+    setAttribute('link[rel="prev"]', "href", fragment.prev);
+    setAttribute('link[rel="next"]', "href", fragment.next);
+
+    const navLinks = entryNav ? entryNav.querySelectorAll(":scope > a") : [];
+    if (navLinks.length === 2) {
+      navLinks[0].setAttribute("href", fragment.prev);
+      navLinks[1].setAttribute("href", fragment.next);
+    }
+
+    // Keep the build's prefetch hints pointed at the new entry's neighbours.
+    document.querySelectorAll("link[data-neighbour]").forEach((link) => {
+      const target = link.dataset.neighbour === "next" ? fragment.next : fragment.prev;
+      link.setAttribute("href", `${target}fragment.json`);
+    });
+
+    const devotionLink = document.getElementById("devotionLink");
+    if (devotionLink) {
+      devotionLink.setAttribute("href", fragment.href);
+      devotionLink.dataset.linkTitle = fragment.link_title;
+    }
+
+    pickerWrap.dataset.entryMmdd = fragment.mmdd;
+    currentDateDisplay.textContent = fragment.display_date;
+    showEntryDate(fragment.mmdd);
+  };
+
+  const prefetchHints = document.querySelector('script[type="speculationrules"]')
+    ? "speculation"
+    : document.querySelector("link[data-neighbour]")
+      ? "prefetch"
+      : "none";
+  // Speculation Rules prefetch whole pages, which only a normal navigation can use.
+  const swapEntries = prefetchHints !== "speculation";
+
+  const navigateTo = async (href, pushHistory) => {
+    if (!swapEntries) {
+      window.location.href = href;
+      return;
+    }
+
+    const started = performance.now();
+    try {
+      const fragment = await loadFragment(href);
+      applyFragment(fragment);
+      const swapMs = Math.round(performance.now() - started);
+
+      if (pushHistory) {
+        window.history.pushState({ href: fragment.href }, "", fragment.href);
+        window.scrollTo(0, 0);
+      }
+
+      if (typeof window.gtag === "function") {
+        window.gtag("event", "page_view", {
+          page_location: window.location.href,
+          page_title: document.title,
+          entry_swap_ms: swapMs,
+          prefetch_hints: prefetchHints,
+        });
+      }
+    } catch (error) {
+      console.warn("Static entry nav: falling back to a full page load.", error);
+      window.location.href = href;
+    }
+  };
+
+  window.history.replaceState({ href: window.location.pathname }, "");
+
+  window.addEventListener("popstate", (event) => {
+    if (event.state && event.state.href) {
+      navigateTo(event.state.href, false);
+    }
+  });
+
+  if (entryNav && swapEntries) {
+    entryNav.addEventListener("click", (event) => {
+      const link = event.target.closest("a[href]");
+
+      if (
+        !link ||
+        !entryNav.contains(link) ||
+        event.defaultPrevented ||
+        event.button !== 0 ||
+        event.ctrlKey ||
+        event.metaKey ||
+        event.shiftKey ||
+        event.altKey
+      ) {
+        return;
+      }
+
+      event.preventDefault();
+      navigateTo(link.href, true);
+    });
   }
 
   pickerWrap.addEventListener("click", () => {
@@ -99,7 +251,7 @@ document.addEventListener("DOMContentLoaded", () => {
         return;
       }
 
-      window.location.href = href;
+      navigateTo(href, true);
     } catch (error) {
       console.error("Static entry nav: failed to resolve route.", error);
     }
@@ -0,0 +1,133 @@
+// Generated by tools/generate_entry_pages.py; do not edit by hand.
+const MANIFEST_VERSION = "77183e6e949095af";
+const MANIFEST_URL = "/precache-manifest.json";
+const MANIFEST_KEY = "/__precache-manifest__";
+const CACHE_NAME = "lincoln-devotional";
+
+let manifestPromise;
+
+const normalizePath = (pathname) =>
+  pathname.endsWith("/index.html") ? pathname.slice(0, -"index.html".length) : pathname;
+
+const readStoredManifest = async (cache) => {
+  const response = await cache.match(MANIFEST_KEY);
+  return response ? response.json() : { files: {}, precache: [], entries: [] };
+};
+
+const loadManifest = () => {
+  if (!manifestPromise) {
+    manifestPromise = caches.open(CACHE_NAME).then(readStoredManifest);
+  }
+  return manifestPromise;
+};
+
+const cacheMissing = async (cache, paths) => {
+  for (const path of paths) {
+    if (await cache.match(path)) {
+      continue;
+    }
+    try {
+      const response = await fetch(path);
+      if (response.ok) {
+        await cache.put(path, response);
+      }
+    } catch (error) {
+      console.warn(`Service worker: could not cache ${path}.`, error);
+    }
+  }
+};
+
+const FRAGMENT_NAME = "fragment.json";
+
+// static-entry-nav.js swaps entries in from their fragment.json, so a visit through either
+// the page or its fragment caches both the page and the fragment of each neighbour.
+const neighbourPaths = (manifest, path) => {
+  const entryPath = path.endsWith(`/${FRAGMENT_NAME}`) ? path.slice(0, -FRAGMENT_NAME.length) : path;
+  const position = manifest.entries.indexOf(entryPath);
+  if (position === -1) {
+    return [];
+  }
+  const count = manifest.entries.length;
+  return [
+    manifest.entries[(position - 1 + count) % count],
+    manifest.entries[(position + 1) % count],
+  ].flatMap((neighbour) => [neighbour, `${neighbour}${FRAGMENT_NAME}`]);
+};
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    (async () => {
+      const response = await fetch(`${MANIFEST_URL}?v=${MANIFEST_VERSION}`, { cache: "no-store" });
+      if (!response.ok) {
+        throw new Error(`Failed to load precache manifest: ${response.status}`);
+      }
+      const manifest = await response.json();
+      const cache = await caches.open(CACHE_NAME);
+      const previous = await readStoredManifest(cache);
+
+      // Only files whose content hash changed (or that were removed) are evicted.
+      const cachedRequests = await cache.keys();
+      await Promise.all(
+        cachedRequests.map((request) => {
+          const path = new URL(request.url).pathname;
+          if (path === MANIFEST_KEY) {
+            return null;
+          }
+          const hash = manifest.files[path];
+          return hash && hash === previous.files[path] ? null : cache.delete(request);
+        })
+      );
+
+      await cacheMissing(cache, manifest.precache);
+      await cache.put(
+        MANIFEST_KEY,
+        new Response(JSON.stringify(manifest), { headers: { "Content-Type": "application/json" } })
+      );
+      manifestPromise = Promise.resolve(manifest);
+      await self.skipWaiting();
+    })()
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(self.clients.claim());
+});
+
+self.addEventListener("fetch", (event) => {
+  const { request } = event;
+  if (request.method !== "GET") {
+    return;
+  }
+
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) {
+    return;
+  }
+
+  const path = normalizePath(url.pathname);
+  event.respondWith(
+    (async () => {
+      const manifest = await loadManifest();
+      if (!(path in manifest.files)) {
+        return fetch(request);
+      }
+
+      const cache = await caches.open(CACHE_NAME);
+      const neighbours = neighbourPaths(manifest, path);
+      if (neighbours.length) {
+        event.waitUntil(cacheMissing(cache, neighbours));
+      }
+
+      const cached = await cache.match(path);
+      if (cached) {
+        return cached;
+      }
+
+      const response = await fetch(request);
+      if (response.ok) {
+        await cache.put(path, response.clone());
+      }
+      return response;
+    })()
+  );
+});
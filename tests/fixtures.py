@@ -0,0 +1,24 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+
+def make_entry(day, **fields):
+    """A January entry with placeholder text; ``fields`` override any of its values."""
+    return {
+        "mmdd": f"01{day:02d}",
+        "month": 1,
+        "day": day,
+        "display_date": f"January {day}",
+        "title": f"Title {day}",
+        "bible_verse": f"Verse {day}.",
+        "verse_ref": f"Ref {day}",
+        "poem": f"Poem {day}.",
+        **fields,
+    }
+
+
+def make_temp_dir(test_case):
+    """Create a directory that is removed when ``test_case`` finishes; returns its path."""
+    tmp_dir = TemporaryDirectory()
+    test_case.addCleanup(tmp_dir.cleanup)
+    return Path(tmp_dir.name)
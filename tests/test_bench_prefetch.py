@@ -0,0 +1,37 @@
+import unittest
+
+from tests.fixtures import make_entry
+from tools.bench_prefetch import measure_mode, read_hints
+from tools.generate_entry_pages import render_entry_page
+
+
+class BenchPrefetchTests(unittest.TestCase):
+    def setUp(self):
+        self.entries = [make_entry(day) for day in range(1, 4)]
+
+    def test_read_hints_follows_links_and_speculation_rules(self):
+        first, second, third = self.entries
+        html = render_entry_page(second, first, third, "", "https://lincolndevotional.com", prefetch="speculation")
+
+        self.assertEqual(read_hints(html, "/entries/january-2/"), ["/entries/january-1/", "/entries/january-3/"])
+        default_html = render_entry_page(second, first, third, "", "https://lincolndevotional.com")
+        self.assertEqual(
+            read_hints(default_html, "/entries/january-2/"),
+            ["/entries/january-3/fragment.json", "/entries/january-1/fragment.json"],
+        )
+
+    def test_hints_serve_next_day_from_prefetch(self):
+        without_hints = measure_mode(self.entries, {}, "none", steps=2, latency_ms=20, dwell_ms=80)
+        fragment_hints = measure_mode(self.entries, {}, "prefetch", steps=2, latency_ms=20, dwell_ms=80)
+        page_hints = measure_mode(self.entries, {}, "speculation", steps=2, latency_ms=20, dwell_ms=80)
+
+        self.assertEqual(without_hints["fragment"]["prefetch_hits"], 0)
+        self.assertGreaterEqual(without_hints["fragment"]["median_ms"], 20)
+        self.assertEqual(fragment_hints["fragment"]["prefetch_hits"], 2)
+        self.assertNotIn("fragment", page_hints)
+        self.assertEqual(page_hints["page"]["prefetch_hits"], 2)
+        self.assertGreater(page_hints["page"]["bytes_fetched"], without_hints["page"]["bytes_fetched"])
+
+
+if __name__ == "__main__":
+    unittest.main()
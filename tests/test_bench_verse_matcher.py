@@ -0,0 +1,83 @@
+import unittest
+
+from tools.bench_verse_matcher import (
+    MATCHERS,
+    ChapterBible,
+    build_corpus,
+    evaluate,
+)
+
+
+KJV_CHAPTERS = {
+    "Psalms": {
+        23: {
+            1: "The LORD is my shepherd; I shall not want.",
+            2: "He maketh me to lie down in green pastures: he leadeth me beside the still waters.",
+            3: "He restoreth my soul: he leadeth me in the paths of righteousness for his name's sake.",
+            4: "Yea, though I walk through the valley of the shadow of death, I will fear no evil: "
+               "for thou art with me; thy rod and thy staff they comfort me.",
+            5: "Thou preparest a table before me in the presence of mine enemies: "
+               "thou anointest my head with oil; my cup runneth over.",
+            6: "Surely goodness and mercy shall follow me all the days of my life: "
+               "and I will dwell in the house of the LORD for ever.",
+        },
+        24: {
+            1: "The earth is the LORD'S, and the fulness thereof; the world, and they that dwell therein.",
+            2: "For he hath founded it upon the seas, and established it upon the floods.",
+        },
+        121: {
+            1: "I will lift up mine eyes unto the hills, from whence cometh my help.",
+            2: "My help cometh from the LORD, which made heaven and earth.",
+            3: "He will not suffer thy foot to be moved: he that keepeth thee will not slumber.",
+            4: "Behold, he that keepeth Israel shall neither slumber nor sleep.",
+            5: "The LORD is thy keeper: the LORD is thy shade upon thy right hand.",
+            6: "The sun shall not smite thee by day, nor the moon by night.",
+            7: "The LORD shall preserve thee from all evil: he shall preserve thy soul.",
+            8: "The LORD shall preserve thy going out and thy coming in from this time forth, and even for evermore.",
+        },
+    },
+}
+REFS = ["Psalm 23:4", "Psalm 23:5-6", "Psalm 121:3", "Psalm 121:7-8", "Psalm 24:1"]
+
+
+class BenchVerseMatcherTests(unittest.TestCase):
+    def setUp(self):
+        self.bible = ChapterBible(KJV_CHAPTERS)
+        self.corpus = build_corpus(self.bible, REFS, seed=1)
+
+    def test_corpus_covers_every_perturbation_with_labels(self):
+        perturbations = {case["perturbation"] for case in self.corpus}
+        self.assertEqual(
+            perturbations,
+            {"exact", "truncated", "ellipsis", "archaic", "wrong_verse", "wrong_chapter"},
+        )
+        wrong_verse = next(case for case in self.corpus if case["id"] == "0000-wrong_verse")
+        self.assertEqual(wrong_verse["entry"]["verse_ref"], "Psalm 23:5")
+        self.assertEqual(wrong_verse["expected"]["verse_ref"], "Psalm 23:4")
+        archaic = next(case for case in self.corpus if case["perturbation"] == "archaic")
+        self.assertNotEqual(archaic["entry"]["bible_verse"], archaic["expected"]["bible_verse"])
+
+    def test_corpus_is_deterministic_for_a_seed(self):
+        self.assertEqual(build_corpus(self.bible, REFS, seed=1), self.corpus)
+
+    def test_chapter_bible_round_trips_through_json(self):
+        self.assertEqual(ChapterBible.from_json(self.bible.to_json()).chapters, KJV_CHAPTERS)
+
+    def test_baseline_matcher_accuracy(self):
+        result = evaluate(MATCHERS["difflib"], self.bible, self.corpus)
+
+        by_perturbation = result["by_perturbation"]
+        for name in ("exact", "archaic", "wrong_verse", "wrong_chapter"):
+            self.assertEqual(by_perturbation[name]["correct"], by_perturbation[name]["cases"], name)
+        self.assertEqual(result["corrections"]["recall"], 1.0)
+        self.assertEqual(result["ref_expansions"]["precision"], 1.0)
+        self.assertGreater(result["entries_per_second"], 0)
+
+    def test_matchers_agree_on_the_fixture_corpus(self):
+        baseline = evaluate(MATCHERS["difflib"], self.bible, self.corpus)
+        candidate = evaluate(MATCHERS["difflib-noautojunk"], self.bible, self.corpus)
+        self.assertGreaterEqual(candidate["accuracy"], baseline["accuracy"])
+
+
+if __name__ == "__main__":
+    unittest.main()
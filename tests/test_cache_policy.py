@@ -0,0 +1,279 @@
+import gzip
+import json
+from pathlib import Path, PurePosixPath
+import re
+import shlex
+from types import SimpleNamespace
+import unittest
+from unittest import mock
+import zlib
+
+from tests.fixtures import make_entry, make_temp_dir
+from tools.cache_policy import (
+    HTACCESS_NAME,
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    SHORT_CACHE_CONTROL,
+)
+from tools.generate_entry_pages import copy_static_files, generate_site
+
+
+SITE_URL = "https://lincolndevotional.com"
+DEFAULT_TYPES = {
+    ".css": "text/css",
+    ".gz": "application/gzip",
+    ".html": "text/html",
+    ".js": "text/javascript",
+    ".json": "application/json",
+    ".txt": "text/plain",
+    ".xml": "application/xml",
+}
+EXPRESSION_PATTERN = re.compile(r"^(?:%\{(\w+)\}|'(.*)') =~ (?:/(.*)/|m#(.*)#)$")
+
+
+class ApacheFixture:
+    """Serves a document root the way Apache would apply the subset of .htaccess the build emits.
+
+    Supports the directives the generator writes: <IfModule> (every module loaded),
+    <If>/<ElseIf>/<Else>, <FilesMatch>, Header set/merge, RewriteEngine/RewriteCond/RewriteRule
+    with -s and regex conditions, RemoveType and AddEncoding. Unknown directives fail loudly.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.rewrites = []
+        self.conditional_headers = []
+        self.files_match = []
+        self.types = dict(DEFAULT_TYPES)
+        self.encodings = {}
+        self.rewrite_enabled = False
+        self.parse((self.root / HTACCESS_NAME).read_text(encoding="utf-8"))
+
+    def parse(self, text):
+        pending_conditions = []
+        section = None
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if not line or line.startswith("#") or line.startswith("<IfModule") or line == "</IfModule>":
+                continue
+            match = re.match(r'^<(If|ElseIf|Else|FilesMatch)(?: "(.*)")?>$', line)
+            if match:
+                kind, argument = match.groups()
+                if kind == "FilesMatch":
+                    section = (re.compile(argument), [])
+                    self.files_match.append(section)
+                else:
+                    if kind == "If":
+                        self.conditional_headers.append([])
+                    section = (argument, [])
+                    self.conditional_headers[-1].append(section)
+                continue
+            if line.startswith("</"):
+                section = None
+                continue
+
+            words = shlex.split(line, posix=False)
+            directive, arguments = words[0], [word.strip('"') for word in words[1:]]
+            if directive == "Header":
+                section[1].append(arguments)
+            elif directive == "RewriteEngine":
+                self.rewrite_enabled = arguments == ["On"]
+            elif directive == "RewriteCond":
+                pending_conditions.append(arguments)
+            elif directive == "RewriteRule":
+                pattern, substitution, flags = arguments
+                self.rewrites.append((re.compile(pattern), substitution, flags, pending_conditions))
+                pending_conditions = []
+            elif directive == "RemoveType":
+                for suffix in arguments:
+                    self.types.pop(suffix, None)
+            elif directive == "AddEncoding":
+                self.encodings[arguments[1]] = arguments[0]
+            else:
+                raise AssertionError(f"Fixture does not understand: {line}")
+
+    def expand(self, text, request_path, accept_encoding):
+        variables = {
+            "HTTP:Accept-Encoding": accept_encoding,
+            "REQUEST_FILENAME": str(self.root) + request_path,
+        }
+        return re.sub(r"%\{([^}]+)\}", lambda match: variables[match.group(1)], text)
+
+    def rewrite(self, request_path, accept_encoding):
+        env = {}
+        if not self.rewrite_enabled:
+            return request_path, env
+        for pattern, substitution, flags, conditions in self.rewrites:
+            match = pattern.search(request_path.lstrip("/"))
+            if not match:
+                continue
+            satisfied = True
+            for test_string, condition in conditions:
+                value = self.expand(test_string, request_path, accept_encoding)
+                if condition == "-s":
+                    path = Path(value)
+                    satisfied = path.is_file() and path.stat().st_size > 0
+                else:
+                    satisfied = re.search(condition, value) is not None
+                if not satisfied:
+                    break
+            if not satisfied:
+                continue
+            request_path = "/" + re.sub(r"\$(\d)", lambda ref: match.group(int(ref.group(1))) or "", substitution)
+            env.update(dict(item[2:].split(":") for item in flags.strip("[]").split(",") if item.startswith("E=")))
+            if "L" in flags.strip("[]").split(","):
+                break
+        return request_path, env
+
+    def get(self, url_path, query="", accept_encoding=""):
+        request_path, env = url_path, {}
+        for _ in range(10):
+            rewritten, rewrite_env = self.rewrite(request_path, accept_encoding)
+            env.update(rewrite_env)
+            if rewritten == request_path:
+                break
+            request_path = rewritten
+        else:
+            raise AssertionError(f"Rewrite loop for {url_path}")
+
+        if request_path.endswith("/"):
+            request_path += "index.html"
+        file_path = self.root / request_path.lstrip("/")
+        if not file_path.is_file():
+            return SimpleNamespace(status=404, file=None, headers={}, env=env)
+
+        headers = {}
+        for suffix in PurePosixPath(file_path.name).suffixes:
+            if suffix in self.encodings:
+                headers["Content-Encoding"] = self.encodings[suffix]
+            elif suffix in self.types:
+                headers["Content-Type"] = self.types[suffix]
+
+        variables = {"REQUEST_URI": request_path, "QUERY_STRING": query}
+        for chain in self.conditional_headers:
+            for expression, header_lines in chain:
+                if expression is None or self.evaluate(expression, variables):
+                    self.apply_headers(headers, header_lines)
+                    break
+        for pattern, header_lines in self.files_match:
+            if pattern.search(file_path.name):
+                self.apply_headers(headers, header_lines)
+        return SimpleNamespace(
+            status=200,
+            file=file_path.relative_to(self.root).as_posix(),
+            body=file_path.read_bytes(),
+            headers=headers,
+            env=env,
+        )
+
+    def evaluate(self, expression, variables):
+        name, string, slash_pattern, hash_pattern = EXPRESSION_PATTERN.match(expression).groups()
+        value = variables[name] if name else re.sub(r"%\{(\w+)\}", lambda match: variables[match.group(1)], string)
+        return re.search(slash_pattern or hash_pattern, value) is not None
+
+    def apply_headers(self, headers, header_lines):
+        for action, name, value in header_lines:
+            if action == "set" or name not in headers:
+                headers[name] = value
+            elif value not in headers[name].split(", "):
+                headers[name] = f"{headers[name]}, {value}"
+
+
+class CachePolicyTests(unittest.TestCase):
+    def setUp(self):
+        self.output_root = make_temp_dir(self)
+        self.entries = [make_entry(day) for day in range(1, 4)]
+        copy_static_files(self.output_root)
+
+    def build(self, precompress):
+        return generate_site(self.entries, {}, self.output_root, SITE_URL, precompress=precompress)
+
+    def test_cache_lifetimes_by_path_and_version(self):
+        self.build(precompress=False)
+        server = ApacheFixture(self.output_root)
+
+        cases = {
+            ("/style.css", "v=20261019a"): IMMUTABLE_CACHE_CONTROL,
+            ("/static-entry-nav.js", "v=20261019d"): IMMUTABLE_CACHE_CONTROL,
+            ("/entries/january-2/", ""): SHORT_CACHE_CONTROL,
+            ("/entries/january-2/fragment.json", ""): SHORT_CACHE_CONTROL,
+            ("/data/routes.json", ""): SHORT_CACHE_CONTROL,
+            ("/style.css", ""): REVALIDATE_CACHE_CONTROL,
+            ("/style.css", "v=20261019c"): REVALIDATE_CACHE_CONTROL,
+            ("/entries/january-2/", "v=20261019a"): SHORT_CACHE_CONTROL,
+            ("/sw.js", ""): REVALIDATE_CACHE_CONTROL,
+            ("/", ""): REVALIDATE_CACHE_CONTROL,
+        }
+        for (path, query), expected in cases.items():
+            response = server.get(path, query)
+            self.assertEqual(response.status, 200, path)
+            self.assertEqual(response.headers["Cache-Control"], expected, path)
+        self.assertFalse(server.rewrites)
+        self.assertNotIn("Content-Encoding", server.get("/entries/january-2/", accept_encoding="gzip").headers)
+
+    def test_asset_edit_without_version_bump_fails_the_build(self):
+        self.build(precompress=False)
+        manifest = json.loads((self.output_root / "publish-manifest.json").read_text())
+        self.assertIn("/theme.js?v=20260123", manifest["versioned_assets"])
+        self.assertNotIn("/theme.js?v=20260123", manifest["files"])
+
+        theme_path = self.output_root / "theme.js"
+        theme_path.write_text(theme_path.read_text(encoding="utf-8") + "\n// edited\n", encoding="utf-8")
+
+        with self.assertRaisesRegex(ValueError, r"/theme\.js\?v=20260123"):
+            self.build(precompress=False)
+
+    def test_precompressed_siblings_are_served_by_encoding(self):
+        report = self.build(precompress=True)
+        server = ApacheFixture(self.output_root)
+
+        page = server.get("/entries/january-2/", accept_encoding="gzip, deflate")
+        self.assertEqual(page.file, "entries/january-2/index.html.gz")
+        self.assertEqual(page.headers["Content-Encoding"], "gzip")
+        self.assertEqual(page.headers["Content-Type"], "text/html")
+        self.assertEqual(page.headers["Cache-Control"], SHORT_CACHE_CONTROL)
+        self.assertEqual(page.headers["Vary"], "Accept-Encoding")
+        self.assertEqual(page.env["no-gzip"], "1")
+        self.assertEqual(
+            gzip.decompress(page.body), (self.output_root / "entries" / "january-2" / "index.html").read_bytes()
+        )
+
+        stylesheet = server.get("/style.css", "v=20261019a", accept_encoding="gzip")
+        self.assertEqual(stylesheet.file, "style.css.gz")
+        self.assertEqual(stylesheet.headers["Content-Type"], "text/css")
+        self.assertEqual(stylesheet.headers["Cache-Control"], IMMUTABLE_CACHE_CONTROL)
+
+        identity = server.get("/entries/january-2/")
+        self.assertEqual(identity.file, "entries/january-2/index.html")
+        self.assertNotIn("Content-Encoding", identity.headers)
+        self.assertEqual(identity.headers["Vary"], "Accept-Encoding")
+
+        manifest = json.loads((self.output_root / "publish-manifest.json").read_text())["files"]
+        self.assertIn(HTACCESS_NAME, manifest)
+        self.assertIn("entries/january-2/index.html.gz", manifest)
+        self.assertEqual(report["cache_policy"]["encodings"], [".gz"])
+        self.assertGreater(report["cache_policy"]["bytes_saved"], 0)
+
+    def test_brotli_is_preferred_when_available(self):
+        fake_brotli = SimpleNamespace(compress=lambda data, quality: zlib.compress(data, 9))
+        with mock.patch("tools.cache_policy.brotli", fake_brotli):
+            self.build(precompress=True)
+        server = ApacheFixture(self.output_root)
+
+        self.assertEqual(server.get("/about.html", accept_encoding="gzip, br").file, "about.html.br")
+        self.assertEqual(server.get("/about.html", accept_encoding="gzip").file, "about.html.gz")
+        self.assertEqual(server.get("/about.html", accept_encoding="br").headers["Content-Encoding"], "br")
+
+    def test_rebuild_without_precompression_removes_stale_siblings(self):
+        self.build(precompress=True)
+        self.assertTrue((self.output_root / "entries" / "january-2" / "index.html.gz").exists())
+
+        report = self.build(precompress=False)
+
+        self.assertFalse((self.output_root / "entries" / "january-2" / "index.html.gz").exists())
+        self.assertEqual(report["cache_policy"]["precompressed"], 0)
+        self.assertNotIn("RewriteEngine", (self.output_root / HTACCESS_NAME).read_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
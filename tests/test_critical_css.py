@@ -0,0 +1,100 @@
+import unittest
+
+from tests.fixtures import make_entry
+from tools.critical_css import (
+    collect_markup_usage,
+    extract_critical_css,
+    parse_stylesheet,
+    selector_matches,
+)
+from tools.generate_entry_pages import generate_site
+from tools.output_sink import MemorySink
+
+
+STYLESHEET = """
+/* Comment {with braces} */
+:root { --accent: #8b4c2a; }
+.entry-card, .about-card { padding: 40px; }
+.entry-poem .poem-line--blank { min-height: 1.6em; }
+.hidden { display: none !important; }
+.entry-nav:has(a:only-child):not(:has(a + a)) { justify-content: center; }
+@media (max-width: 600px) {
+    .entry-card { padding: 28px 22px; }
+    .cta-button { width: 100%; }
+}
+@media (max-width: 900px) {
+    .cta-button { width: 50%; }
+}
+"""
+
+MARKUP = """
+<nav class="entry-nav"><a href="#">Previous</a></nav>
+<article class="entry-card"><section class="entry-poem"><div class="poem-line">Line</div></section></article>
+"""
+
+
+class CriticalCssTests(unittest.TestCase):
+    def setUp(self):
+        self.entries = [make_entry(1, title="First", bible_verse="Verse one.", poem="Poem one.")]
+
+    def test_selector_matches_ignores_pseudo_classes_and_attributes(self):
+        usage = collect_markup_usage(MARKUP)
+        self.assertTrue(selector_matches(".entry-nav:has(a:only-child):not(:has(a + a))", usage))
+        self.assertTrue(selector_matches('[data-theme="dark"]', usage))
+        self.assertFalse(selector_matches(".entry-poem .poem-line--blank", usage))
+        self.assertFalse(selector_matches("#themeToggle", usage))
+
+    def test_extract_keeps_used_rules_and_prunes_empty_media_queries(self):
+        critical = extract_critical_css(parse_stylesheet(STYLESHEET), MARKUP)
+
+        self.assertIn(":root{--accent:#8b4c2a}", critical)
+        self.assertIn(".entry-card{padding:40px}", critical)
+        self.assertIn("@media (max-width: 600px){.entry-card{padding:28px 22px}}", critical)
+        self.assertNotIn("about-card", critical)
+        self.assertNotIn(".hidden", critical)
+        self.assertNotIn("900px", critical)
+        self.assertNotIn("Comment", critical)
+
+    def test_extract_keeps_at_rule_bodies_and_quoted_separators(self):
+        stylesheet = """
+@font-face { font-family: "Lora"; src: url("lora.woff2") format("woff2"); }
+@keyframes fade { from { opacity: 0; } to { opacity: 1; } }
+.entry-card { background: url("data:image/svg+xml;utf8,<svg/>") no-repeat; content: "a;  b}"; }
+:is(.entry-card, .about-card) p { margin: 0; }
+"""
+        critical = extract_critical_css(parse_stylesheet(stylesheet), MARKUP + "<p>Text</p>")
+
+        self.assertIn('@font-face{font-family: "Lora"; src: url("lora.woff2") format("woff2");}', critical)
+        self.assertIn("@keyframes fade{from { opacity: 0; } to { opacity: 1; }}", critical)
+        self.assertIn(
+            '.entry-card{background:url("data:image/svg+xml;utf8,<svg/>") no-repeat;content:"a;  b}"}', critical
+        )
+        self.assertIn(":is(.entry-card, .about-card) p{margin:0}", critical)
+
+    def test_generate_site_inlines_critical_css_and_defers_stylesheets(self):
+        sink = MemorySink()
+        report = generate_site(self.entries, {}, sink, "https://lincolndevotional.com")
+
+        html = sink.files["entries/january-1/index.html"].decode("utf-8")
+        self.assertIn("<style>:root{", html)
+        self.assertIn('<link rel="preload" href="../../style.css?v=20261019a" as="style"', html)
+        self.assertIn('<noscript><link rel="stylesheet" href="../../style.css?v=20261019a" /></noscript>', html)
+        self.assertNotIn('<link rel="stylesheet" href="../../style.css?v=20261019a" />\n', html)
+        self.assertLess(html.index("<style>"), html.index("</head>"))
+
+        critical_report = report["critical_css"]
+        self.assertGreater(critical_report["per_page"]["january-1"], 0)
+        self.assertEqual(critical_report["over_budget"], [])
+
+    def test_generate_site_can_keep_blocking_stylesheets(self):
+        sink = MemorySink()
+        report = generate_site(self.entries, {}, sink, "https://lincolndevotional.com", inline_critical=False)
+
+        html = sink.files["entries/january-1/index.html"].decode("utf-8")
+        self.assertIn('<link rel="stylesheet" href="../../style.css?v=20261019a" />', html)
+        self.assertNotIn("<style>", html)
+        self.assertNotIn("critical_css", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
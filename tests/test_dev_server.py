@@ -0,0 +1,140 @@
+from contextlib import redirect_stdout
+import io
+import json
+import os
+import threading
+import unittest
+from urllib.request import urlopen
+
+from tests.fixtures import make_entry, make_temp_dir
+from tools.dev_server import SiteState, create_server, watch
+from tools.generate_entry_pages import STYLESHEET_PATH
+
+
+class DevServerTests(unittest.TestCase):
+    def setUp(self):
+        root = make_temp_dir(self)
+        self.entries_path = root / "entries.json"
+        self.esv_cache_path = root / "esv_cache.json"
+        self.stylesheet_path = root / "style.css"
+        self.entries = [make_entry(day) for day in range(1, 6)]
+        self.write_json(self.entries_path, self.entries)
+        self.write_json(self.esv_cache_path, {})
+        self.stylesheet_path.write_text(STYLESHEET_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+        self.state = SiteState(self.entries_path, self.esv_cache_path, self.stylesheet_path)
+        self.state.load()
+
+    def write_json(self, path, data):
+        path.write_text(json.dumps(data), encoding="utf-8")
+        # Guarantee a visible mtime change even on coarse-grained filesystems.
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_load_renders_every_page_with_live_reload(self):
+        self.assertEqual(len(self.state.pages), 5)
+        html = self.state.pages["/entries/january-3/"].decode("utf-8")
+        self.assertIn("Title 3", html)
+        self.assertIn('new EventSource("/__livereload")', html)
+
+    def test_refresh_without_changes_renders_nothing(self):
+        self.assertEqual(self.state.refresh(), set())
+        self.assertEqual(self.state.version, 0)
+
+    def test_entry_edit_rerenders_entry_and_neighbours_only(self):
+        self.entries[2] = dict(self.entries[2], title="Title 3, edited")
+        self.write_json(self.entries_path, self.entries)
+
+        rendered = self.state.refresh()
+
+        self.assertEqual(rendered, {"/entries/january-2/", "/entries/january-3/", "/entries/january-4/"})
+        self.assertIn("Title 3, edited", self.state.pages["/entries/january-3/"].decode("utf-8"))
+        self.assertEqual(self.state.version, 1)
+
+    def test_esv_edit_wraps_neighbours_around_the_year(self):
+        self.write_json(self.esv_cache_path, {"0101": {"text": "New ESV text."}})
+
+        rendered = self.state.refresh()
+
+        self.assertEqual(rendered, {"/entries/january-5/", "/entries/january-1/", "/entries/january-2/"})
+        self.assertIn("New ESV text.", self.state.pages["/entries/january-1/"].decode("utf-8"))
+
+    def test_added_entry_rerenders_everything_and_routes(self):
+        self.write_json(self.entries_path, self.entries + [make_entry(6)])
+
+        rendered = self.state.refresh()
+
+        self.assertEqual(len(rendered), 6)
+        self.assertIn("0106", json.loads(self.state.routes_json))
+
+    def test_invalid_input_keeps_the_last_good_state_until_saved_again(self):
+        self.write_json(self.esv_cache_path, {"0101": {"text": "New ESV text."}})
+        self.entries_path.write_text('[{"mmdd": "0101"', encoding="utf-8")
+        os.utime(self.entries_path, ns=(0, self.entries_path.stat().st_mtime_ns + 1_000_000_000))
+        mtimes = dict(self.state.mtimes)
+
+        with self.assertRaises(ValueError):
+            self.state.refresh()
+
+        self.assertEqual(self.state.esv_cache, {})
+        self.assertEqual(len(self.state.entries), 5)
+        self.assertEqual(self.state.mtimes, mtimes)
+        self.assertEqual(self.state.refresh(), set())
+
+        self.write_json(self.entries_path, self.entries)
+        rendered = self.state.refresh()
+
+        self.assertIn("/entries/january-1/", rendered)
+        self.assertIn("New ESV text.", self.state.pages["/entries/january-1/"].decode("utf-8"))
+
+    def test_stylesheet_edit_resets_critical_css_cache(self):
+        self.assertTrue(self.state.critical_css_cache)
+        stylesheet = self.stylesheet_path.read_text(encoding="utf-8")
+        self.stylesheet_path.write_text(stylesheet + "\n.entry-card { outline: 1px solid red; }\n", encoding="utf-8")
+        stat = self.stylesheet_path.stat()
+        os.utime(self.stylesheet_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        rendered = self.state.refresh()
+
+        self.assertEqual(len(rendered), 5)
+        self.assertIn("outline:1px solid red", self.state.pages["/entries/january-3/"].decode("utf-8"))
+
+    def test_watch_logs_unreadable_inputs_and_keeps_running(self):
+        stop_event = threading.Event()
+        calls = []
+
+        class UnreadableState:
+            def refresh(self):
+                calls.append(None)
+                if len(calls) == 2:
+                    stop_event.set()
+                raise PermissionError("entries.json")
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            watch(UnreadableState(), stop_event, interval=0)
+
+        self.assertEqual(len(calls), 2)
+        self.assertIn("Skipped rebuild: entries.json", output.getvalue())
+
+    def test_server_serves_rendered_pages_from_memory(self):
+        server = create_server(self.state, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        with urlopen(f"{base_url}/entries/january-2/") as response:
+            self.assertIn("Title 2", response.read().decode("utf-8"))
+        with urlopen(f"{base_url}/data/routes.json") as response:
+            self.assertEqual(json.loads(response.read())["0105"], "/entries/january-5/")
+        with urlopen(f"{base_url}/sw.js") as response:
+            self.assertIn(b"unregister", response.read())
+        with urlopen(f"{base_url}/entries/january-2/fragment.json") as response:
+            fragment = json.loads(response.read())
+        self.assertEqual(fragment["next"], "/entries/january-3/")
+        self.assertIn("Title 2", fragment["article"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import json
+import unittest
+
+from tests.fixtures import make_entry, make_temp_dir
+from tools.export_dataset import (
+    ColumnarReader,
+    build_columnar_bytes,
+    iter_json_array,
+    iter_ndjson,
+    write_dataset_exports,
+)
+from tools.generate_entry_pages import generate_site
+
+
+class ExportDatasetTests(unittest.TestCase):
+    def setUp(self):
+        self.entries = [
+            make_entry(
+                1,
+                title="The Believer the Object of Divine Love",
+                bible_verse="In this was manifested the love of God toward us.",
+                verse_ref="1 John 4:9",
+                poem="Pause, my soul, adore and wonder,\r\nThanks, eternal thanks to thee.",
+                status="converted",
+            ),
+            make_entry(
+                2,
+                title="Redeemed by the Blood of Christ",
+                bible_verse="Forasmuch as ye know that ye were not redeemed—with silver.",
+                verse_ref="1 Peter 1:18-19",
+                poem="Our sins and griefs on him were laid;",
+                status="converted",
+            ),
+        ]
+
+    def test_reader_returns_single_entry_by_mmdd(self):
+        output_root = make_temp_dir(self)
+        write_dataset_exports(self.entries, output_root)
+
+        with ColumnarReader(output_root / "data" / "entries.ldc") as reader:
+            self.assertEqual(len(reader), 2)
+            self.assertEqual(reader.get("0102"), self.entries[1])
+            self.assertEqual(reader.row(0), self.entries[0])
+            self.assertIsNone(reader.get("1231"))
+
+    def test_reader_omits_fields_missing_from_an_entry(self):
+        entries = [dict(self.entries[0]), dict(self.entries[1])]
+        del entries[1]["status"]
+        path = make_temp_dir(self) / "entries.ldc"
+        path.write_bytes(build_columnar_bytes(entries))
+
+        with ColumnarReader(path) as reader:
+            self.assertEqual(reader.get("0102"), entries[1])
+
+    def test_reader_round_trips_values_that_are_not_strings_or_int32(self):
+        entries = [
+            dict(self.entries[0], featured=True, score=0.5, tags=["love", "grace"], notes=None, views=1 << 40),
+            dict(self.entries[1], featured=False, score=2, tags=[], notes={"source": "1869"}, views=3),
+        ]
+        path = make_temp_dir(self) / "entries.ldc"
+        path.write_bytes(build_columnar_bytes(entries))
+
+        with ColumnarReader(path) as reader:
+            self.assertEqual(reader.row(0), entries[0])
+            self.assertEqual(reader.get("0102"), entries[1])
+            self.assertIs(reader.get("0101")["featured"], True)
+            self.assertIsNone(reader.get("0101")["notes"])
+
+    def test_reader_binary_searches_rows_sorted_by_mmdd(self):
+        entries = [make_entry(day) for day in (9, 3, 27, 1, 14)]
+        path = make_temp_dir(self) / "entries.ldc"
+        path.write_bytes(build_columnar_bytes(entries))
+
+        with ColumnarReader(path) as reader:
+            stored = [reader.row(row)["mmdd"] for row in range(len(reader))]
+            self.assertEqual(stored, ["0101", "0103", "0109", "0114", "0127"])
+            for entry in entries:
+                self.assertEqual(reader.get(entry["mmdd"]), entry)
+            self.assertIsNone(reader.get("0100"))
+            self.assertIsNone(reader.get("0102"))
+            self.assertIsNone(reader.get("1231"))
+
+    def test_columnar_export_requires_mmdd_strings(self):
+        with self.assertRaises(ValueError):
+            build_columnar_bytes([{"title": "No date"}])
+
+    def test_columnar_export_interns_repeated_strings(self):
+        data = build_columnar_bytes(self.entries)
+        self.assertEqual(data.count(b"converted"), 1)
+
+    def test_reader_rejects_other_files(self):
+        path = make_temp_dir(self) / "entries.ldc"
+        path.write_bytes(b"not a columnar export at all")
+        with self.assertRaises(ValueError):
+            ColumnarReader(path)
+
+    def test_generate_site_writes_ndjson_export(self):
+        output_root = make_temp_dir(self)
+        report = generate_site(self.entries, {}, output_root, "https://lincolndevotional.com")
+
+        ndjson_path = output_root / "data" / "entries.ndjson"
+        self.assertEqual(list(iter_ndjson(ndjson_path)), self.entries)
+        self.assertEqual(report["dataset_exports"]["ndjson_bytes"], ndjson_path.stat().st_size)
+
+    def test_iter_json_array_reads_items_across_small_chunks(self):
+        items = self.entries + [12345, [1.5, None], "tail"]
+        path = make_temp_dir(self) / "entries.json"
+        path.write_text(json.dumps(items, ensure_ascii=False, indent=2), encoding="utf-8")
+
+        self.assertEqual(list(iter_json_array(path, chunk_size=3)), items)
+
+        path.write_text("[]", encoding="utf-8")
+        self.assertEqual(list(iter_json_array(path, chunk_size=3)), [])
+
+        path.write_text('[{"mmdd": "0101"}, ', encoding="utf-8")
+        with self.assertRaises(ValueError):
+            list(iter_json_array(path, chunk_size=3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import io
+import json
+import unittest
+from unittest import mock
+import urllib.error
+
+from tools.fetch_esv import FetchMetrics, fetch_esv
+
+
+class FakeResponse(io.BytesIO):
+    status = 200
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def http_error(code, retry_after=None):
+    headers = {"Retry-After": retry_after} if retry_after else {}
+    return urllib.error.HTTPError("https://api.esv.org", code, "error", headers, io.BytesIO(b"slow down"))
+
+
+class FetchEsvTests(unittest.TestCase):
+    def setUp(self):
+        sleep_patch = mock.patch("tools.fetch_esv.time.sleep")
+        self.sleep = sleep_patch.start()
+        self.addCleanup(sleep_patch.stop)
+        print_patch = mock.patch("builtins.print")
+        print_patch.start()
+        self.addCleanup(print_patch.stop)
+
+    def test_success_records_latency_status_and_bytes(self):
+        body = json.dumps({"passages": ["For God so loved the world. "]}).encode("utf-8")
+        metrics = FetchMetrics()
+        with mock.patch("tools.fetch_esv.urllib.request.urlopen", return_value=FakeResponse(body)):
+            text = fetch_esv("John 3:16", "key", metrics)
+
+        self.assertEqual(text, "For God so loved the world.")
+        summary = metrics.summary()
+        self.assertEqual(summary["requests"], 1)
+        self.assertEqual(summary["status_counts"], {"200": 1})
+        self.assertEqual(summary["bytes_received"], len(body))
+        self.assertEqual(sum(summary["latency_ms"]["histogram"].values()), 1)
+
+    def test_throttled_request_is_retried_and_wait_is_counted(self):
+        body = json.dumps({"passages": ["Jesus wept."]}).encode("utf-8")
+        responses = [http_error(429, retry_after="3"), http_error(503), FakeResponse(body)]
+        metrics = FetchMetrics()
+        with mock.patch("tools.fetch_esv.urllib.request.urlopen", side_effect=responses):
+            text = fetch_esv("John 11:35", "key", metrics, retries=2)
+
+        self.assertEqual(text, "Jesus wept.")
+        summary = metrics.summary()
+        self.assertEqual(summary["retries"], 2)
+        self.assertEqual(summary["status_counts"], {"429": 1, "503": 1, "200": 1})
+        self.assertAlmostEqual(summary["error_rate"], 2 / 3, places=4)
+        # Retry-After wins over the exponential backoff (2s, then 4s).
+        self.assertEqual(summary["backoff_wait_seconds"], 3.0 + 4.0)
+        self.assertEqual(summary["throttle_wait_seconds"], 0.0)
+
+    def test_client_errors_are_not_retried(self):
+        metrics = FetchMetrics()
+        with mock.patch("tools.fetch_esv.urllib.request.urlopen", side_effect=[http_error(401)]):
+            self.assertIsNone(fetch_esv("John 1:1", "bad-key", metrics, retries=2))
+
+        self.assertEqual(metrics.summary()["status_counts"], {"401": 1})
+        self.sleep.assert_not_called()
+
+    def test_histogram_buckets_latencies(self):
+        metrics = FetchMetrics()
+        for seconds in (0.01, 0.2, 0.2, 7.0):
+            metrics.record_request(200, seconds, 0)
+
+        histogram = metrics.histogram()
+        self.assertEqual(histogram["<=50ms"], 1)
+        self.assertEqual(histogram["<=250ms"], 2)
+        self.assertEqual(histogram[">5000ms"], 1)
+        self.assertEqual(metrics.summary()["latency_ms"]["max"], 7000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,27 @@
+import json
 from pathlib import Path
-from tempfile import TemporaryDirectory
+import shutil
 import unittest
 
+from tests.fixtures import make_temp_dir
 from tools.generate_entry_pages import (
+    NDJSON_PATH,
+    ROOT,
     build_description,
     build_entry_href,
+    generate_editions,
     generate_site,
+    generate_site_streaming,
+    iter_entries,
+    iter_entry_windows,
+    render_entry_page,
     slugify_entry,
 )
+from tools.output_sink import MemorySink
+
+
+def read_text(sink, relative_path):
+    return sink.files[relative_path].decode("utf-8")
 
 
 def assert_in_order(test_case, html, fragments):
@@ -63,83 +77,113 @@ class GenerateEntryPagesTests(unittest.TestCase):
         self.assertNotEqual(build_description(self.entries[0]), build_description(self.entries[1]))
 
     def test_generate_site_writes_entry_pages_sitemap_and_robots(self):
-        with TemporaryDirectory() as tmp_dir:
-            output_root = Path(tmp_dir)
-            generate_site(self.entries, self.esv_cache, output_root, "https://lincolndevotional.com")
-
-            january_page = output_root / "entries" / "january-1" / "index.html"
-            sitemap = output_root / "sitemap.xml"
-            robots = output_root / "robots.txt"
-
-            self.assertTrue(january_page.exists())
-            self.assertTrue(sitemap.exists())
-            self.assertTrue(robots.exists())
-
-            html = january_page.read_text()
-            self.assertIn('<link rel="canonical" href="https://lincolndevotional.com/entries/january-1/" />', html)
-            self.assertIn("The Believer the Object of Divine Love", html)
-            self.assertIn("In this the love of God was made manifest among us.", html)
-            self.assertIn('href="/entries/january-2/"', html)
-            self.assertIn('<nav class="entry-nav" aria-label="Entry navigation">', html)
-            self.assertLess(html.index('<nav class="entry-nav" aria-label="Entry navigation">'), html.index('<article class="entry-card" aria-live="polite">'))
-            self.assertIn('href="/entries/january-2/"', html)
-            assert_in_order(
-                self,
-                html,
-                [
-                    '&larr; Previous</a>',
-                    'class="date-picker-wrap"',
-                    'Next &rarr;</a>',
-                ],
-            )
-
-            sitemap_xml = sitemap.read_text()
-            self.assertIn("https://lincolndevotional.com/", sitemap_xml)
-            self.assertIn("https://lincolndevotional.com/about.html", sitemap_xml)
-            self.assertIn("https://lincolndevotional.com/copyright.html", sitemap_xml)
+        sink = MemorySink()
+        generate_site(self.entries, self.esv_cache, sink, "https://lincolndevotional.com")
+
+        self.assertIn("entries/january-1/index.html", sink.files)
+        self.assertIn("sitemap.xml", sink.files)
+        self.assertIn("robots.txt", sink.files)
+
+        html = read_text(sink, "entries/january-1/index.html")
+        self.assertIn('<link rel="canonical" href="https://lincolndevotional.com/entries/january-1/" />', html)
+        self.assertIn("The Believer the Object of Divine Love", html)
+        self.assertIn("In this the love of God was made manifest among us.", html)
+        self.assertIn('href="/entries/january-2/"', html)
+        self.assertIn('<nav class="entry-nav" aria-label="Entry navigation">', html)
+        self.assertLess(html.index('<nav class="entry-nav" aria-label="Entry navigation">'), html.index('<article class="entry-card" aria-live="polite">'))
+        self.assertIn('href="/entries/january-2/"', html)
+        assert_in_order(
+            self,
+            html,
+            [
+                '&larr; Previous</a>',
+                'class="date-picker-wrap"',
+                'Next &rarr;</a>',
+            ],
+        )
+
+        sitemap_xml = read_text(sink, "sitemap.xml")
+        self.assertIn("https://lincolndevotional.com/", sitemap_xml)
+        self.assertIn("https://lincolndevotional.com/about.html", sitemap_xml)
+        self.assertIn("https://lincolndevotional.com/copyright.html", sitemap_xml)
 
     def test_generate_site_omits_esv_block_when_cache_missing(self):
-        with TemporaryDirectory() as tmp_dir:
-            output_root = Path(tmp_dir)
-            generate_site(self.entries, {}, output_root, "https://lincolndevotional.com")
+        sink = MemorySink()
+        generate_site(self.entries, {}, sink, "https://lincolndevotional.com")
 
-            html = (output_root / "entries" / "january-2" / "index.html").read_text()
-            self.assertNotIn("<span class=\"version-label\">ESV</span>", html)
+        html = read_text(sink, "entries/january-2/index.html")
+        self.assertNotIn("<span class=\"version-label\">ESV</span>", html)
 
     def test_generate_site_adds_date_picker_to_static_navigation(self):
-        with TemporaryDirectory() as tmp_dir:
-            output_root = Path(tmp_dir)
-            generate_site(self.entries, self.esv_cache, output_root, "https://lincolndevotional.com")
+        sink = MemorySink()
+        generate_site(self.entries, self.esv_cache, sink, "https://lincolndevotional.com")
 
-            html = (output_root / "entries" / "january-1" / "index.html").read_text()
+        html = read_text(sink, "entries/january-1/index.html")
 
-            self.assertIn('<nav class="entry-nav" aria-label="Entry navigation">', html)
-            self.assertIn('class="date-picker-wrap"', html)
-            self.assertIn('class="date-picker-label">Jump to</span>', html)
-            self.assertIn('class="current-date-display">January 1</span>', html)
-            self.assertIn('type="date"', html)
-            self.assertIn('data-entry-mmdd="0101"', html)
-            self.assertIn('data-routes-path="../../data/routes.json"', html)
-            self.assertIn('<script src="../../static-entry-nav.js?v=20260519a"></script>', html)
+        self.assertIn('<nav class="entry-nav" aria-label="Entry navigation">', html)
+        self.assertIn('class="date-picker-wrap"', html)
+        self.assertIn('class="date-picker-label">Jump to</span>', html)
+        self.assertIn('class="current-date-display">January 1</span>', html)
+        self.assertIn('type="date"', html)
+        self.assertIn('data-entry-mmdd="0101"', html)
+        self.assertIn('data-routes-path="../../data/routes.json"', html)
+        self.assertIn('<script src="../../static-entry-nav.js?v=20261019d"></script>', html)
 
     def test_static_entry_permalink_avoids_share_filter_terms(self):
-        with TemporaryDirectory() as tmp_dir:
-            output_root = Path(tmp_dir)
-            generate_site(self.entries, self.esv_cache, output_root, "https://lincolndevotional.com")
+        sink = MemorySink()
+        generate_site(self.entries, self.esv_cache, sink, "https://lincolndevotional.com")
+
+        html = read_text(sink, "entries/january-1/index.html")
+
+        self.assertIn('class="entry-permalink"', html)
+        self.assertIn('id="devotionLinkArea"', html)
+        self.assertIn('id="devotionLink"', html)
+        self.assertIn('Share this devotion', html)
+        self.assertIn('<script src="../../permalink.js?v=20260519a"></script>', html)
+        self.assertNotIn('entry-share', html)
+        self.assertNotIn('share.js', html)
+
+    def test_generate_site_writes_fragment_matching_page(self):
+        sink = MemorySink()
+        report = generate_site(self.entries, self.esv_cache, sink, "https://lincolndevotional.com")
+
+        html = read_text(sink, "entries/january-2/index.html")
+        fragment = json.loads(sink.files["entries/january-2/fragment.json"])
+        publish_manifest = json.loads(sink.files["publish-manifest.json"])
+
+        self.assertIn(fragment["article"], html)
+        self.assertIn(f"<title>{fragment['title']}</title>", html)
+        self.assertEqual(fragment["canonical"], "https://lincolndevotional.com/entries/january-2/")
+        self.assertEqual(fragment["mmdd"], "0102")
+        self.assertEqual(fragment["prev"], "/entries/january-1/")
+        self.assertIn("entries/january-2/fragment.json", publish_manifest["files"])
+        self.assertEqual(report["publish"]["files"], len(publish_manifest["files"]))
 
-            html = (output_root / "entries" / "january-1" / "index.html").read_text()
+    def test_render_entry_page_emits_neighbour_hints_per_prefetch_mode(self):
+        first, second = self.entries
+        site_url = "https://lincolndevotional.com"
 
-            self.assertIn('class="entry-permalink"', html)
-            self.assertIn('id="devotionLinkArea"', html)
-            self.assertIn('id="devotionLink"', html)
-            self.assertIn('Share this devotion', html)
-            self.assertIn('<script src="../../permalink.js?v=20260519a"></script>', html)
-            self.assertNotIn('entry-share', html)
-            self.assertNotIn('share.js', html)
+        default_html = render_entry_page(first, second, second, "", site_url)
+        self.assertIn(
+            '<link rel="prefetch" href="/entries/january-2/fragment.json" data-neighbour="next" />', default_html
+        )
+        self.assertNotIn("speculationrules", default_html)
+
+        speculation_html = render_entry_page(first, second, second, "", site_url, prefetch="speculation")
+        self.assertNotIn("data-neighbour", speculation_html)
+        self.assertIn('<script type="speculationrules">{"prefetch":[{"where":', speculation_html)
+
+        none_html = render_entry_page(first, second, second, "", site_url, prefetch="none")
+        self.assertNotIn('rel="prefetch"', none_html)
+        for html in (default_html, speculation_html, none_html):
+            self.assertNotRegex(html.split("</head>")[0], r"\n\s*\n")
+        with self.assertRaises(ValueError):
+            render_entry_page(first, second, second, "", site_url, prefetch="prerender")
 
     def test_static_entry_nav_uses_canonical_leap_year_and_display_title(self):
         script = Path("static-entry-nav.js").read_text()
         self.assertIn("const year = 2024;", script)
+        self.assertIn('const swapEntries = prefetchHints !== "speculation";', script)
         self.assertIn('currentDateDisplay.title = `Current page date: ${currentDateDisplay.textContent}`;', script)
 
     def test_generate_site_raises_for_duplicate_slug(self):
@@ -147,9 +191,8 @@ class GenerateEntryPagesTests(unittest.TestCase):
             dict(self.entries[0]),
             dict(self.entries[0], mmdd="0201"),
         ]
-        with TemporaryDirectory() as tmp_dir:
-            with self.assertRaises(ValueError):
-                generate_site(duplicate_entries, self.esv_cache, Path(tmp_dir), "https://lincolndevotional.com")
+        with self.assertRaises(ValueError):
+            generate_site(duplicate_entries, self.esv_cache, MemorySink(), "https://lincolndevotional.com")
 
     def test_generate_site_wraps_navigation_on_ends(self):
         wrap_entries = [
@@ -174,16 +217,136 @@ class GenerateEntryPagesTests(unittest.TestCase):
                 "poem": "Poem two.",
             },
         ]
-        with TemporaryDirectory() as tmp_dir:
-            output_root = Path(tmp_dir)
-            generate_site(wrap_entries, {}, output_root, "https://lincolndevotional.com")
+        sink = MemorySink()
+        generate_site(wrap_entries, {}, sink, "https://lincolndevotional.com")
+
+        first_html = read_text(sink, "entries/january-1/index.html")
+        last_html = read_text(sink, "entries/december-31/index.html")
+
+        self.assertIn('href="/entries/december-31/"', first_html)
+        self.assertIn('href="/entries/january-1/"', last_html)
+        self.assertIn('href="/entries/january-1/"', last_html)
+
+    def test_iter_entry_windows_wraps_and_yields_first_page_last(self):
+        self.assertEqual(list(iter_entry_windows([])), [])
+        self.assertEqual(list(iter_entry_windows(["a"])), [("a", "a", "a")])
+        self.assertEqual(list(iter_entry_windows(["a", "b"])), [("a", "b", "a"), ("b", "a", "b")])
+        self.assertEqual(
+            list(iter_entry_windows(iter(["a", "b", "c", "d"]))),
+            [("a", "b", "c"), ("b", "c", "d"), ("c", "d", "a"), ("d", "a", "b")],
+        )
+
+    def test_generate_site_streaming_matches_list_build(self):
+        entries = self.entries + [
+            dict(self.entries[1], mmdd="0103", day=3, display_date="January 3", title="Third & Last"),
+        ]
+        # Only the streaming build skips the columnar export, which the publish manifest lists.
+        skipped = {"data/entries.ldc", "publish-manifest.json", "publish-diff.json"}
+        list_sink = MemorySink()
+        stream_sink = MemorySink()
+        generate_site(entries, self.esv_cache, list_sink, "https://lincolndevotional.com")
+        report = generate_site_streaming(iter(entries), self.esv_cache, stream_sink, "https://lincolndevotional.com")
+
+        self.assertEqual(set(stream_sink.files), set(list_sink.files) - {"data/entries.ldc"})
+        for relative_path in sorted(set(list_sink.files) - skipped):
+            self.assertEqual(stream_sink.files[relative_path], list_sink.files[relative_path], relative_path)
+        self.assertEqual(report["pages"], 3)
+        self.assertNotIn("columnar_bytes", report["dataset_exports"])
+
+    def test_generate_site_streaming_reads_the_ndjson_export_it_rewrites(self):
+        output_root = make_temp_dir(self)
+        ndjson_path = output_root / NDJSON_PATH
+        ndjson_path.parent.mkdir(parents=True)
+        shutil.copyfile(ROOT / NDJSON_PATH, ndjson_path)
+        committed = ndjson_path.read_bytes()
+
+        report = generate_site_streaming(
+            iter_entries(ndjson_path), {}, output_root, "https://lincolndevotional.com", inline_critical=False
+        )
+
+        self.assertEqual(report["pages"], committed.count(b"\n"))
+        self.assertEqual(ndjson_path.read_bytes(), committed)
+        self.assertFalse(ndjson_path.with_name("entries.ndjson.partial").exists())
+        routes = json.loads((output_root / "data" / "routes.json").read_text(encoding="utf-8"))
+        self.assertEqual(len(routes), report["pages"])
+
+    def test_generate_site_streaming_keeps_the_ndjson_export_when_a_record_fails(self):
+        sink = MemorySink()
+        sink.write_text(NDJSON_PATH.as_posix(), "previous export\n")
+        entries = [self.entries[0], self.entries[0]]
+
+        with self.assertRaises(ValueError):
+            generate_site_streaming(iter(entries), self.esv_cache, sink, "https://lincolndevotional.com")
+
+        self.assertEqual(sink.files[NDJSON_PATH.as_posix()], b"previous export\n")
+        self.assertNotIn(f"{NDJSON_PATH.as_posix()}.partial", sink.files)
+
+    def test_generate_site_streaming_removes_stale_columnar_export(self):
+        sink = MemorySink()
+        generate_site(self.entries, self.esv_cache, sink, "https://lincolndevotional.com")
+        self.assertIn("data/entries.ldc", sink.files)
+
+        generate_site_streaming(iter(self.entries), self.esv_cache, sink, "https://lincolndevotional.com")
+
+        self.assertNotIn("data/entries.ldc", sink.files)
+        manifest = json.loads(sink.files["publish-manifest.json"])
+        self.assertNotIn("data/entries.ldc", manifest["files"])
+
+    def test_generate_site_streaming_raises_for_duplicate_slug(self):
+        duplicate_entries = iter([dict(self.entries[0]), dict(self.entries[0], mmdd="0201")])
+        with self.assertRaises(ValueError):
+            generate_site_streaming(duplicate_entries, {}, MemorySink(), "https://lincolndevotional.com")
+
+    def test_generate_editions_shares_rendering_across_hosts_and_translations(self):
+        single = MemorySink()
+        generate_site(self.entries, self.esv_cache, single, "https://lincolndevotional.com")
+        sinks = {name: MemorySink() for name in ("production", "staging", "kjv")}
+        editions = [
+            {
+                "name": "production",
+                "output_root": sinks["production"],
+                "site_url": "https://lincolndevotional.com",
+                "translations": ("KJV", "ESV"),
+            },
+            {
+                "name": "staging",
+                "output_root": sinks["staging"],
+                "site_url": "https://staging.example.com",
+                "translations": ("KJV", "ESV"),
+            },
+            {
+                "name": "kjv",
+                "output_root": sinks["kjv"],
+                "site_url": "https://lincolndevotional.com",
+                "translations": ("KJV",),
+                "prefetch": "none",
+            },
+        ]
 
-            first_html = (output_root / "entries" / "january-1" / "index.html").read_text()
-            last_html = (output_root / "entries" / "december-31" / "index.html").read_text()
+        reports = generate_editions(self.entries, self.esv_cache, editions)
 
-            self.assertIn('href="/entries/december-31/"', first_html)
-            self.assertIn('href="/entries/january-1/"', last_html)
-            self.assertIn('href="/entries/january-1/"', last_html)
+        self.assertEqual(sorted(reports), ["kjv", "production", "staging"])
+        page = "entries/january-1/index.html"
+        self.assertEqual(sinks["production"].files[page], single.files[page])
+        staging_html = read_text(sinks["staging"], page)
+        self.assertIn('<link rel="canonical" href="https://staging.example.com/entries/january-1/" />', staging_html)
+        self.assertNotIn("edition-site-url.invalid", staging_html)
+        self.assertIn("made manifest among us", staging_html)
+        kjv_html = read_text(sinks["kjv"], page)
+        self.assertNotIn("made manifest among us", kjv_html)
+        self.assertNotIn('rel="prefetch"', kjv_html)
+        self.assertEqual(read_text(sinks["kjv"], "data/esv_cache.json"), "{}\n")
+        self.assertIn("index.html", sinks["kjv"].files)
+        self.assertIn("Sitemap: https://staging.example.com/sitemap.xml", read_text(sinks["staging"], "robots.txt"))
+
+    def test_generate_editions_rejects_shared_output_roots(self):
+        output_root = make_temp_dir(self)
+        editions = [
+            {"name": name, "output_root": output_root, "site_url": "https://lincolndevotional.com", "translations": ("KJV",)}
+            for name in ("one", "two")
+        ]
+        with self.assertRaises(ValueError):
+            generate_editions(self.entries, self.esv_cache, editions)
 
 
 if __name__ == "__main__":
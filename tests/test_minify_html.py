@@ -0,0 +1,75 @@
+import unittest
+
+from tests.fixtures import make_entry
+from tools.generate_entry_pages import generate_site
+from tools.minify_html import minify_html
+from tools.output_sink import MemorySink
+
+
+class MinifyHtmlTests(unittest.TestCase):
+    def setUp(self):
+        self.entries = [
+            make_entry(
+                1,
+                title="The Believer the Object of Divine Love",
+                bible_verse="In this was manifested   the love of God.\nToward us.",
+                verse_ref="1 John 4:9",
+                poem="Pause, my soul, adore and wonder,\n\n  Thanks, eternal thanks to thee.",
+            ),
+        ]
+
+    def test_collapses_indentation_between_block_tags(self):
+        html = "<div>\n    <section>\n      <h3>Title</h3>\n    </section>\n  </div>"
+        self.assertEqual(minify_html(html), "<div><section><h3>Title</h3></section></div>")
+
+    def test_keeps_a_single_space_next_to_inline_elements(self):
+        html = "<nav>\n  <a href=\"/a/\">A</a>\n  <a href=\"/b/\">B</a>\n</nav>"
+        self.assertEqual(minify_html(html), "<nav> <a href=/a/>A</a> <a href=/b/>B</a> </nav>")
+
+    def test_unquotes_only_safe_attribute_values(self):
+        html = '<a class="entry-nav" href="/x/?a=1&amp;b=2" title="Two words" hidden>x</a>'
+        self.assertEqual(
+            minify_html(html),
+            '<a class=entry-nav href="/x/?a=1&amp;b=2" title="Two words" hidden>x</a>',
+        )
+
+    def test_drops_optional_end_tags(self):
+        html = "<html><head><title>T</title></head><body><div><p>One</p>\n<p>Two</p></div><ul><li>A</li><li>B</li></ul></body></html>"
+        self.assertEqual(
+            minify_html(html),
+            "<html><head><title>T</title><body><div><p>One<p>Two</div><ul><li>A<li>B</ul>",
+        )
+
+    def test_keeps_paragraph_end_tag_before_inline_content(self):
+        html = "<div><p>One</p><span>Two</span></div>"
+        self.assertEqual(minify_html(html), "<div><p>One</p><span>Two</span></div>")
+
+    def test_leaves_entry_text_and_poem_lines_untouched(self):
+        poem = '<div class="poem-line">Pause,  my soul</div>\n<div class="poem-line poem-line--blank"></div>'
+        html = f'<section>\n  <div class="entry-text">{poem}</div>\n</section>'
+        self.assertEqual(minify_html(html), f"<section><div class=entry-text>{poem}</div></section>")
+
+    def test_generate_site_minifies_when_requested_and_reports_savings(self):
+        sink = MemorySink()
+        report = generate_site(self.entries, {}, sink, "https://lincolndevotional.com", minify=True)
+
+        html = sink.files["entries/january-1/index.html"].decode("utf-8")
+        self.assertNotIn("\n    <", html.split("<style>")[0])
+        self.assertIn("In this was manifested   the love of God.\nToward us.", html)
+        self.assertIn('<div class="poem-line">  Thanks, eternal thanks to thee.</div>', html)
+
+        minify_report = report["minify"]
+        self.assertGreater(minify_report["bytes_saved"], 0)
+        self.assertEqual(minify_report["bytes_after"], len(html.encode("utf-8")))
+
+    def test_generate_site_does_not_minify_by_default(self):
+        sink = MemorySink()
+        report = generate_site(self.entries, {}, sink, "https://lincolndevotional.com")
+
+        html = sink.files["entries/january-1/index.html"].decode("utf-8")
+        self.assertIn('<nav class="entry-nav" aria-label="Entry navigation">', html)
+        self.assertNotIn("minify", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
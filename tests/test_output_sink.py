@@ -0,0 +1,103 @@
+import tarfile
+import unittest
+import zipfile
+
+from tests.fixtures import make_entry, make_temp_dir
+from tools.generate_entry_pages import generate_site, generate_site_streaming
+from tools.output_sink import ArchiveSink, MemorySink
+
+
+SITE_URL = "https://lincolndevotional.com"
+
+
+def read_tree(root):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob("*")
+        if path.is_file()
+    }
+
+
+class OutputSinkTests(unittest.TestCase):
+    def setUp(self):
+        self.entries = [make_entry(day) for day in range(1, 4)]
+        self.esv_cache = {"0102": {"text": "ESV verse two."}}
+
+    def test_memory_build_matches_filesystem_build(self):
+        sink = MemorySink()
+        tmp_dir = make_temp_dir(self)
+        report = generate_site(self.entries, self.esv_cache, sink, SITE_URL)
+        generate_site(self.entries, self.esv_cache, tmp_dir, SITE_URL)
+
+        self.assertEqual(sink.files, read_tree(tmp_dir))
+        self.assertEqual(report["publish"]["added"], report["publish"]["files"])
+
+    def test_streaming_build_writes_to_memory(self):
+        sink = MemorySink()
+        generate_site_streaming(iter(self.entries), self.esv_cache, sink, SITE_URL)
+
+        self.assertIn(b'"0103": "/entries/january-3/"', sink.files["data/routes.json"])
+        self.assertTrue(sink.files["sitemap.xml"].endswith(b"</urlset>"))
+        self.assertIn("entries/january-1/index.html", sink.files)
+
+    def test_memory_sink_lists_and_removes_direct_children(self):
+        sink = MemorySink()
+        sink.write_text("data/search/ab.json", "{}")
+        sink.write_text("data/search/nested/cd.json", "{}")
+        sink.write_text("data/routes.json", "{}")
+
+        self.assertEqual(sink.list_files("data/search"), ["data/search/ab.json"])
+        sink.remove("data/search/ab.json")
+        self.assertIsNone(sink.read_bytes("data/search/ab.json"))
+
+    def test_archive_sinks_bundle_the_same_files(self):
+        memory = MemorySink()
+        generate_site(self.entries, self.esv_cache, memory, SITE_URL)
+        tmp_dir = make_temp_dir(self)
+        zip_path = tmp_dir / "site.zip"
+        tar_path = tmp_dir / "site.tar.gz"
+        for path in (zip_path, tar_path):
+            with ArchiveSink(path) as sink:
+                generate_site(self.entries, self.esv_cache, sink, SITE_URL)
+
+        with zipfile.ZipFile(zip_path) as archive:
+            zipped = {name: archive.read(name) for name in archive.namelist()}
+        with tarfile.open(tar_path) as archive:
+            tarred = {member.name: archive.extractfile(member).read() for member in archive.getmembers()}
+
+        self.assertEqual(zipped, memory.files)
+        self.assertEqual(tarred, memory.files)
+
+        first_bytes = tar_path.read_bytes()
+        with ArchiveSink(tar_path) as sink:
+            generate_site(self.entries, self.esv_cache, sink, SITE_URL)
+        self.assertEqual(tar_path.read_bytes(), first_bytes)
+
+    def test_archive_sink_spools_to_disk_and_honours_rewrites(self):
+        tmp_dir = make_temp_dir(self)
+        archive_path = tmp_dir / "site.tar"
+        sink = ArchiveSink(archive_path)
+        spool = sink.root
+        sink.write_text("robots.txt", "first")
+        sink.write_text("robots.txt", "second")
+        sink.write_text("data/search/ab.json", "{}")
+        sink.remove("data/search/ab.json")
+        with sink.open_text("sw.js") as handle:
+            handle.write("// worker")
+        self.assertEqual(sink.read_bytes("robots.txt"), b"second")
+
+        sink.close()
+
+        self.assertFalse(spool.exists())
+        self.assertEqual(sink.members, ["robots.txt", "sw.js"])
+        with tarfile.open(archive_path) as archive:
+            self.assertEqual(archive.getnames(), ["robots.txt", "sw.js"])
+            self.assertEqual(archive.extractfile("robots.txt").read(), b"second")
+
+    def test_archive_sink_rejects_unknown_extensions(self):
+        with self.assertRaises(ValueError):
+            ArchiveSink("site.rar")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import json
+import unittest
+
+from tests.fixtures import make_entry, make_temp_dir
+from tools.generate_entry_pages import generate_site
+from tools.output_sink import MemorySink
+from tools.search_index import (
+    DOCS_CHUNK_SIZE,
+    build_doc,
+    delta_decode,
+    delta_encode,
+    load_docs,
+    search,
+    stem_token,
+    tokenize,
+    write_search_files,
+)
+
+
+class SearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.entries = [
+            make_entry(
+                1,
+                title="The Believer the Object of Divine Love",
+                bible_verse="In this was manifested the love of God toward us.",
+                verse_ref="1 John 4:9",
+                poem="Pause, my soul, adore and wonder,\nThanks, eternal thanks to thee.",
+            ),
+            make_entry(
+                2,
+                title="Redeemed by the Blood of Christ",
+                bible_verse="Forasmuch as ye know that ye were not redeemed.",
+                verse_ref="1 Peter 1:18-19",
+                poem="Our sins and griefs on him were laid;",
+            ),
+        ]
+        self.esv_cache = {
+            "0102": {"text": "Knowing that you were ransomed from the futile ways."}
+        }
+
+    def test_stem_token_unifies_archaic_and_modern_forms(self):
+        self.assertEqual(stem_token("loveth"), stem_token("loved"))
+        self.assertEqual(stem_token("love"), stem_token("loved"))
+        self.assertEqual(stem_token("mercies"), stem_token("mercy"))
+
+    def test_tokenize_drops_stop_words_and_punctuation(self):
+        self.assertEqual(tokenize("The Blood, of Christ!"), ["blood", "christ"])
+
+    def test_delta_encoding_round_trips(self):
+        self.assertEqual(delta_encode([9, 2, 5]), [2, 3, 4])
+        self.assertEqual(delta_decode(delta_encode([9, 2, 5])), [2, 5, 9])
+
+    def test_generate_site_writes_prefix_shards_and_reports_sizes(self):
+        sink = MemorySink()
+        report = generate_site(self.entries, self.esv_cache, sink, "https://lincolndevotional.com")
+
+        meta = json.loads(sink.files["data/search/meta.json"])
+        self.assertEqual(meta["doc_count"], 2)
+        self.assertIn("bl", meta["shards"])
+        self.assertEqual(json.loads(sink.files["data/search/bl.json"])["blood"], [1])
+        self.assertEqual(meta["docs_chunk_size"], DOCS_CHUNK_SIZE)
+        self.assertEqual(json.loads(sink.files["data/search/docs-0.json"])[0][0], "0101")
+        self.assertNotIn("data/search/docs.json", sink.files)
+
+        search_report = report["search_index"]
+        self.assertEqual(search_report["shard_count"], len(meta["shards"]))
+        self.assertGreater(search_report["shard_bytes_total"], 0)
+        self.assertEqual(search_report["docs_chunk_count"], 1)
+        self.assertGreaterEqual(search_report["build_seconds"], 0)
+
+    def test_docs_are_split_by_ordinal_range_and_loaded_per_chunk(self):
+        docs = [build_doc(make_entry(day % 28 + 1, title=f"Doc {ordinal}")) for ordinal, day in enumerate(range(70))]
+        sink = MemorySink()
+        report = write_search_files({}, docs, sink)
+
+        self.assertEqual(report["docs_chunk_count"], 3)
+        self.assertEqual(len(json.loads(sink.files["data/search/docs-1.json"])), DOCS_CHUNK_SIZE)
+        self.assertEqual(len(json.loads(sink.files["data/search/docs-2.json"])), 70 - 2 * DOCS_CHUNK_SIZE)
+
+        sink.remove("data/search/docs-1.json")
+        self.assertEqual([title for _, title in load_docs(sink, [0, 65])], ["Doc 0", "Doc 65"])
+
+    def test_search_matches_all_terms_across_fields(self):
+        output_root = make_temp_dir(self)
+        generate_site(self.entries, self.esv_cache, output_root, "https://lincolndevotional.com")
+
+        self.assertEqual(search(output_root, "divine love"), [0])
+        self.assertEqual(search(output_root, "ransomed"), [1])
+        self.assertEqual(search(output_root, "loved redeemed"), [])
+        self.assertEqual(search(output_root, "the"), [])
+        self.assertEqual(
+            load_docs(output_root, search(output_root, "ransomed")), [["0102", "Redeemed by the Blood of Christ"]]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
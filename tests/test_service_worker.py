@@ -0,0 +1,57 @@
+import json
+import unittest
+
+from tests.fixtures import make_entry
+from tools.generate_entry_pages import generate_site
+from tools.output_sink import MemorySink
+
+
+class ServiceWorkerTests(unittest.TestCase):
+    def setUp(self):
+        self.entries = [
+            make_entry(1, title="First", bible_verse="Verse one.", poem="Poem one."),
+            make_entry(2, title="Second", bible_verse="Verse two.", poem="Poem two."),
+        ]
+
+    def build(self, sink, entries):
+        report = generate_site(entries, {}, sink, "https://lincolndevotional.com")
+        manifest = json.loads(sink.files["precache-manifest.json"])
+        return report, manifest
+
+    def test_manifest_lists_entry_pages_and_shared_assets(self):
+        sink = MemorySink()
+        sink.write_text("style.css", "body {}")
+        sink.write_text("search.js", "// search")
+        report, manifest = self.build(sink, self.entries)
+
+        self.assertEqual(manifest["entries"], ["/entries/january-1/", "/entries/january-2/"])
+        self.assertIn("/style.css", manifest["precache"])
+        self.assertIn("/data/routes.json", manifest["files"])
+        self.assertIn("/data/search/meta.json", manifest["files"])
+        self.assertIn("/entries/january-2/fragment.json", manifest["files"])
+        self.assertNotIn("/entries/january-2/fragment.json", manifest["precache"])
+        self.assertIn("/search.js", manifest["precache"])
+        self.assertIn("/data/search/docs-0.json", manifest["files"])
+        self.assertNotIn("/data/search/docs-0.json", manifest["precache"])
+        self.assertNotIn("/about.html", manifest["files"])
+        self.assertEqual(report["service_worker"]["version"], manifest["version"])
+
+        worker = sink.files["sw.js"].decode("utf-8")
+        self.assertIn(f'const MANIFEST_VERSION = "{manifest["version"]}";', worker)
+        self.assertIn('const MANIFEST_URL = "/precache-manifest.json";', worker)
+        self.assertIn("].flatMap((neighbour) => [neighbour, `${neighbour}${FRAGMENT_NAME}`]);", worker)
+
+    def test_only_edited_entry_changes_hash(self):
+        sink = MemorySink()
+        _, before = self.build(sink, self.entries)
+        edited = [self.entries[0], dict(self.entries[1], title="Second, revised")]
+        _, after = self.build(sink, edited)
+
+        self.assertNotEqual(before["version"], after["version"])
+        self.assertEqual(before["files"]["/entries/january-1/"], after["files"]["/entries/january-1/"])
+        self.assertNotEqual(before["files"]["/entries/january-2/"], after["files"]["/entries/january-2/"])
+        self.assertEqual(before["files"]["/data/routes.json"], after["files"]["/data/routes.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
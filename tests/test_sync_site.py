@@ -0,0 +1,72 @@
+import json
+import unittest
+
+from tests.fixtures import make_entry, make_temp_dir
+from tools.generate_entry_pages import generate_site
+from tools.output_sink import MemorySink
+from tools.sync_site import sync_site
+
+
+class SyncSiteTests(unittest.TestCase):
+    def setUp(self):
+        self.entries = [
+            make_entry(1, title="First", bible_verse="Verse one.", poem="Poem one."),
+            make_entry(2, title="Second", bible_verse="Verse two.", poem="Poem two."),
+            make_entry(3, title="Third", bible_verse="Verse three.", poem="Poem three."),
+        ]
+
+    def build(self, output_root, entries):
+        return generate_site(entries, {}, output_root, "https://lincolndevotional.com", inline_critical=False)
+
+    def test_build_diff_lists_only_the_edited_entry(self):
+        sink = MemorySink()
+        first_report = self.build(sink, self.entries)
+        self.assertEqual(first_report["publish"]["changed"], 0)
+        self.assertGreater(first_report["publish"]["added"], 0)
+
+        edited = [self.entries[0], dict(self.entries[1], poem="Poem two, verse two."), self.entries[2]]
+        self.build(sink, edited)
+
+        diff = json.loads(sink.files["publish-diff.json"])
+        self.assertEqual(diff["added"], [])
+        self.assertEqual(diff["removed"], [])
+        self.assertIn("entries/january-2/index.html", diff["changed"])
+        self.assertNotIn("entries/january-1/index.html", diff["changed"])
+        self.assertNotIn("data/routes.json", diff["changed"])
+
+    def test_sync_copies_only_the_delta_and_removes_deleted_files(self):
+        source_root = make_temp_dir(self)
+        server_root = make_temp_dir(self)
+        self.build(source_root, self.entries)
+
+        first_sync = sync_site(source_root, server_root)
+        self.assertIn("entries/january-3/index.html", first_sync["added"])
+        self.assertTrue((server_root / "entries" / "january-3" / "index.html").exists())
+        self.assertTrue((server_root / "publish-manifest.json").exists())
+
+        self.assertEqual(sync_site(source_root, server_root)["transfer_bytes"], 0)
+
+        edited = [self.entries[0], dict(self.entries[1], title="Second, revised")]
+        self.build(source_root, edited)
+        second_sync = sync_site(source_root, server_root)
+
+        self.assertIn("entries/january-2/index.html", second_sync["changed"])
+        self.assertIn("entries/january-3/index.html", second_sync["removed"])
+        self.assertFalse((server_root / "entries" / "january-3").exists())
+        self.assertIn(
+            "Second, revised",
+            (server_root / "entries" / "january-2" / "index.html").read_text(),
+        )
+
+    def test_dry_run_leaves_target_untouched(self):
+        source_root = make_temp_dir(self)
+        server_root = make_temp_dir(self)
+        self.build(source_root, self.entries)
+
+        result = sync_site(source_root, server_root, dry_run=True)
+        self.assertGreater(len(result["added"]), 0)
+        self.assertEqual(list(server_root.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
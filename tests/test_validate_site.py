@@ -0,0 +1,94 @@
+import io
+import json
+import shutil
+import unittest
+
+from tests.fixtures import make_entry, make_temp_dir
+from tools.generate_entry_pages import STATIC_ASSETS, generate_site
+from tools.validate_site import iter_tags, validate_site
+
+
+SITE_URL = "https://lincolndevotional.com"
+
+
+class TinyReads(io.StringIO):
+    def read(self, size=-1):
+        return super().read(7)
+
+
+class ValidateSiteTests(unittest.TestCase):
+    def setUp(self):
+        self.output_root = make_temp_dir(self)
+        entries = [make_entry(day) for day in range(1, 4)]
+        generate_site(entries, {}, self.output_root, SITE_URL)
+        for asset in STATIC_ASSETS:
+            asset_path = self.output_root / asset
+            asset_path.parent.mkdir(parents=True, exist_ok=True)
+            if not asset_path.exists():
+                asset_path.write_text("", encoding="utf-8")
+
+    def test_generated_site_is_consistent(self):
+        self.assertEqual(validate_site(self.output_root, SITE_URL, workers=1), [])
+
+    def test_iter_tags_handles_tags_split_across_reads(self):
+        html = '<nav class="entry-nav"><a href="../x/">Prev</a><p>Skip</p></nav>'
+        self.assertEqual(
+            list(iter_tags(TinyReads(html))),
+            [
+                (False, "nav", {"class": "entry-nav"}),
+                (False, "a", {"href": "../x/"}),
+                (True, "a", {}),
+                (True, "nav", {}),
+            ],
+        )
+
+    def test_reports_broken_neighbour_links(self):
+        shutil.rmtree(self.output_root / "entries" / "january-2")
+
+        errors = validate_site(self.output_root, SITE_URL, workers=1)
+
+        self.assertTrue(any("january-1/index.html: next link '../january-2/'" in error for error in errors))
+        self.assertTrue(any("data/routes.json: /entries/january-2/ has no generated page" in error for error in errors))
+        self.assertTrue(any("sitemap.xml: https://lincolndevotional.com/entries/january-2/ has no generated page" in error for error in errors))
+
+    def test_reports_route_pointing_at_the_wrong_page(self):
+        routes_path = self.output_root / "data" / "routes.json"
+        routes = json.loads(routes_path.read_text())
+        routes["0101"], routes["0102"] = routes["0102"], routes["0101"]
+        routes_path.write_text(json.dumps(routes))
+
+        errors = validate_site(self.output_root, SITE_URL, workers=1)
+
+        self.assertIn(
+            "data/routes.json: 0101 routes to /entries/january-2/, which is not the page for that date",
+            errors,
+        )
+
+    def test_reports_missing_assets_and_unlisted_pages(self):
+        (self.output_root / "theme.js").unlink()
+        sitemap_path = self.output_root / "sitemap.xml"
+        sitemap_path.write_text(sitemap_path.read_text().replace("/entries/january-3/", "/entries/march-3/"))
+
+        errors = validate_site(self.output_root, SITE_URL, workers=1)
+
+        self.assertTrue(any("referenced file '../../theme.js?v=20260123' is missing" in error for error in errors))
+        self.assertIn("sitemap.xml: generated page https://lincolndevotional.com/entries/january-3/ is not listed", errors)
+
+    def test_reports_stale_and_missing_fragments(self):
+        fragment_path = self.output_root / "entries" / "january-1" / "fragment.json"
+        fragment = json.loads(fragment_path.read_text())
+        fragment["next"] = "/entries/january-3/"
+        fragment_path.write_text(json.dumps(fragment))
+        (self.output_root / "entries" / "january-2" / "fragment.json").unlink()
+
+        errors = validate_site(self.output_root, SITE_URL, workers=1)
+
+        self.assertIn(
+            "entries/january-1/fragment.json: next is '/entries/january-3/', page has '/entries/january-2/'",
+            errors,
+        )
+        self.assertIn("entries/january-2/fragment.json is missing", errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
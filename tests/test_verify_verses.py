@@ -0,0 +1,94 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+import unittest
+
+from tools.verify_verses import BibleVerifier, PhaseProfiler, default_review_path
+
+
+CHAPTERS = {
+    ("Psalms", 23): {
+        1: "The LORD is my shepherd; I shall not want.",
+        2: "He maketh me to lie down in green pastures: he leadeth me beside the still waters.",
+        3: "He restoreth my soul: he leadeth me in the paths of righteousness for his name's sake.",
+    },
+    ("John", 11): {
+        35: "Jesus wept.",
+    },
+}
+
+
+class FakeBible:
+    def get(self, books, chapters, verses):
+        return CHAPTERS.get((books[0], chapters[0]), {}).get(verses[0], "")
+
+    def get_structure(self):
+        books = {"ot": [SimpleNamespace(name="Psalms")], "nt": [SimpleNamespace(name="John")]}
+        return SimpleNamespace(get_books=lambda: books)
+
+
+class FakeVerifier(BibleVerifier):
+    def load_bible(self):
+        self.kjv = FakeBible()
+        self.bible_structure = self.kjv.get_structure()
+
+
+class VerifyVersesProfileTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.entries_path = Path(self.tmp_dir.name) / "entries.json"
+        entries = [
+            {"mmdd": "0101", "verse_ref": "Psalm 23:1", "bible_verse": "The LORD is my shepherd; I shall not want."},
+            {"mmdd": "0102", "verse_ref": "Psalm 23:2", "bible_verse": "He restoreth my soul."},
+            {"mmdd": "0103", "verse_ref": "Hezekiah 1:1", "bible_verse": "Not a book."},
+        ]
+        self.entries_path.write_text(json.dumps(entries), encoding="utf-8")
+
+    def test_profiler_counts_phases_and_entries(self):
+        profiler = PhaseProfiler()
+        verifier = FakeVerifier(str(self.entries_path), "unused", profiler)
+        verifier.verify_all()
+
+        summary = profiler.summary(top=2)
+        phases = summary["phases"]
+        self.assertEqual(summary["entries"], 3)
+        self.assertEqual(phases["load_bible (SWORD parsing)"]["calls"], 1)
+        self.assertEqual(phases["build_book_map"]["calls"], 1)
+        self.assertEqual(phases["get_chapter_data"]["calls"], 2)
+        # Three verses per chapter plus the two probes that end the scan.
+        self.assertEqual(phases["kjv.get"]["calls"], 10)
+        self.assertEqual(phases["SequenceMatcher: strict ratio"]["calls"], 2)
+        self.assertEqual(phases["SequenceMatcher: subsequence blocks"]["calls"], 1)
+        self.assertEqual(len(summary["slowest_entries"]), 2)
+        by_mmdd = {item["mmdd"]: item for item in profiler.entries}
+        self.assertEqual(by_mmdd["0101"]["chapter_verses"], 3)
+        self.assertEqual(by_mmdd["0103"]["chapter_verses"], 0)
+
+    def test_profiling_does_not_change_results(self):
+        plain = FakeVerifier(str(self.entries_path), "unused")
+        profiled = FakeVerifier(str(self.entries_path), "unused", PhaseProfiler())
+        plain.verify_all()
+        profiled.verify_all()
+
+        self.assertEqual(plain.entries, profiled.entries)
+        self.assertEqual(plain.verified_count, profiled.verified_count)
+        self.assertEqual(
+            [item["reason"] for item in plain.manual_review_list],
+            [item["reason"] for item in profiled.manual_review_list],
+        )
+
+    def test_run_writes_back_to_the_entries_file_it_read(self):
+        verifier = FakeVerifier(str(self.entries_path), "unused")
+        verifier.run()
+
+        review_path = Path(self.tmp_dir.name) / "entries.verse_review.md"
+        self.assertTrue(review_path.read_text(encoding="utf-8").startswith("# Verse Review Report"))
+        written = json.loads(self.entries_path.read_text(encoding="utf-8"))
+        self.assertEqual(written, verifier.entries)
+        self.assertEqual(default_review_path("data/entries.json"), "docs/verse_review.md")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import io
+import json
+from pathlib import Path
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+from urllib.request import urlopen
+
+try:
+    from tools.generate_entry_pages import (
+        ENTRIES_PATH,
+        ESV_CACHE_PATH,
+        PREFETCH_MODES,
+        SITE_URL,
+        build_entry_href,
+        find_neighbours,
+        generate_site,
+        load_json,
+    )
+    from tools.output_sink import MemorySink
+    from tools.validate_site import iter_tags, resolve_local
+except ImportError:  # Run directly as `python3 tools/bench_prefetch.py`.
+    from generate_entry_pages import (
+        ENTRIES_PATH,
+        ESV_CACHE_PATH,
+        PREFETCH_MODES,
+        SITE_URL,
+        build_entry_href,
+        find_neighbours,
+        generate_site,
+        load_json,
+    )
+    from output_sink import MemorySink
+    from validate_site import iter_tags, resolve_local
+
+
+DEFAULT_LATENCY_MS = 150
+DEFAULT_DWELL_MS = 1000
+DEFAULT_STEPS = 30
+# Speculation Rules prefetch whole pages, so static-entry-nav.js skips the fragment swap in that mode.
+NAVIGATION_TARGETS = {"speculation": ("page",)}
+
+
+class LatencyRequestHandler(BaseHTTPRequestHandler):
+    """Serves a built site from memory, holding every response back by a fixed round trip."""
+
+    def __init__(self, *args, files, latency, **kwargs):
+        self.files = files
+        self.latency = latency
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path.lstrip("/")
+        if path.endswith("/") or not path:
+            path += "index.html"
+        time.sleep(self.latency)
+        body = self.files.get(path)
+        if body is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def create_latency_server(files, latency_ms, host="127.0.0.1", port=0):
+    handler = partial(LatencyRequestHandler, files=files, latency=latency_ms / 1000)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def read_hints(html, page_href):
+    """URL paths a browser would fetch ahead of time for the hints in the entry page at ``page_href``."""
+    hints = []
+    nav_links = []
+    in_entry_nav = False
+    for is_end, tag, attributes in iter_tags(io.StringIO(html)):
+        if is_end:
+            if tag == "nav":
+                in_entry_nav = False
+        elif tag == "link" and attributes.get("rel") == "prefetch":
+            hints.append(attributes["href"])
+        elif tag == "nav" and "entry-nav" in attributes.get("class", "").split():
+            in_entry_nav = True
+        elif tag == "a" and in_entry_nav and attributes.get("href"):
+            nav_links.append(attributes["href"])
+    if '<script type="speculationrules">' in html:
+        # The generated document rule prefetches whatever `.entry-nav > a` points at.
+        hints.extend(f"/{resolve_local(page_href, link)}/" for link in nav_links)
+    return hints
+
+
+class HintingClient:
+    """A browser stand-in: an HTTP cache plus background fetches for the hints on each page.
+
+    This models the browser in Python; it does not parse, render or run scripts, so its timings
+    compare hint modes over the simulated network rather than measure a real page load.
+
+    A navigation waits for a prefetch of the same URL that is still in flight rather than
+    starting a second request, as browsers do for prefetches they have already issued.
+    """
+
+    def __init__(self, base_url, workers=4):
+        self.base_url = base_url
+        self.cache = {}
+        self.bytes_fetched = 0
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def fetch(self, path):
+        with urlopen(f"{self.base_url}{path}") as response:
+            body = response.read()
+        with self.lock:
+            self.bytes_fetched += len(body)
+        return body
+
+    def prefetch(self, paths):
+        with self.lock:
+            for path in paths:
+                if path not in self.cache:
+                    self.cache[path] = self.executor.submit(self.fetch, path)
+
+    def navigate(self, path):
+        """Return ``(milliseconds, served_from_prefetch)`` for getting ``path``'s bytes."""
+        started = time.perf_counter()
+        with self.lock:
+            pending = self.cache.get(path)
+        if pending is None:
+            self.fetch(path)
+        else:
+            pending.result()
+        return (time.perf_counter() - started) * 1000, pending is not None
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+def summarize_timings(timings):
+    ordered = sorted(timings)
+    return {
+        "median_ms": round(statistics.median(ordered), 1),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+        "max_ms": round(ordered[-1], 1),
+    }
+
+
+def run_session(sink, entries, start_index, steps, base_url, dwell_ms, target):
+    """Read ``steps`` consecutive days, moving forward with Next after ``dwell_ms`` on each.
+
+    ``target`` is "fragment" for the in-place swap static-entry-nav.js performs and
+    "page" for the full page load browsers without it fall back to.
+    """
+    client = HintingClient(base_url)
+    timings = []
+    hits = 0
+    try:
+        for step in range(steps):
+            index = (start_index + step) % len(entries)
+            href = build_entry_href(entries[index])
+            html = sink.files[f"{href.lstrip('/')}index.html"].decode("utf-8")
+            client.prefetch(read_hints(html, href))
+            time.sleep(dwell_ms / 1000)
+
+            _, next_entry = find_neighbours(entries, index)
+            next_href = build_entry_href(next_entry)
+            elapsed, from_prefetch = client.navigate(f"{next_href}fragment.json" if target == "fragment" else next_href)
+            timings.append(elapsed)
+            hits += from_prefetch
+    finally:
+        client.close()
+    return {
+        **summarize_timings(timings),
+        "navigations": steps,
+        "prefetch_hits": hits,
+        "bytes_fetched": client.bytes_fetched,
+    }
+
+
+def measure_mode(
+    entries,
+    esv_cache,
+    prefetch,
+    steps=DEFAULT_STEPS,
+    latency_ms=DEFAULT_LATENCY_MS,
+    dwell_ms=DEFAULT_DWELL_MS,
+    start_index=0,
+):
+    """Build the site with ``prefetch`` hints and time the next-day navigations its pages perform."""
+    sink = MemorySink()
+    generate_site(entries, esv_cache, sink, SITE_URL, inline_critical=False, prefetch=prefetch)
+    server = create_latency_server(sink.files, latency_ms)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        result = {"prefetch": prefetch}
+        for target in NAVIGATION_TARGETS.get(prefetch, ("fragment", "page")):
+            result[target] = run_session(sink, entries, start_index, steps, base_url, dwell_ms, target)
+        return result
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def print_result(result):
+    print(f"{result['prefetch']}:")
+    for target in ("fragment", "page"):
+        if target not in result:
+            continue
+        stats = result[target]
+        print(
+            f"  {target:<8} median {stats['median_ms']:>7.1f} ms  p95 {stats['p95_ms']:>7.1f} ms  "
+            f"max {stats['max_ms']:>7.1f} ms  ({stats['prefetch_hits']}/{stats['navigations']} from prefetch, "
+            f"{stats['bytes_fetched']} bytes fetched)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare next-day navigation time across prefetch modes with a simulated browser and network."
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="append",
+        choices=PREFETCH_MODES,
+        help="Mode to measure, repeatable (default: all)",
+    )
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS, help=f"Days read per session (default: {DEFAULT_STEPS})")
+    parser.add_argument(
+        "--latency-ms", type=int, default=DEFAULT_LATENCY_MS, help=f"Round trip per request (default: {DEFAULT_LATENCY_MS})"
+    )
+    parser.add_argument(
+        "--dwell-ms", type=int, default=DEFAULT_DWELL_MS, help=f"Time spent on each day (default: {DEFAULT_DWELL_MS})"
+    )
+    parser.add_argument("--entries", type=Path, default=ENTRIES_PATH, help="Entries file (default: data/entries.json)")
+    parser.add_argument("--json", type=Path, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    entries = load_json(args.entries)
+    esv_cache = load_json(ESV_CACHE_PATH)
+    results = []
+    for prefetch in args.prefetch or PREFETCH_MODES:
+        result = measure_mode(entries, esv_cache, prefetch, args.steps, args.latency_ms, args.dwell_ms)
+        print_result(result)
+        results.append(result)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+import argparse
+import difflib
+import importlib
+import json
+import random
+import re
+import sys
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from tools.verify_verses import BibleVerifier
+except ImportError:  # Run directly as `python3 tools/bench_verse_matcher.py`.
+    from verify_verses import BibleVerifier
+
+PERTURBATIONS = ('exact', 'truncated', 'ellipsis', 'archaic', 'wrong_verse', 'wrong_chapter')
+# The outcome a well-behaved matcher should reach for each perturbation.
+EXPECTED_OUTCOMES = {
+    'exact': 'unchanged',
+    'truncated': 'unchanged',
+    'ellipsis': 'unchanged',
+    'archaic': 'text_corrected',
+    'wrong_verse': 'ref_corrected',
+    'wrong_chapter': 'review',
+}
+# KJV word -> modernised spelling a transcriber might have typed instead.
+ARCHAIC_VARIANTS = (
+    ('hath', 'has'),
+    ('saith', 'says'),
+    ('doth', 'does'),
+    ('spake', 'spoke'),
+    ('shew', 'show'),
+    ('unto', 'to'),
+    ('thee', 'you'),
+    ('thou', 'you'),
+    ('thy', 'your'),
+    ('ye', 'you'),
+    ('saviour', 'savior'),
+    ('honour', 'honor'),
+)
+MIN_EDIT_WORDS = 8
+
+class ChapterBible:
+    """In-memory stand-in for a pysword Bible, holding only the chapters a corpus needs."""
+
+    def __init__(self, chapters: Dict[str, Dict[int, Dict[int, str]]]):
+        self.chapters = chapters
+
+    def get(self, books, chapters, verses):
+        return self.chapters.get(books[0], {}).get(chapters[0], {}).get(verses[0], "")
+
+    def get_structure(self):
+        books = [SimpleNamespace(name=name) for name in self.chapters]
+        return SimpleNamespace(get_books=lambda: {'ot': books})
+
+    def to_json(self) -> Dict:
+        return {
+            book: {str(chapter): {str(verse): text for verse, text in verses.items()} for chapter, verses in chapters.items()}
+            for book, chapters in self.chapters.items()
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict) -> 'ChapterBible':
+        return cls({
+            book: {int(chapter): {int(verse): text for verse, text in verses.items()} for chapter, verses in chapters.items()}
+            for book, chapters in data.items()
+        })
+
+def extract_chapters(verifier: BibleVerifier, refs: List[str]) -> ChapterBible:
+    """Copy every chapter the corpus touches (and the one after it) out of a loaded SWORD module."""
+    chapters: Dict[str, Dict[int, Dict[int, str]]] = {}
+    for ref in refs:
+        parsed = verifier.parse_ref(ref)
+        book_key = parsed and verifier.book_map.get(parsed['book'])
+        if not book_key:
+            continue
+        for chapter in (parsed['chapter'], parsed['chapter'] + 1):
+            if chapter not in chapters.get(book_key, {}):
+                raw_verses, _, _ = verifier.get_chapter_data(book_key, chapter)
+                chapters.setdefault(book_key, {})[chapter] = raw_verses
+    return ChapterBible(chapters)
+
+def make_case(case_id: str, perturbation: str, ref: str, text: str,
+              expected_ref: str, expected_text: str) -> Dict:
+    return {
+        'id': case_id,
+        'perturbation': perturbation,
+        'entry': {'mmdd': case_id, 'verse_ref': ref, 'bible_verse': text},
+        'expected': {
+            'outcome': EXPECTED_OUTCOMES[perturbation],
+            'verse_ref': expected_ref,
+            'bible_verse': expected_text,
+        },
+    }
+
+def apply_archaic_variants(text: str, rng: random.Random) -> Optional[str]:
+    present = [
+        (word, variant) for word, variant in ARCHAIC_VARIANTS
+        if re.search(rf'\b{word}\b', text, re.IGNORECASE)
+    ]
+    if not present:
+        return None
+    for word, variant in rng.sample(present, min(2, len(present))):
+        text = re.sub(rf'\b{word}\b', variant, text, count=1, flags=re.IGNORECASE)
+    return text
+
+def build_corpus(bible: ChapterBible, refs: List[str], seed: int = 0) -> List[Dict]:
+    """Derive labelled cases from each reference's KJV text; skips perturbations a passage cannot support."""
+    verifier = BibleVerifier(None, None, bible=bible)
+    rng = random.Random(seed)
+    corpus = []
+    for index, ref in enumerate(refs):
+        parsed = verifier.parse_ref(ref)
+        book_key = parsed and verifier.book_map.get(parsed['book'])
+        if not book_key or not parsed['verses']:
+            continue
+        chapter = bible.chapters.get(book_key, {}).get(parsed['chapter'], {})
+        if not all(verse in chapter for verse in parsed['verses']):
+            continue
+
+        kjv_text = " ".join(chapter[verse] for verse in parsed['verses'])
+        words = kjv_text.split()
+        case_id = f"{index:04d}"
+
+        corpus.append(make_case(f"{case_id}-exact", 'exact', ref, kjv_text, ref, kjv_text))
+
+        if len(words) >= MIN_EDIT_WORDS:
+            keep = max(4, int(len(words) * rng.uniform(0.5, 0.7)))
+            truncated = " ".join(words[:keep])
+            corpus.append(make_case(f"{case_id}-truncated", 'truncated', ref, truncated, ref, truncated))
+
+            gap_start = rng.randint(2, len(words) // 2)
+            gap_end = gap_start + max(2, int(len(words) * 0.3))
+            elided = " ".join(words[:gap_start] + ["..."] + words[gap_end:])
+            corpus.append(make_case(f"{case_id}-ellipsis", 'ellipsis', ref, elided, ref, elided))
+
+        archaic = apply_archaic_variants(kjv_text, rng)
+        if archaic:
+            corpus.append(make_case(f"{case_id}-archaic", 'archaic', ref, archaic, ref, kjv_text))
+
+        shifted = [verse + 1 for verse in parsed['verses']]
+        if all(verse in chapter for verse in shifted):
+            wrong_ref = f"{parsed['book']} {parsed['chapter']}:{verifier.format_verses(shifted)}"
+            corpus.append(make_case(f"{case_id}-wrong_verse", 'wrong_verse', wrong_ref, kjv_text, ref, kjv_text))
+
+        wrong_ref = f"{parsed['book']} {parsed['chapter'] + 1}:{verifier.format_verses(parsed['verses'])}"
+        corpus.append(make_case(f"{case_id}-wrong_chapter", 'wrong_chapter', wrong_ref, kjv_text, wrong_ref, kjv_text))
+    return corpus
+
+def classify(verifier: BibleVerifier, case: Dict) -> Tuple[str, Dict]:
+    entry = dict(case['entry'])
+    reviews_before = len(verifier.manual_review_list)
+    verifier.verify_entry(entry)
+    if len(verifier.manual_review_list) > reviews_before:
+        return 'review', entry
+    if entry['verse_ref'] != case['entry']['verse_ref']:
+        return 'ref_corrected', entry
+    if entry['bible_verse'] != case['entry']['bible_verse']:
+        return 'text_corrected', entry
+    return 'unchanged', entry
+
+def is_correct(outcome: str, entry: Dict, expected: Dict) -> bool:
+    return (
+        outcome == expected['outcome']
+        and entry['verse_ref'] == expected['verse_ref']
+        and entry['bible_verse'] == expected['bible_verse']
+    )
+
+def precision_recall(true_positives: int, predicted: int, actual: int) -> Dict:
+    return {
+        'precision': round(true_positives / predicted, 4) if predicted else 1.0,
+        'recall': round(true_positives / actual, 4) if actual else 1.0,
+        'predicted': predicted,
+        'actual': actual,
+    }
+
+def evaluate(matcher_cls, bible: ChapterBible, corpus: List[Dict], repeat: int = 1) -> Dict:
+    """Score one matcher: outcome accuracy, precision/recall of text and ref fixes, and entries/second."""
+    verifier = matcher_cls(None, None, bible=bible)
+    results = [classify(verifier, case) for case in corpus]
+
+    elapsed = 0.0
+    for _ in range(repeat):
+        verifier.manual_review_list = []
+        started = time.perf_counter()
+        for case in corpus:
+            verifier.verify_entry(dict(case['entry']))
+        elapsed += time.perf_counter() - started
+
+    by_perturbation = {name: {'cases': 0, 'correct': 0} for name in PERTURBATIONS}
+    counts = {kind: {'tp': 0, 'predicted': 0, 'actual': 0} for kind in ('text_corrected', 'ref_corrected')}
+    failures = []
+    for case, (outcome, entry) in zip(corpus, results):
+        expected = case['expected']
+        correct = is_correct(outcome, entry, expected)
+        bucket = by_perturbation[case['perturbation']]
+        bucket['cases'] += 1
+        bucket['correct'] += correct
+        for kind, tally in counts.items():
+            tally['predicted'] += outcome == kind
+            tally['actual'] += expected['outcome'] == kind
+            tally['tp'] += correct and outcome == kind
+        if not correct:
+            failures.append({'id': case['id'], 'expected': expected['outcome'], 'got': outcome,
+                             'verse_ref': entry['verse_ref']})
+
+    correct_total = sum(bucket['correct'] for bucket in by_perturbation.values())
+    return {
+        'matcher': f"{matcher_cls.__module__}.{matcher_cls.__qualname__}",
+        'cases': len(corpus),
+        'accuracy': round(correct_total / len(corpus), 4) if corpus else 1.0,
+        'entries_per_second': round(len(corpus) * repeat / elapsed, 1) if elapsed else 0.0,
+        'corrections': precision_recall(counts['text_corrected']['tp'], counts['text_corrected']['predicted'],
+                                        counts['text_corrected']['actual']),
+        'ref_expansions': precision_recall(counts['ref_corrected']['tp'], counts['ref_corrected']['predicted'],
+                                           counts['ref_corrected']['actual']),
+        'by_perturbation': {
+            name: dict(bucket, accuracy=round(bucket['correct'] / bucket['cases'], 4) if bucket['cases'] else 1.0)
+            for name, bucket in by_perturbation.items()
+        },
+        'failures': failures,
+    }
+
+class NoAutojunkVerifier(BibleVerifier):
+    """difflib without its popularity heuristic, which treats common letters in long chapters as junk."""
+
+    def strict_ratio(self, norm_entry, target_norm_text):
+        return difflib.SequenceMatcher(None, norm_entry, target_norm_text, autojunk=False).ratio()
+
+    def subsequence_ratio(self, target_norm_text, norm_entry):
+        blocks = difflib.SequenceMatcher(None, target_norm_text, norm_entry, autojunk=False).get_matching_blocks()
+        return sum(m.size for m in blocks) / len(norm_entry) if norm_entry else 0
+
+    def longest_match(self, norm_full_text, norm_entry):
+        matcher = difflib.SequenceMatcher(None, norm_full_text, norm_entry, autojunk=False)
+        return matcher.find_longest_match(0, len(norm_full_text), 0, len(norm_entry))
+
+MATCHERS = {
+    'difflib': BibleVerifier,
+    'difflib-noautojunk': NoAutojunkVerifier,
+}
+
+def resolve_matcher(name: str):
+    if name in MATCHERS:
+        return MATCHERS[name]
+    module_name, _, class_name = name.partition(':')
+    if not class_name:
+        raise SystemExit(f"Unknown matcher {name!r}; use one of {', '.join(MATCHERS)} or module:Class")
+    return getattr(importlib.import_module(module_name), class_name)
+
+def print_result(result: Dict):
+    print(f"{result['matcher']}: {result['cases']} cases, accuracy {result['accuracy']:.1%}, "
+          f"{result['entries_per_second']:.0f} entries/s")
+    for label in ('corrections', 'ref_expansions'):
+        stats = result[label]
+        print(f"  {label:<15} precision {stats['precision']:.1%}  recall {stats['recall']:.1%}  "
+              f"({stats['predicted']} predicted, {stats['actual']} expected)")
+    for name, bucket in result['by_perturbation'].items():
+        print(f"  {name:<15} {bucket['correct']:>4}/{bucket['cases']:<4} correct")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark verse matchers on a perturbed KJV corpus.")
+    parser.add_argument('--entries', default='data/entries.json', help="References to build from (default: data/entries.json)")
+    parser.add_argument('--bible', default='data/kjv-bible', help="SWORD module directory (default: data/kjv-bible)")
+    parser.add_argument('--corpus', help="Load a saved corpus instead of building one (no SWORD module needed)")
+    parser.add_argument('--write-corpus', help="Save the corpus and its chapters so later runs compare like for like")
+    parser.add_argument('--seed', type=int, default=0, help="Perturbation seed (default: 0)")
+    parser.add_argument('--matcher', action='append', help=f"Matcher to score, repeatable: {', '.join(MATCHERS)} or module:Class")
+    parser.add_argument('--repeat', type=int, default=3, help="Timing passes over the corpus (default: 3)")
+    parser.add_argument('--json', help="Write the results as JSON")
+    args = parser.parse_args()
+
+    if args.corpus:
+        with open(args.corpus, encoding='utf-8') as f:
+            saved = json.load(f)
+        bible = ChapterBible.from_json(saved['chapters'])
+        corpus = saved['cases']
+    else:
+        with open(args.entries, encoding='utf-8') as f:
+            refs = [entry['verse_ref'] for entry in json.load(f)]
+        # Pull the chapters out of SWORD once, so timings cover matching rather than module decoding.
+        bible = extract_chapters(BibleVerifier(None, args.bible), refs)
+        corpus = build_corpus(bible, refs, args.seed)
+
+    if args.write_corpus:
+        with open(args.write_corpus, 'w', encoding='utf-8') as f:
+            json.dump({'seed': args.seed, 'chapters': bible.to_json(), 'cases': corpus}, f, ensure_ascii=False)
+
+    results = []
+    for name in args.matcher or ['difflib']:
+        result = evaluate(resolve_matcher(name), bible, corpus, args.repeat)
+        result['matcher'] = name
+        print_result(result)
+        results.append(result)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    baseline = results[0]
+    if any(result['accuracy'] < baseline['accuracy'] for result in results[1:]):
+        print("At least one matcher is less accurate than the first; do not adopt it.", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from pathlib import PurePosixPath
+import posixpath
+import re
+
+try:
+    import brotli
+except ImportError:  # Optional: without it only .gz siblings are written.
+    brotli = None
+
+try:
+    from tools.output_sink import as_sink
+    from tools.publish_manifest import PUBLISH_MANIFEST_NAME
+except ImportError:  # Run directly as `python3 tools/generate_entry_pages.py`.
+    from output_sink import as_sink
+    from publish_manifest import PUBLISH_MANIFEST_NAME
+
+
+HTACCESS_NAME = ".htaccess"
+COMPRESSIBLE_SUFFIXES = (".css", ".html", ".js", ".json", ".txt", ".xml")
+# Below this size the saving does not pay for the extra file and rewrite.
+PRECOMPRESS_MIN_BYTES = 1024
+# (Content-Encoding, sibling suffix), in the order the server should prefer them.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Precompressed responses must not be compressed again by mod_deflate or mod_brotli.
+PRECOMPRESSED_REWRITE_FLAGS = "[L,E=no-gzip:1,E=no-brotli:1]"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+SHORT_CACHE_CONTROL = "public, max-age=300, must-revalidate"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+SHORT_CACHE_PATH_PATTERN = r"m#^/(entries/[^/]+/(index\.html|fragment\.json)?|data/.+\.json)(\.br|\.gz)?$#"
+# Local assets the pages link with a ?v= version; only these exact URLs are cached as immutable.
+VERSIONED_REFERENCE_PATTERN = re.compile(r'(?:href|src)="([^":?#]+)\?v=([^"&#]+)"')
+
+
+def compress_gzip(data):
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def compress_brotli(data):
+    return brotli.compress(data, quality=11)
+
+
+def available_encoders():
+    encoders = {".gz": compress_gzip}
+    if brotli is not None:
+        encoders[".br"] = compress_brotli
+    return encoders
+
+
+def write_precompressed(output_root, relative_paths, enabled=True):
+    """Write .br/.gz siblings for compressible files they shrink; returns the sibling paths.
+
+    Siblings that are no longer wanted are removed, so the server never prefers a stale copy.
+    """
+    sink = as_sink(output_root)
+    encoders = available_encoders() if enabled else {}
+    siblings = []
+    bytes_saved = 0
+    for relative_path in relative_paths:
+        if PurePosixPath(relative_path).suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        data = sink.read_bytes(relative_path) if encoders else None
+        for _, suffix in ENCODINGS:
+            sibling = f"{relative_path}{suffix}"
+            compressed = None
+            if suffix in encoders and data is not None and len(data) >= PRECOMPRESS_MIN_BYTES:
+                compressed = encoders[suffix](data)
+            if compressed is not None and len(compressed) < len(data):
+                sink.write_bytes(sibling, compressed)
+                siblings.append(sibling)
+                bytes_saved += len(data) - len(compressed)
+            else:
+                sink.remove(sibling)
+    return siblings, bytes_saved
+
+
+def render_precompressed_rules(siblings):
+    if not siblings:
+        return ""
+    suffixes = sorted({PurePosixPath(sibling).with_suffix("").suffix.lstrip(".") for sibling in siblings})
+    extension_pattern = f"\\.({'|'.join(suffixes)})"
+    written = {PurePosixPath(sibling).suffix for sibling in siblings}
+
+    rewrites = []
+    encodings = []
+    for encoding, suffix in ENCODINGS:
+        if suffix not in written:
+            continue
+        rewrites.append(
+            f"  RewriteCond %{{HTTP:Accept-Encoding}} \\b{encoding}\\b\n"
+            f"  RewriteCond %{{REQUEST_FILENAME}}/index.html{suffix} -s\n"
+            f"  RewriteRule ^(.*/)?$ $1index.html{suffix} {PRECOMPRESSED_REWRITE_FLAGS}\n"
+            f"  RewriteCond %{{HTTP:Accept-Encoding}} \\b{encoding}\\b\n"
+            f"  RewriteCond %{{REQUEST_FILENAME}}{suffix} -s\n"
+            f"  RewriteRule ^(.+{extension_pattern})$ $1{suffix} {PRECOMPRESSED_REWRITE_FLAGS}\n"
+        )
+        encodings.append(f"  AddEncoding {encoding} {suffix}\n")
+    sibling_suffixes = " ".join(suffix for _, suffix in ENCODINGS if suffix in written)
+    return (
+        "<IfModule mod_rewrite.c>\n"
+        "  RewriteEngine On\n"
+        + "".join(rewrites)
+        + "</IfModule>\n\n"
+        "<IfModule mod_mime.c>\n"
+        f"  RemoveType {sibling_suffixes}\n"
+        + "".join(encodings)
+        + "</IfModule>\n\n"
+        "<IfModule mod_headers.c>\n"
+        f'  <FilesMatch "{extension_pattern}(\\.br|\\.gz)?$">\n'
+        "    Header merge Vary Accept-Encoding\n"
+        "  </FilesMatch>\n"
+        "</IfModule>\n"
+    )
+
+
+def collect_versioned_assets(output_root, publish_paths):
+    """Map each local ``/path?v=version`` URL the published pages link to its asset's content hash."""
+    sink = as_sink(output_root)
+    hashes = {}
+    for relative_path in publish_paths:
+        if not relative_path.endswith(".html"):
+            continue
+        html = sink.read_bytes(relative_path)
+        if html is None:
+            continue
+        page_dir = posixpath.dirname(relative_path)
+        for path, version in VERSIONED_REFERENCE_PATTERN.findall(html.decode("utf-8")):
+            if path.startswith("//"):
+                continue
+            asset = posixpath.normpath(posixpath.join(page_dir, path)).lstrip("/")
+            url = f"/{asset}?v={version}"
+            if url not in hashes:
+                data = sink.read_bytes(asset)
+                hashes[url] = None if data is None else hashlib.sha256(data).hexdigest()
+    return {url: digest for url, digest in sorted(hashes.items()) if digest is not None}
+
+
+def check_versioned_assets(output_root, versioned_assets):
+    """Fail when an asset changed but is still linked under a version the last build served as immutable."""
+    payload = as_sink(output_root).read_bytes(PUBLISH_MANIFEST_NAME)
+    previous = json.loads(payload).get("versioned_assets", {}) if payload else {}
+    stale = [url for url, digest in versioned_assets.items() if previous.get(url, digest) != digest]
+    if stale:
+        raise ValueError(f"Asset content changed without a ?v= version bump: {', '.join(stale)}")
+
+
+def escape_pattern(text):
+    return re.sub(r"[^\w/-]", lambda match: f"\\{match.group()}", text)
+
+
+def render_cache_rules(versioned_assets):
+    conditions = []
+    if versioned_assets:
+        # REQUEST_URI names the precompressed sibling once the rewrite below has picked one.
+        urls = "|".join(
+            f"{escape_pattern(path)}(\\.br|\\.gz)?\\?v={escape_pattern(version)}"
+            for path, version in (url.split("?v=", 1) for url in versioned_assets)
+        )
+        conditions.append((f"'%{{REQUEST_URI}}?%{{QUERY_STRING}}' =~ m#^({urls})$#", IMMUTABLE_CACHE_CONTROL))
+    conditions.append((f"%{{REQUEST_URI}} =~ {SHORT_CACHE_PATH_PATTERN}", SHORT_CACHE_CONTROL))
+
+    lines = ["<IfModule mod_headers.c>"]
+    for index, (expression, cache_control) in enumerate(conditions):
+        section = "ElseIf" if index else "If"
+        lines.append(f'  <{section} "{expression}">')
+        lines.append(f'    Header set Cache-Control "{cache_control}"')
+        lines.append(f"  </{section}>")
+    lines.append("  <Else>")
+    lines.append(f'    Header set Cache-Control "{REVALIDATE_CACHE_CONTROL}"')
+    lines.append("  </Else>")
+    lines.append("</IfModule>")
+    return "\n".join(lines) + "\n"
+
+
+def render_htaccess(siblings, versioned_assets):
+    header = "# Generated by tools/generate_entry_pages.py; do not edit by hand.\n\n"
+    cache_rules = render_cache_rules(versioned_assets)
+    precompressed_rules = render_precompressed_rules(siblings)
+    if precompressed_rules:
+        return header + cache_rules + "\n" + precompressed_rules
+    return header + cache_rules
+
+
+def write_cache_policy(output_root, publish_paths, precompress=False, versioned_assets=None):
+    """Precompress the published files and write the .htaccess that serves them.
+
+    ``versioned_assets`` (from ``collect_versioned_assets``) lists the URLs cached as immutable;
+    the build fails if one of them changed since the last publish manifest recorded it.
+    Returns the files written (for the publish manifest) and a report.
+    """
+    sink = as_sink(output_root)
+    versioned_assets = versioned_assets or {}
+    check_versioned_assets(sink, versioned_assets)
+    siblings, bytes_saved = write_precompressed(sink, publish_paths, precompress)
+    htaccess = render_htaccess(siblings, versioned_assets)
+    sink.write_text(HTACCESS_NAME, htaccess)
+    return [*siblings, HTACCESS_NAME], {
+        "htaccess_bytes": len(htaccess.encode("utf-8")),
+        "immutable_urls": len(versioned_assets),
+        "precompressed": len(siblings),
+        "encodings": sorted({PurePosixPath(sibling).suffix for sibling in siblings}),
+        "bytes_saved": bytes_saved,
+    }
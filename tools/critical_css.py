@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from html.parser import HTMLParser
+import re
+
+
+# Roughly one initial TCP congestion window (10 segments of ~1460 bytes).
+CRITICAL_CSS_BUDGET = 14 * 1024
+GROUPING_AT_RULES = ("@media", "@supports")
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+PSEUDO_PATTERN = re.compile(r"::?[\w-]+(\((?:[^()]|\([^()]*\))*\))?")
+ATTRIBUTE_PATTERN = re.compile(r"\[[^\]]*\]")
+COMBINATOR_PATTERN = re.compile(r"\s*[\s>+~]\s*")
+SIMPLE_SELECTOR_PATTERN = re.compile(r"([.#]?)(-?[_a-zA-Z][\w-]*)")
+# Quoted strings are kept verbatim; any other run of whitespace collapses to one space.
+STRING_OR_SPACE_PATTERN = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')|\s+")
+
+
+class MarkupUsage(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.tags = {"html"}
+        self.classes = set()
+        self.ids = set()
+
+    def handle_starttag(self, tag, attrs):
+        self.tags.add(tag)
+        for name, value in attrs:
+            if name == "class" and value:
+                self.classes.update(value.split())
+            elif name == "id" and value:
+                self.ids.add(value)
+
+
+def collect_markup_usage(html):
+    usage = MarkupUsage()
+    usage.feed(html)
+    usage.close()
+    return usage
+
+
+def iter_top_level(text):
+    """Yield ``(index, char, depth)`` for characters outside quoted strings, tracking bracket depth."""
+    depth = 0
+    quote = None
+    escaped = False
+    for index, char in enumerate(text):
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+            continue
+        if char in "\"'":
+            quote = char
+            continue
+        if char in "({[":
+            depth += 1
+        yield index, char, depth
+        if char in ")}]":
+            depth -= 1
+
+
+def split_top_level(text, separator):
+    """Split on ``separator`` only where it is outside strings, parentheses and blocks."""
+    parts = []
+    start = 0
+    for index, char, depth in iter_top_level(text):
+        if char == separator and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return parts
+
+
+def find_block_end(css, start):
+    base_depth = None
+    for index, char, depth in iter_top_level(css[start:]):
+        if base_depth is None:
+            base_depth = depth
+        elif char == "}" and depth == base_depth:
+            return start + index
+    raise ValueError("Unbalanced braces in stylesheet")
+
+
+def parse_stylesheet(css):
+    """Parse CSS into ``(prelude, body)`` pairs; grouping at-rules nest a list."""
+    css = COMMENT_PATTERN.sub("", css)
+    rules = []
+    position = 0
+    while True:
+        open_index = css.find("{", position)
+        if open_index == -1:
+            break
+        close_index = find_block_end(css, open_index)
+        prelude = " ".join(css[position:open_index].split())
+        body = css[open_index + 1:close_index]
+        if prelude.startswith(GROUPING_AT_RULES):
+            rules.append((prelude, parse_stylesheet(body)))
+        else:
+            rules.append((prelude, body))
+        position = close_index + 1
+    return rules
+
+
+def selector_matches(selector, usage):
+    stripped = PSEUDO_PATTERN.sub("", ATTRIBUTE_PATTERN.sub("", selector))
+    for compound in COMBINATOR_PATTERN.split(stripped.strip()):
+        for prefix, name in SIMPLE_SELECTOR_PATTERN.findall(compound):
+            if prefix == "." and name not in usage.classes:
+                return False
+            if prefix == "#" and name not in usage.ids:
+                return False
+            if not prefix and name.lower() not in usage.tags:
+                return False
+    return True
+
+
+def collapse_whitespace(value):
+    return STRING_OR_SPACE_PATTERN.sub(lambda match: match.group(1) or " ", value).strip()
+
+
+def minify_declarations(body):
+    declarations = []
+    for declaration in split_top_level(body, ";"):
+        if ":" not in declaration:
+            continue
+        name, value = declaration.split(":", 1)
+        declarations.append(f"{name.strip()}:{collapse_whitespace(value)}")
+    return ";".join(declarations)
+
+
+def select_rules(rules, usage):
+    output = []
+    for prelude, body in rules:
+        if isinstance(body, list):
+            nested = select_rules(body, usage)
+            if nested:
+                output.append(f"{prelude}{{{nested}}}")
+        elif prelude.startswith("@"):
+            # @font-face, @keyframes and the like apply page-wide and may nest blocks; keep them whole.
+            output.append(f"{prelude}{{{body.strip()}}}")
+        else:
+            selectors = [selector.strip() for selector in split_top_level(prelude, ",")]
+            used = [selector for selector in selectors if selector_matches(selector, usage)]
+            if used:
+                output.append(f"{','.join(used)}{{{minify_declarations(body)}}}")
+    return "".join(output)
+
+
+def extract_critical_css(rules, html, cache=None):
+    usage = collect_markup_usage(html)
+    if cache is None:
+        return select_rules(rules, usage)
+    # Pages built from the same template mostly share one usage signature.
+    key = (frozenset(usage.tags), frozenset(usage.classes), frozenset(usage.ids))
+    if key not in cache:
+        cache[key] = select_rules(rules, usage)
+    return cache[key]
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+from urllib.parse import urlsplit
+
+try:
+    from tools.generate_entry_pages import (
+        ENTRIES_PATH,
+        ESV_CACHE_PATH,
+        ROOT,
+        STYLESHEET_PATH,
+        build_entry_href,
+        dump_entry_fragment,
+        load_json,
+        load_stylesheet_rules,
+        render_entry_at,
+        render_fragment_at,
+        render_routes_manifest,
+        validate_entries,
+    )
+except ImportError:  # Run directly from tools/.
+    from generate_entry_pages import (
+        ENTRIES_PATH,
+        ESV_CACHE_PATH,
+        ROOT,
+        STYLESHEET_PATH,
+        build_entry_href,
+        dump_entry_fragment,
+        load_json,
+        load_stylesheet_rules,
+        render_entry_at,
+        render_fragment_at,
+        render_routes_manifest,
+        validate_entries,
+    )
+
+
+DEV_SITE_URL = "http://localhost:8000"
+FRAGMENT_NAME = "fragment.json"
+POLL_INTERVAL_SECONDS = 0.05
+LIVE_RELOAD_PATH = "/__livereload"
+# Served in place of the generated sw.js so a cache-first worker never hides edits.
+DEV_SERVICE_WORKER = b"""self.addEventListener("install", () => self.skipWaiting());
+self.addEventListener("activate", () => self.registration.unregister());
+"""
+LIVE_RELOAD_SCRIPT = f"""<script>
+      (() => {{
+        const source = new EventSource("{LIVE_RELOAD_PATH}");
+        let version = null;
+        source.onmessage = (event) => {{
+          if (version !== null && event.data !== version) {{
+            window.location.reload();
+          }}
+          version = event.data;
+        }};
+      }})();
+    </script>
+  </body>"""
+
+
+class SiteState:
+    """Parsed data and rendered pages kept in memory between edits."""
+
+    def __init__(
+        self,
+        entries_path=ENTRIES_PATH,
+        esv_cache_path=ESV_CACHE_PATH,
+        stylesheet_path=STYLESHEET_PATH,
+        site_url=DEV_SITE_URL,
+    ):
+        self.entries_path = entries_path
+        self.esv_cache_path = esv_cache_path
+        self.stylesheet_path = stylesheet_path
+        self.site_url = site_url
+        self.entries = []
+        self.esv_cache = {}
+        self.stylesheet_rules = None
+        # Critical CSS per distinct set of selectors, valid until the stylesheet changes.
+        self.critical_css_cache = {}
+        self.pages = {}
+        self.fragments = {}
+        self.routes_json = b""
+        self.version = 0
+        self.mtimes = {}
+        # Inputs that failed to parse are retried once they are saved again, not on every poll.
+        self.rejected_mtimes = None
+        self.changed = threading.Condition()
+
+    def watched_paths(self):
+        return (self.entries_path, self.esv_cache_path, self.stylesheet_path)
+
+    def read_mtimes(self):
+        return {path: path.stat().st_mtime_ns for path in self.watched_paths() if path.exists()}
+
+    def read_inputs(self, paths):
+        """Parse the watched files in ``paths``, raising before any state is replaced."""
+        inputs = {}
+        if self.entries_path in paths:
+            entries = load_json(self.entries_path)
+            validate_entries(entries)
+            inputs["entries"] = entries
+        if self.esv_cache_path in paths:
+            inputs["esv_cache"] = load_json(self.esv_cache_path) if self.esv_cache_path.exists() else {}
+        if self.stylesheet_path in paths:
+            inputs["stylesheet_rules"] = load_stylesheet_rules(self.stylesheet_path)
+        return inputs
+
+    def apply_inputs(self, inputs):
+        self.entries = inputs.get("entries", self.entries)
+        self.esv_cache = inputs.get("esv_cache", self.esv_cache)
+        if "stylesheet_rules" in inputs:
+            self.stylesheet_rules = inputs["stylesheet_rules"]
+            self.critical_css_cache = {}
+
+    def load(self):
+        self.mtimes = self.read_mtimes()
+        self.apply_inputs(self.read_inputs(self.watched_paths()))
+        return self.render_all()
+
+    def render_all(self):
+        # Render into a fresh dict and swap it in so requests never see a partial site.
+        pages = {}
+        fragments = {}
+        self.render_indexes(range(len(self.entries)), pages, fragments)
+        self.pages = pages
+        self.fragments = fragments
+        self.routes_json = render_routes_manifest(self.entries).encode("utf-8")
+        return set(pages)
+
+    def render_indexes(self, indexes, pages=None, fragments=None):
+        pages = self.pages if pages is None else pages
+        fragments = self.fragments if fragments is None else fragments
+        rendered = set()
+        for index in sorted(indexes):
+            html, _ = render_entry_at(
+                self.entries,
+                index,
+                self.esv_cache,
+                self.site_url,
+                self.stylesheet_rules,
+                self.critical_css_cache,
+            )
+            href = build_entry_href(self.entries[index])
+            pages[href] = html.replace("  </body>", LIVE_RELOAD_SCRIPT, 1).encode("utf-8")
+            fragment = render_fragment_at(self.entries, index, self.esv_cache, self.site_url)
+            fragments[f"{href}{FRAGMENT_NAME}"] = dump_entry_fragment(fragment).encode("utf-8")
+            rendered.add(href)
+        return rendered
+
+    def refresh(self):
+        """Re-read changed inputs and re-render only the affected pages; returns their hrefs."""
+        mtimes = self.read_mtimes()
+        changed_paths = {path for path in self.watched_paths() if mtimes.get(path) != self.mtimes.get(path)}
+        if not changed_paths or mtimes == self.rejected_mtimes:
+            return set()
+        try:
+            inputs = self.read_inputs(changed_paths)
+        except Exception:
+            self.rejected_mtimes = mtimes
+            raise
+        self.mtimes = mtimes
+        self.rejected_mtimes = None
+
+        if "stylesheet_rules" in inputs:
+            self.apply_inputs(inputs)
+            rendered = self.render_all()
+        else:
+            rendered = self.refresh_records(inputs)
+
+        if rendered:
+            with self.changed:
+                self.version += 1
+                self.changed.notify_all()
+        return rendered
+
+    def refresh_records(self, inputs):
+        old_entries = self.entries
+        old_esv_cache = self.esv_cache
+        self.apply_inputs(inputs)
+
+        def route_keys(entries):
+            return [(entry["mmdd"], build_entry_href(entry)) for entry in entries]
+
+        if route_keys(old_entries) != route_keys(self.entries):
+            return self.render_all()
+
+        affected = set()
+        count = len(self.entries)
+        for index, (old_entry, entry) in enumerate(zip(old_entries, self.entries)):
+            mmdd = entry["mmdd"]
+            if old_entry != entry or old_esv_cache.get(mmdd) != self.esv_cache.get(mmdd):
+                affected.update({(index - 1) % count, index, (index + 1) % count})
+        return self.render_indexes(affected)
+
+    def wait_for_change(self, version, timeout):
+        with self.changed:
+            self.changed.wait_for(lambda: self.version != version, timeout=timeout)
+            return self.version
+
+
+def watch(state, stop_event, interval=POLL_INTERVAL_SECONDS):
+    while not stop_event.wait(interval):
+        started = time.perf_counter()
+        try:
+            rendered = state.refresh()
+        except (OSError, ValueError, KeyError) as error:
+            # Half-saved, unreadable or invalid input; keep serving the last good render.
+            print(f"Skipped rebuild: {error}")
+            continue
+        if rendered:
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"Re-rendered {len(rendered)} pages in {elapsed:.1f} ms")
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, state, **kwargs):
+        self.state = state
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == LIVE_RELOAD_PATH:
+            self.stream_versions()
+            return
+        if path.endswith("/index.html"):
+            path = path[: -len("index.html")]
+        if path in self.state.pages:
+            self.send_bytes(self.state.pages[path], "text/html; charset=utf-8")
+            return
+        if path in self.state.fragments:
+            self.send_bytes(self.state.fragments[path], "application/json")
+            return
+        if path == "/data/routes.json":
+            self.send_bytes(self.state.routes_json, "application/json")
+            return
+        if path == "/sw.js":
+            self.send_bytes(DEV_SERVICE_WORKER, "text/javascript")
+            return
+        super().do_GET()
+
+    def send_bytes(self, body, content_type):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_versions(self):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        version = self.state.version
+        try:
+            while True:
+                self.wfile.write(f"data: {version}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                version = self.state.wait_for_change(version, timeout=15)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def create_server(state, host="127.0.0.1", port=8000, directory=ROOT):
+    handler = partial(DevRequestHandler, state=state, directory=str(directory))
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve(host="127.0.0.1", port=8000, watch_files=False):
+    state = SiteState(site_url=f"http://{host}:{port}")
+    started = time.perf_counter()
+    state.load()
+    print(f"Rendered {len(state.pages)} pages in memory in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    stop_event = threading.Event()
+    if watch_files:
+        threading.Thread(target=watch, args=(state, stop_event), daemon=True).start()
+
+    server = create_server(state, host, port)
+    print(f"Serving on http://{host}:{port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_event.set()
+        server.server_close()
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import json
+import mmap
+from pathlib import Path
+import struct
+
+try:
+    from tools.output_sink import as_sink
+except ImportError:  # Run directly as `python3 tools/generate_entry_pages.py`.
+    from output_sink import as_sink
+
+
+COLUMNAR_PATH = Path("data") / "entries.ldc"
+NDJSON_PATH = Path("data") / "entries.ndjson"
+
+# Columnar layout (all integers little-endian):
+#   header      magic, row count, column count, string count
+#   directory   per column: name length (u16), column type (u8), UTF-8 name
+#   offsets     per string: u32 offset into the blob region
+#   columns     per column: one u32 string id (or i32 value) per row
+#   blobs       per string: u32 byte length, UTF-8 bytes
+# Rows are sorted by mmdd so a reader can binary-search the mmdd column.
+MAGIC = b"LDCOL\x00\x02\x00"
+HEADER = struct.Struct("<8sIII")
+COLUMN_ENTRY = struct.Struct("<HB")
+U32 = struct.Struct("<I")
+COLUMN_STRING = 0
+COLUMN_INT = 1
+# Values that are neither all strings nor all i32 integers (booleans, floats, nulls, lists, dicts,
+# or a mix) are stored as interned JSON text and decoded by the reader.
+COLUMN_JSON = 2
+NULL_STRING_ID = 0xFFFFFFFF
+INT32_RANGE = range(-(1 << 31), 1 << 31)
+MISSING = object()
+
+
+def is_int32(value):
+    return isinstance(value, int) and not isinstance(value, bool) and value in INT32_RANGE
+
+
+def column_type_for(values):
+    if all(is_int32(value) for value in values):
+        return COLUMN_INT
+    if all(value is MISSING or isinstance(value, str) for value in values):
+        return COLUMN_STRING
+    return COLUMN_JSON
+
+
+def collect_columns(entries):
+    names = []
+    for entry in entries:
+        for name in entry:
+            if name not in names:
+                names.append(name)
+
+    columns = []
+    for name in names:
+        values = [entry.get(name, MISSING) for entry in entries]
+        columns.append((name, column_type_for(values), values))
+    return columns
+
+
+def build_columnar_bytes(entries):
+    if not all(isinstance(entry.get("mmdd"), str) for entry in entries):
+        raise ValueError("Every entry needs an mmdd string for the columnar export")
+    entries = sorted(entries, key=lambda entry: entry["mmdd"])
+    columns = collect_columns(entries)
+    string_ids = {}
+    strings = []
+
+    def intern(value, column_type):
+        if value is MISSING:
+            return NULL_STRING_ID
+        text = json.dumps(value, ensure_ascii=False, separators=(",", ":")) if column_type == COLUMN_JSON else value
+        if text not in string_ids:
+            string_ids[text] = len(strings)
+            strings.append(text)
+        return string_ids[text]
+
+    directory = bytearray()
+    column_data = bytearray()
+    for name, column_type, values in columns:
+        encoded_name = name.encode("utf-8")
+        directory += COLUMN_ENTRY.pack(len(encoded_name), column_type) + encoded_name
+        if column_type == COLUMN_INT:
+            column_data += struct.pack(f"<{len(values)}i", *values)
+        else:
+            column_data += struct.pack(f"<{len(values)}I", *(intern(value, column_type) for value in values))
+
+    offsets = bytearray()
+    blobs = bytearray()
+    for text in strings:
+        encoded = text.encode("utf-8")
+        offsets += U32.pack(len(blobs))
+        blobs += U32.pack(len(encoded)) + encoded
+
+    header = HEADER.pack(MAGIC, len(entries), len(columns), len(strings))
+    return bytes(header + directory + offsets + column_data + blobs)
+
+
+def dump_ndjson_line(entry):
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def build_ndjson(entries):
+    return "".join(dump_ndjson_line(entry) for entry in entries)
+
+
+def build_dataset_exports(entries):
+    return {
+        COLUMNAR_PATH: build_columnar_bytes(entries),
+        NDJSON_PATH: build_ndjson(entries).encode("utf-8"),
+    }
+
+
+def write_dataset_exports(entries, output_root, exports=None):
+    if exports is None:
+        exports = build_dataset_exports(entries)
+    sink = as_sink(output_root)
+    for relative_path, payload in exports.items():
+        sink.write_bytes(relative_path.as_posix(), payload)
+    return {"columnar_bytes": len(exports[COLUMNAR_PATH]), "ndjson_bytes": len(exports[NDJSON_PATH])}
+
+
+def iter_ndjson(path):
+    with Path(path).open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_json_array(path, chunk_size=1 << 16):
+    """Yield the items of a top-level JSON array without loading the whole document."""
+    decoder = json.JSONDecoder()
+    with Path(path).open(encoding="utf-8") as handle:
+        buffer = ""
+        position = 0
+        started = False
+        exhausted = False
+        while True:
+            while position < len(buffer) and (buffer[position].isspace() or (started and buffer[position] == ",")):
+                position += 1
+            if position < len(buffer):
+                if not started:
+                    if buffer[position] != "[":
+                        raise ValueError(f"Expected a JSON array in {path}")
+                    started = True
+                    position += 1
+                    continue
+                if buffer[position] == "]":
+                    return
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if exhausted:
+                        raise
+                else:
+                    # A number at the buffer edge may be cut short; wait for more input.
+                    if end < len(buffer) or exhausted:
+                        yield item
+                        position = end
+                        continue
+            if exhausted:
+                raise ValueError(f"Unterminated JSON array in {path}")
+            chunk = handle.read(chunk_size)
+            exhausted = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+
+
+class ColumnarReader:
+    """Random access to single entries in an ``entries.ldc`` export via mmap."""
+
+    def __init__(self, path):
+        self._handle = Path(path).open("rb")
+        self._buffer = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.row_count, column_count, string_count = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a columnar dataset export: {path}")
+
+        position = HEADER.size
+        self.columns = []
+        for _ in range(column_count):
+            name_length, column_type = COLUMN_ENTRY.unpack_from(self._buffer, position)
+            position += COLUMN_ENTRY.size
+            name = bytes(self._buffer[position:position + name_length]).decode("utf-8")
+            position += name_length
+            self.columns.append((name, column_type))
+
+        self._offsets_start = position
+        self._columns_start = position + string_count * U32.size
+        self._blobs_start = self._columns_start + column_count * self.row_count * U32.size
+        self._mmdd_column = [name for name, _ in self.columns].index("mmdd") if self.row_count else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.row_count
+
+    def close(self):
+        if not self._buffer.closed:
+            self._buffer.close()
+        self._handle.close()
+
+    def _read_string(self, string_id):
+        (offset,) = U32.unpack_from(self._buffer, self._offsets_start + string_id * U32.size)
+        position = self._blobs_start + offset
+        (length,) = U32.unpack_from(self._buffer, position)
+        return bytes(self._buffer[position + U32.size:position + U32.size + length]).decode("utf-8")
+
+    def _read_cell(self, column_index, row):
+        """Return the cell's value, or ``MISSING`` when the entry has no such field."""
+        position = self._columns_start + (column_index * self.row_count + row) * U32.size
+        column_type = self.columns[column_index][1]
+        if column_type == COLUMN_INT:
+            return struct.unpack_from("<i", self._buffer, position)[0]
+        (string_id,) = U32.unpack_from(self._buffer, position)
+        if string_id == NULL_STRING_ID:
+            return MISSING
+        text = self._read_string(string_id)
+        return json.loads(text) if column_type == COLUMN_JSON else text
+
+    def row(self, row):
+        if not 0 <= row < self.row_count:
+            raise IndexError(row)
+        entry = {}
+        for column_index, (name, _) in enumerate(self.columns):
+            value = self._read_cell(column_index, row)
+            if value is not MISSING:
+                entry[name] = value
+        return entry
+
+    def get(self, mmdd):
+        # Rows are stored sorted by mmdd, so look the row up in place instead of indexing the column.
+        low, high = 0, self.row_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._read_cell(self._mmdd_column, middle) < mmdd:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.row_count and self._read_cell(self._mmdd_column, low) == mmdd:
+            return self.row(low)
+        return None
@@ -1,7 +1,9 @@
 import argparse
 import json
 import os
+import sys
 import time
+import urllib.error
 import urllib.request
 import urllib.parse
 from pathlib import Path
@@ -11,6 +13,78 @@ API_URL = "https://api.esv.org/v3/passage/text/"
 DATA_DIR = Path(__file__).parent.parent / "data"
 ENTRIES_FILE = DATA_DIR / "entries.json"
 CACHE_FILE = DATA_DIR / "esv_cache.json"
+REPORT_FILE = Path(__file__).parent.parent / "fetch-esv-report.json"
+REQUEST_DELAY = 1.0  # 60 req/min max
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_BACKOFF = 2.0
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+class FetchMetrics:
+    """Latency, status, byte and wait-time counters for one fetch run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.latencies_ms = []
+        self.status_counts = {}
+        self.bytes_received = 0
+        self.retries = 0
+        self.throttle_seconds = 0.0
+        self.backoff_seconds = 0.0
+        self.fetched = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def record_request(self, status, seconds, size):
+        self.latencies_ms.append(seconds * 1000)
+        key = str(status)
+        self.status_counts[key] = self.status_counts.get(key, 0) + 1
+        self.bytes_received += size
+
+    def sleep(self, seconds, reason):
+        time.sleep(seconds)
+        if reason == "backoff":
+            self.backoff_seconds += seconds
+        else:
+            self.throttle_seconds += seconds
+
+    def percentile(self, fraction):
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def histogram(self):
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        counts = dict.fromkeys(labels, 0)
+        for latency in self.latencies_ms:
+            index = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if latency <= bound), len(LATENCY_BUCKETS_MS))
+            counts[labels[index]] += 1
+        return counts
+
+    def summary(self):
+        wall_seconds = time.perf_counter() - self.started
+        requests = len(self.latencies_ms)
+        errors = sum(count for status, count in self.status_counts.items() if status != "200")
+        return {
+            "wall_seconds": round(wall_seconds, 3),
+            "entries": {"fetched": self.fetched, "skipped": self.skipped, "failed": self.failed},
+            "requests": requests,
+            "retries": self.retries,
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "status_counts": self.status_counts,
+            "bytes_received": self.bytes_received,
+            "latency_ms": {
+                "mean": round(sum(self.latencies_ms) / requests, 1) if requests else 0.0,
+                "p50": round(self.percentile(0.5), 1),
+                "p90": round(self.percentile(0.9), 1),
+                "p99": round(self.percentile(0.99), 1),
+                "max": round(max(self.latencies_ms, default=0.0), 1),
+                "histogram": self.histogram(),
+            },
+            "throttle_wait_seconds": round(self.throttle_seconds, 3),
+            "backoff_wait_seconds": round(self.backoff_seconds, 3),
+            "request_seconds": round(sum(self.latencies_ms) / 1000, 3),
+        }
 
 def load_env():
     """Simple .env loader to avoid dependencies."""
@@ -33,7 +107,7 @@ def save_json(path, data):
         # Sort keys to keep file diffs clean
         json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
 
-def fetch_esv(reference, api_key):
+def fetch_esv(reference, api_key, metrics=None, retries=0):
     params = {
         "q": reference,
         "include-headings": "false",
@@ -52,14 +126,45 @@ def fetch_esv(reference, api_key):
     
     req = urllib.request.Request(url)
     req.add_header("Authorization", f"Token {api_key}")
-    
-    try:
-        with urllib.request.urlopen(req) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            return "".join(data.get("passages", [])).strip()
-    except Exception as e:
-        print(f"Error fetching {reference}: {e}")
-        return None
+    metrics = metrics or FetchMetrics()
+
+    for attempt in range(retries + 1):
+        started = time.perf_counter()
+        retry_after = None
+        try:
+            with urllib.request.urlopen(req) as response:
+                body = response.read()
+                metrics.record_request(response.status, time.perf_counter() - started, len(body))
+                data = json.loads(body.decode("utf-8"))
+                return "".join(data.get("passages", [])).strip()
+        except urllib.error.HTTPError as e:
+            body = e.read() if e.fp else b""
+            metrics.record_request(e.code, time.perf_counter() - started, len(body))
+            retryable = e.code in RETRY_STATUSES
+            retry_after = e.headers.get("Retry-After") if e.headers else None
+            error = e
+        except (urllib.error.URLError, TimeoutError) as e:
+            metrics.record_request("network_error", time.perf_counter() - started, 0)
+            retryable = True
+            error = e
+        except Exception as e:
+            print(f"Error fetching {reference}: {e}")
+            return None
+
+        if not retryable or attempt == retries:
+            print(f"Error fetching {reference}: {error}")
+            return None
+        metrics.retries += 1
+        delay = float(retry_after) if retry_after and retry_after.isdigit() else RETRY_BACKOFF * 2 ** attempt
+        print(f"Retrying {reference} in {delay:.1f}s after: {error}")
+        metrics.sleep(delay, "backoff")
+    return None
+
+def write_report(path, metrics, args):
+    report = metrics.summary()
+    report["settings"] = {"request_delay": REQUEST_DELAY, "retries": args.retries, "force": args.force}
+    save_json(path, report)
+    return report
 
 def main():
     parser = argparse.ArgumentParser(description="Fetch ESV verses for the devotional.")
@@ -67,6 +172,9 @@ def main():
     parser.add_argument("--month", type=int, help="Fetch an entire month (1-12)")
     parser.add_argument("--all", action="store_true", help="Fetch ALL entries (entire year)")
     parser.add_argument("--force", action="store_true", help="Re-fetch even if already cached")
+    parser.add_argument("--retries", type=int, default=2, help="Retries for 429/5xx and network errors (default: 2)")
+    parser.add_argument("--report", type=Path, default=REPORT_FILE, help=f"JSON run report path (default: {REPORT_FILE.name})")
+    parser.add_argument("--progress", action="store_true", help="Stream one JSON progress line per request to stderr")
     args = parser.parse_args()
 
     # If no arguments provided, print help and exit
@@ -105,7 +213,7 @@ def main():
             return
         targets = entries
 
-    updated_count = 0
+    metrics = FetchMetrics()
     print(f"Targeting {len(targets)} entries...")
     
     for i, entry in enumerate(targets):
@@ -116,25 +224,49 @@ def main():
             # Skip silent if filtered, or maybe verbose? Let's just skip.
             if len(targets) == 1:
                 print(f"{mmdd} already in cache. Use --force to update.")
+            metrics.skipped += 1
             continue
             
         print(f"[{i+1}/{len(targets)}] Fetching {mmdd}: {verse_ref}")
-        esv_text = fetch_esv(verse_ref, api_key)
+        esv_text = fetch_esv(verse_ref, api_key, metrics, args.retries)
         
         if esv_text:
             cache[mmdd] = {
                 "ref": verse_ref,
                 "text": esv_text
             }
-            updated_count += 1
+            metrics.fetched += 1
             save_json(CACHE_FILE, cache)
-            
-            # Rate limiting: 1 second delay to be safe (60 req/min max)
-            time.sleep(1.0)
         else:
+            metrics.failed += 1
             print(f"Failed to fetch text for {verse_ref}")
 
-    print(f"Done. Added/Updated {updated_count} entries.")
+        if args.progress:
+            progress = {
+                "done": i + 1,
+                "total": len(targets),
+                "mmdd": mmdd,
+                "ok": bool(esv_text),
+                "latency_ms": round(metrics.latencies_ms[-1], 1) if metrics.latencies_ms else None,
+                "p50_ms": round(metrics.percentile(0.5), 1),
+                "retries": metrics.retries,
+                "throttle_wait_seconds": round(metrics.throttle_seconds, 3),
+            }
+            print(json.dumps(progress), file=sys.stderr, flush=True)
+
+        # Rate limiting between requests, including failed ones
+        if i + 1 < len(targets):
+            metrics.sleep(REQUEST_DELAY, "throttle")
+
+    report = write_report(args.report, metrics, args)
+    latency = report["latency_ms"]
+    print(f"Done. Added/Updated {metrics.fetched} entries.")
+    print(
+        f"{report['requests']} requests ({report['retries']} retries, error rate {report['error_rate']:.1%}), "
+        f"latency p50 {latency['p50']} ms / p90 {latency['p90']} ms, {report['bytes_received']} bytes; "
+        f"waited {report['throttle_wait_seconds']} s throttled, {report['backoff_wait_seconds']} s backing off. "
+        f"Report: {args.report}"
+    )
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,49 @@
 from __future__ import annotations
 
+import argparse
 from html import escape
 import json
+import os
 from pathlib import Path
-from xml.etree import ElementTree as ET
+import time
+from xml.sax.saxutils import escape as xml_escape
+
+try:
+    from tools.cache_policy import collect_versioned_assets, write_cache_policy
+    from tools.critical_css import CRITICAL_CSS_BUDGET, extract_critical_css, parse_stylesheet
+    from tools.export_dataset import (
+        COLUMNAR_PATH,
+        NDJSON_PATH,
+        build_dataset_exports,
+        dump_ndjson_line,
+        iter_json_array,
+        iter_ndjson,
+        write_dataset_exports,
+    )
+    from tools.minify_html import minify_html
+    from tools.output_sink import ArchiveSink, FileSink, as_sink
+    from tools.publish_manifest import write_publish_manifest
+    from tools.search_index import SEARCH_DIR, build_doc, build_postings, index_entry, write_search_files
+    from tools.service_worker import PRECACHE_MANIFEST_NAME, SERVICE_WORKER_NAME, write_service_worker
+    from tools.validate_site import validate_site
+except ImportError:  # Run directly as `python3 tools/generate_entry_pages.py`.
+    from cache_policy import collect_versioned_assets, write_cache_policy
+    from critical_css import CRITICAL_CSS_BUDGET, extract_critical_css, parse_stylesheet
+    from export_dataset import (
+        COLUMNAR_PATH,
+        NDJSON_PATH,
+        build_dataset_exports,
+        dump_ndjson_line,
+        iter_json_array,
+        iter_ndjson,
+        write_dataset_exports,
+    )
+    from minify_html import minify_html
+    from output_sink import ArchiveSink, FileSink, as_sink
+    from publish_manifest import write_publish_manifest
+    from search_index import SEARCH_DIR, build_doc, build_postings, index_entry, write_search_files
+    from service_worker import PRECACHE_MANIFEST_NAME, SERVICE_WORKER_NAME, write_service_worker
+    from validate_site import validate_site
 
 
 MONTH_NAMES = {
@@ -27,7 +67,42 @@ ESV_CACHE_PATH = ROOT / "data" / "esv_cache.json"
 OUTPUT_ROOT = ROOT
 SITE_URL = "https://lincolndevotional.com"
 ROUTES_PATH = ROOT / "data" / "routes.json"
+STYLESHEET_PATH = ROOT / "style.css"
+SITE_STYLESHEET_HREF = "../../style.css?v=20261019a"
+FONTS_STYLESHEET_HREF = (
+    "https://fonts.googleapis.com/css2?family=Crimson+Pro:wght@400;500;600"
+    "&family=Newsreader:wght@400;500;600&display=swap"
+)
 REQUIRED_FIELDS = ("mmdd", "month", "day", "display_date", "title", "bible_verse", "verse_ref", "poem")
+STATIC_PAGES = {
+    "/": "index.html",
+    "/about.html": "about.html",
+    "/copyright.html": "copyright.html",
+}
+STATIC_ASSETS = (
+    "style.css",
+    "script.js",
+    "theme.js",
+    "permalink.js",
+    "static-entry-nav.js",
+    "analytics.js",
+    "search.js",
+    "data/routes.json",
+    "data/entries.json",
+    "data/esv_cache.json",
+)
+TRANSLATIONS = ("KJV", "ESV")
+# Resource hints for the neighbouring entries: "prefetch" warms their fragments for the in-place
+# swap, "speculation" asks Speculation Rules browsers to prefetch the full neighbour pages instead.
+# Speculation Rules only prefetch documents, so static-entry-nav.js navigates normally in that mode.
+PREFETCH_MODES = ("none", "prefetch", "speculation")
+DEFAULT_PREFETCH_MODE = "prefetch"
+SPECULATION_RULES = json.dumps(
+    {"prefetch": [{"where": {"selector_matches": ".entry-nav > a"}, "eagerness": "immediate"}]},
+    separators=(",", ":"),
+)
+# Pages shared by several editions are rendered once against this URL, then retargeted.
+EDITION_SITE_URL_PLACEHOLDER = "https://edition-site-url.invalid"
 
 
 def load_json(path: Path):
@@ -54,7 +129,7 @@ def build_description(entry):
 
 
 def build_static_asset_version():
-    return "20260519a"
+    return "20261019d"
 
 
 def render_static_date_picker(entry):
@@ -70,21 +145,65 @@ def render_static_date_picker(entry):
             </div>"""
 
 
+def render_prefetch_hints(previous_entry, next_entry, prefetch=DEFAULT_PREFETCH_MODE):
+    """Return the hint tags, each on its own ``<head>`` line; empty when there are none."""
+    if prefetch not in PREFETCH_MODES:
+        raise ValueError(f"Unknown prefetch mode {prefetch!r}, expected one of {', '.join(PREFETCH_MODES)}")
+    if prefetch == "none":
+        return ""
+    if prefetch == "speculation":
+        hints = [f'<script type="speculationrules">{SPECULATION_RULES}</script>']
+    else:
+        # Next first: moving forward a day is the most common navigation.
+        hints = [
+            f'<link rel="prefetch" href="{build_entry_href(neighbour)}fragment.json" data-neighbour="{label}" />'
+            for label, neighbour in (("next", next_entry), ("prev", previous_entry))
+        ]
+    return "".join(f"\n    {hint}" for hint in hints)
+
+
+def render_stylesheet_links():
+    return f"""<link
+      href="{FONTS_STYLESHEET_HREF}"
+      rel="stylesheet"
+    />
+    <link rel="stylesheet" href="{SITE_STYLESHEET_HREF}" />"""
+
+
+def render_deferred_stylesheet_links(critical_css):
+    deferred_links = []
+    for href in (FONTS_STYLESHEET_HREF, SITE_STYLESHEET_HREF):
+        deferred_links.append(
+            f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'" />\n'
+            f'    <noscript><link rel="stylesheet" href="{href}" /></noscript>'
+        )
+    return f"<style>{critical_css}</style>\n    " + "\n    ".join(deferred_links)
+
+
+def inline_critical_css(html, stylesheet_rules, critical_css_cache=None):
+    critical_css = extract_critical_css(stylesheet_rules, html, critical_css_cache)
+    return html.replace(render_stylesheet_links(), render_deferred_stylesheet_links(critical_css), 1), critical_css
+
+
 def normalize_poem_lines(poem_text):
     return [line.replace("\r", "") for line in poem_text.splitlines()]
 
 
+def validate_entry(entry, seen_slugs):
+    missing = [field for field in REQUIRED_FIELDS if not entry.get(field)]
+    if missing:
+        raise ValueError(f"Entry {entry.get('mmdd', '<unknown>')} missing required fields: {', '.join(missing)}")
+
+    slug = slugify_entry(entry)
+    if slug in seen_slugs:
+        raise ValueError(f"Duplicate slug generated: {slug}")
+    seen_slugs.add(slug)
+
+
 def validate_entries(entries):
     seen_slugs = set()
     for entry in entries:
-        missing = [field for field in REQUIRED_FIELDS if not entry.get(field)]
-        if missing:
-            raise ValueError(f"Entry {entry.get('mmdd', '<unknown>')} missing required fields: {', '.join(missing)}")
-
-        slug = slugify_entry(entry)
-        if slug in seen_slugs:
-            raise ValueError(f"Duplicate slug generated: {slug}")
-        seen_slugs.add(slug)
+        validate_entry(entry, seen_slugs)
 
 
 def render_poem_html(poem_text):
@@ -105,11 +224,69 @@ def render_esv_block(esv_text):
               </div>"""
 
 
-def render_entry_page(entry, previous_entry, next_entry, esv_text, site_url):
+def render_entry_article(entry, esv_text):
+    esv_block = render_esv_block(esv_text)
+    poem_html = render_poem_html(entry["poem"])
+    return f"""<article class="entry-card" aria-live="polite">
+          <header class="entry-header">
+            <p class="entry-date">{escape(entry['display_date'])}</p>
+            <h2 class="entry-title">{escape(entry['title'])}</h2>
+          </header>
+          <section class="entry-section entry-section--scripture">
+            <h3 class="entry-section-title">Scripture</h3>
+            <div class="verse-columns">
+              <div class="verse-block">
+                <span class="version-label">KJV</span>
+                <p class="entry-text">{escape(entry['bible_verse'])}</p>
+              </div>
+              {esv_block}
+            </div>
+            <p class="entry-verse-ref">{escape(entry['verse_ref'])}</p>
+          </section>
+          <section class="entry-section entry-poem">
+            <h3 class="entry-section-title">Poem</h3>
+            <div class="entry-text">{poem_html}</div>
+          </section>
+        </article>"""
+
+
+def build_entry_metadata(entry, site_url):
     href = build_entry_href(entry)
-    canonical_url = f"{site_url}{href}"
-    title = f"{entry['display_date']} - {entry['title']}"
-    description = build_description(entry)
+    return {
+        "href": href,
+        "canonical": f"{site_url}{href}",
+        "title": f"{entry['display_date']} - {entry['title']}",
+        "description": build_description(entry),
+        "link_title": f"The Believer's Daily Treasure — {entry['display_date']}: {entry['title']}",
+    }
+
+
+def render_entry_fragment(entry, previous_entry, next_entry, esv_text, site_url):
+    """Data static-entry-nav.js needs to swap this entry into an already loaded entry page."""
+    return {
+        **build_entry_metadata(entry, site_url),
+        "mmdd": entry["mmdd"],
+        "display_date": entry["display_date"],
+        "prev": build_entry_href(previous_entry),
+        "next": build_entry_href(next_entry),
+        "article": render_entry_article(entry, esv_text),
+    }
+
+
+def dump_entry_fragment(fragment):
+    return json.dumps(fragment, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def build_fragment_path(slug):
+    return f"entries/{slug}/fragment.json"
+
+
+def render_entry_page(entry, previous_entry, next_entry, esv_text, site_url, prefetch=DEFAULT_PREFETCH_MODE):
+    metadata = build_entry_metadata(entry, site_url)
+    href = metadata["href"]
+    canonical_url = metadata["canonical"]
+    title = metadata["title"]
+    description = metadata["description"]
     prev_link = f'<a href="../{slugify_entry(previous_entry)}/">&larr; Previous</a>'
     next_link = f'<a href="../{slugify_entry(next_entry)}/">Next &rarr;</a>'
     date_picker = render_static_date_picker(entry)
@@ -122,10 +299,10 @@ def render_entry_page(entry, previous_entry, next_entry, esv_text, site_url):
 
     prev_head_link = f'<link rel="prev" href="{build_entry_href(previous_entry)}" />' if previous_entry else ""
     next_head_link = f'<link rel="next" href="{build_entry_href(next_entry)}" />' if next_entry else ""
+    prefetch_hints = render_prefetch_hints(previous_entry, next_entry, prefetch)
 
-    esv_block = render_esv_block(esv_text)
-    poem_html = render_poem_html(entry["poem"])
-    link_title = f"The Believer's Daily Treasure — {entry['display_date']}: {entry['title']}"
+    article = render_entry_article(entry, esv_text)
+    link_title = metadata["link_title"]
     return f"""<!doctype html>
 <html lang="en">
   <head>
@@ -138,14 +315,10 @@ def render_entry_page(entry, previous_entry, next_entry, esv_text, site_url):
     <meta property="og:description" content="{escape(description)}" />
     <meta property="og:url" content="{canonical_url}" />
     {prev_head_link}
-    {next_head_link}
+    {next_head_link}{prefetch_hints}
     <link rel="preconnect" href="https://fonts.googleapis.com" />
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin />
-    <link
-      href="https://fonts.googleapis.com/css2?family=Crimson+Pro:wght@400;500;600&family=Newsreader:wght@400;500;600&display=swap"
-      rel="stylesheet"
-    />
-    <link rel="stylesheet" href="../../style.css?v=20260519b" />
+    {render_stylesheet_links()}
     <script src="../../analytics.js?v=20260509e"></script>
   </head>
   <body>
@@ -167,27 +340,7 @@ def render_entry_page(entry, previous_entry, next_entry, esv_text, site_url):
 
       <main class="main-content">
         {navigation}
-        <article class="entry-card" aria-live="polite">
-          <header class="entry-header">
-            <p class="entry-date">{escape(entry['display_date'])}</p>
-            <h2 class="entry-title">{escape(entry['title'])}</h2>
-          </header>
-          <section class="entry-section entry-section--scripture">
-            <h3 class="entry-section-title">Scripture</h3>
-            <div class="verse-columns">
-              <div class="verse-block">
-                <span class="version-label">KJV</span>
-                <p class="entry-text">{escape(entry['bible_verse'])}</p>
-              </div>
-              {esv_block}
-            </div>
-            <p class="entry-verse-ref">{escape(entry['verse_ref'])}</p>
-          </section>
-          <section class="entry-section entry-poem">
-            <h3 class="entry-section-title">Poem</h3>
-            <div class="entry-text">{poem_html}</div>
-          </section>
-        </article>
+        {article}
       </main>
 
       <aside class="entry-permalink" id="devotionLinkArea" aria-label="Share this devotion">
@@ -212,63 +365,645 @@ def render_entry_page(entry, previous_entry, next_entry, esv_text, site_url):
 """
 
 
-def write_sitemap(entries, output_root, site_url):
-    root = ET.Element("urlset", attrib={"xmlns": "http://www.sitemaps.org/schemas/sitemap/0.9"})
-    static_paths = ["/", "/about.html", "/copyright.html"]
+SITEMAP_OPEN = '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+SITEMAP_CLOSE = "</urlset>"
 
-    for path in static_paths:
-        url = ET.SubElement(root, "url")
-        loc = ET.SubElement(url, "loc")
-        loc.text = f"{site_url}{path}"
 
-    for entry in entries:
-        url = ET.SubElement(root, "url")
-        loc = ET.SubElement(url, "loc")
-        loc.text = f"{site_url}{build_entry_href(entry)}"
-    sitemap_path = output_root / "sitemap.xml"
-    sitemap_path.write_text(ET.tostring(root, encoding="unicode"), encoding="utf-8")
+def render_sitemap_url(loc):
+    return f"<url><loc>{xml_escape(loc)}</loc></url>"
+
+
+def render_sitemap_head(site_url):
+    return SITEMAP_OPEN + "".join(render_sitemap_url(f"{site_url}{path}") for path in STATIC_PAGES)
+
+
+def write_sitemap(entries, output_root, site_url):
+    entry_urls = "".join(render_sitemap_url(f"{site_url}{build_entry_href(entry)}") for entry in entries)
+    as_sink(output_root).write_text("sitemap.xml", render_sitemap_head(site_url) + entry_urls + SITEMAP_CLOSE)
 
 
 def write_robots_txt(output_root, site_url):
-    robots_path = output_root / "robots.txt"
-    robots_path.write_text(f"User-agent: *\nAllow: /\nSitemap: {site_url}/sitemap.xml\n", encoding="utf-8")
+    as_sink(output_root).write_text("robots.txt", f"User-agent: *\nAllow: /\nSitemap: {site_url}/sitemap.xml\n")
 
 
-def write_routes_manifest(entries, output_root):
+def render_routes_manifest(entries):
     routes = {
         entry["mmdd"]: build_entry_href(entry)
         for entry in entries
     }
-    (output_root / "data").mkdir(parents=True, exist_ok=True)
-    routes_path = output_root / "data" / "routes.json"
-    routes_path.write_text(json.dumps(routes, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return json.dumps(routes, indent=2, ensure_ascii=False) + "\n"
+
 
+def render_route_line(entry, is_first):
+    # Matches the json.dumps(indent=2) layout of render_routes_manifest, one route at a time.
+    separator = "\n" if is_first else ",\n"
+    return f"{separator}  {json.dumps(entry['mmdd'])}: {json.dumps(build_entry_href(entry), ensure_ascii=False)}"
 
-def generate_site(entries, esv_cache, output_root, site_url):
+
+def write_routes_manifest(entries, output_root):
+    as_sink(output_root).write_text("data/routes.json", render_routes_manifest(entries))
+
+
+def find_neighbours(entries, index):
+    previous_entry = entries[index - 1] if index > 0 else entries[-1]
+    next_entry = entries[index + 1] if index + 1 < len(entries) else entries[0]
+    return previous_entry, next_entry
+
+
+def iter_entry_windows(entries):
+    """Yield ``(previous, entry, next)`` with wrap-around while holding only a few entries.
+
+    The first entry's page needs the last entry, so it is yielded at the end.
+    """
+    iterator = iter(entries)
+    first = next(iterator, None)
+    if first is None:
+        return
+    second = next(iterator, None)
+    if second is None:
+        yield first, first, first
+        return
+
+    previous_entry, entry = first, second
+    for next_entry in iterator:
+        yield previous_entry, entry, next_entry
+        previous_entry, entry = entry, next_entry
+    yield previous_entry, entry, first
+    yield entry, first, second
+
+
+def lookup_esv_text(esv_cache, entry):
+    return esv_cache.get(entry["mmdd"], {}).get("text", "")
+
+
+def render_entry_window(
+    previous_entry,
+    entry,
+    next_entry,
+    esv_cache,
+    site_url,
+    stylesheet_rules=None,
+    critical_css_cache=None,
+    prefetch=DEFAULT_PREFETCH_MODE,
+):
+    esv_text = lookup_esv_text(esv_cache, entry)
+    html = render_entry_page(entry, previous_entry, next_entry, esv_text, site_url, prefetch)
+    if stylesheet_rules is None:
+        return html, None
+    return inline_critical_css(html, stylesheet_rules, critical_css_cache)
+
+
+def render_entry_at(
+    entries,
+    index,
+    esv_cache,
+    site_url,
+    stylesheet_rules=None,
+    critical_css_cache=None,
+    prefetch=DEFAULT_PREFETCH_MODE,
+):
+    previous_entry, next_entry = find_neighbours(entries, index)
+    return render_entry_window(
+        previous_entry, entries[index], next_entry, esv_cache, site_url, stylesheet_rules, critical_css_cache, prefetch
+    )
+
+
+def render_fragment_at(entries, index, esv_cache, site_url):
+    previous_entry, next_entry = find_neighbours(entries, index)
+    entry = entries[index]
+    return render_entry_fragment(entry, previous_entry, next_entry, lookup_esv_text(esv_cache, entry), site_url)
+
+
+def write_entry_page(sink, slug, html, fragment, minify, minify_bytes):
+    if minify:
+        minify_bytes["bytes_before"] += len(html.encode("utf-8"))
+        html = minify_html(html)
+        minify_bytes["bytes_after"] += len(html.encode("utf-8"))
+        fragment = {**fragment, "article": minify_html(fragment["article"])}
+    sink.write_text(f"entries/{slug}/index.html", html)
+    sink.write_text(build_fragment_path(slug), dump_entry_fragment(fragment))
+
+
+def load_stylesheet_rules(stylesheet_path=STYLESHEET_PATH):
+    return parse_stylesheet(stylesheet_path.read_text(encoding="utf-8"))
+
+
+def build_output_paths(slugs, output_root):
+    precache_paths = [(url_path, file_path) for url_path, file_path in STATIC_PAGES.items()]
+    precache_paths.extend((f"/{asset}", asset) for asset in STATIC_ASSETS)
+    entry_paths = [(f"/entries/{slug}/", f"entries/{slug}/index.html") for slug in slugs]
+    # Fragments are cached as their entries' neighbours are visited, like the search shards on use.
+    lazy_paths = [(f"/{build_fragment_path(slug)}", build_fragment_path(slug)) for slug in slugs]
+    lazy_paths.extend(
+        (f"/{file_path}", file_path)
+        for file_path in as_sink(output_root).list_files(SEARCH_DIR.as_posix())
+        if file_path.endswith(".json")
+    )
+    return precache_paths, entry_paths, lazy_paths
+
+
+def collect_publish_paths(slugs, output_root):
+    output_paths = build_output_paths(slugs, output_root)
+    publish_paths = [file_path for paths in output_paths for _, file_path in paths]
+    publish_paths.extend(
+        [
+            "sitemap.xml",
+            "robots.txt",
+            PRECACHE_MANIFEST_NAME,
+            SERVICE_WORKER_NAME,
+            COLUMNAR_PATH.as_posix(),
+            NDJSON_PATH.as_posix(),
+        ]
+    )
+    return publish_paths
+
+
+def summarize_critical_css(critical_css_bytes):
+    sizes = sorted(critical_css_bytes.values())
+    return {
+        "per_page": critical_css_bytes,
+        "bytes_min": sizes[0],
+        "bytes_max": sizes[-1],
+        "bytes_total": sum(sizes),
+        "over_budget": sorted(slug for slug, size in critical_css_bytes.items() if size > CRITICAL_CSS_BUDGET),
+    }
+
+
+def add_page_reports(report, critical_css_bytes, minify, minify_bytes):
+    if critical_css_bytes:
+        report["critical_css"] = summarize_critical_css(critical_css_bytes)
+    if minify:
+        minify_bytes["bytes_saved"] = minify_bytes["bytes_before"] - minify_bytes["bytes_after"]
+        report["minify"] = minify_bytes
+
+
+def generate_site(
+    entries,
+    esv_cache,
+    output_root,
+    site_url,
+    inline_critical=True,
+    minify=False,
+    prefetch=DEFAULT_PREFETCH_MODE,
+    precompress=False,
+):
     validate_entries(entries)
-    output_root.mkdir(parents=True, exist_ok=True)
-    entries_dir = output_root / "entries"
-    entries_dir.mkdir(parents=True, exist_ok=True)
+    report = {"pages": len(entries)}
+    minify_bytes = {"bytes_before": 0, "bytes_after": 0}
+    stylesheet_rules = load_stylesheet_rules() if inline_critical else None
+    critical_css_bytes = {}
+    sink = as_sink(output_root)
 
     for index, entry in enumerate(entries):
         slug = slugify_entry(entry)
-        entry_dir = entries_dir / slug
-        entry_dir.mkdir(parents=True, exist_ok=True)
-        previous_entry = entries[index - 1] if index > 0 else entries[-1]
-        next_entry = entries[index + 1] if index + 1 < len(entries) else entries[0]
-        esv_text = esv_cache.get(entry["mmdd"], {}).get("text", "")
-        html = render_entry_page(entry, previous_entry, next_entry, esv_text, site_url)
-        (entry_dir / "index.html").write_text(html, encoding="utf-8")
+        html, critical_css = render_entry_at(
+            entries, index, esv_cache, site_url, stylesheet_rules, prefetch=prefetch
+        )
+        if critical_css is not None:
+            critical_css_bytes[slug] = len(critical_css.encode("utf-8"))
+        fragment = render_fragment_at(entries, index, esv_cache, site_url)
+        write_entry_page(sink, slug, html, fragment, minify, minify_bytes)
+
+    add_page_reports(report, critical_css_bytes, minify, minify_bytes)
+
+    started = time.perf_counter()
+    postings = build_postings(entries, esv_cache)
+    docs = [build_doc(entry) for entry in entries]
+    write_site_indexes(
+        entries, sink, site_url, report, postings, docs, time.perf_counter() - started, precompress=precompress
+    )
+    return report
+
+
+def write_site_indexes(
+    entries, sink, site_url, report, postings, docs, indexing_seconds, exports=None, precompress=False
+):
+    write_sitemap(entries, sink, site_url)
+    write_robots_txt(sink, site_url)
+    write_routes_manifest(entries, sink)
+    report["dataset_exports"] = write_dataset_exports(entries, sink, exports)
+
+    report["search_index"] = write_search_files(postings, docs, sink, indexing_seconds)
+    slugs = [slugify_entry(entry) for entry in entries]
+    report["service_worker"] = write_service_worker(sink, *build_output_paths(slugs, sink))
+    write_publish_files(sink, slugs, report, precompress)
+
+
+def write_publish_files(sink, slugs, report, precompress):
+    # The .htaccess and precompressed siblings are derived from the publish list and published with it.
+    publish_paths = collect_publish_paths(slugs, sink)
+    versioned_assets = collect_versioned_assets(sink, publish_paths)
+    cache_policy_paths, report["cache_policy"] = write_cache_policy(sink, publish_paths, precompress, versioned_assets)
+    report["publish"] = write_publish_manifest(sink, [*publish_paths, *cache_policy_paths], versioned_assets)
+
+
+def load_editions(path):
+    editions = []
+    for config in load_json(path):
+        edition = {
+            "name": config["name"],
+            "output_root": ROOT / config["output_root"],
+            "site_url": config.get("site_url", SITE_URL).rstrip("/"),
+            "translations": tuple(config.get("translations", TRANSLATIONS)),
+        }
+        if "prefetch" in config:
+            edition["prefetch"] = config["prefetch"]
+        editions.append(edition)
+    return editions
+
+
+def validate_editions(editions):
+    seen_names = set()
+    seen_roots = set()
+    for edition in editions:
+        name = edition["name"]
+        if name in seen_names:
+            raise ValueError(f"Duplicate edition name: {name}")
+        seen_names.add(name)
+
+        output_root = edition["output_root"]
+        is_path = isinstance(output_root, (str, os.PathLike))
+        root_key = Path(output_root).resolve() if is_path else id(output_root)
+        if root_key in seen_roots:
+            raise ValueError(f"Edition {name} shares its output root with another edition: {output_root}")
+        seen_roots.add(root_key)
+
+        translations = tuple(edition["translations"])
+        unknown = [translation for translation in translations if translation not in TRANSLATIONS]
+        if unknown or "KJV" not in translations:
+            raise ValueError(f"Edition {name} needs KJV and only known translations, got {', '.join(translations)}")
+        if "ESV" not in translations and root_key == ROOT.resolve():
+            raise ValueError(f"Edition {name} omits ESV and cannot overwrite data/esv_cache.json in the source tree")
+        if edition.get("prefetch", DEFAULT_PREFETCH_MODE) not in PREFETCH_MODES:
+            raise ValueError(f"Edition {name} has unknown prefetch mode {edition['prefetch']!r}")
+
+
+def copy_static_files(output_root, include_esv=True):
+    # data/routes.json is generated per build; every other static file comes from the source tree.
+    sink = as_sink(output_root)
+    static_files = [*STATIC_PAGES.values(), *(asset for asset in STATIC_ASSETS if asset != "data/routes.json")]
+    for relative_path in static_files:
+        source = ROOT / relative_path
+        if isinstance(sink, FileSink) and (sink.root / relative_path).resolve() == source.resolve():
+            continue
+        if relative_path == "data/esv_cache.json" and not include_esv:
+            sink.write_text(relative_path, "{}\n")
+        else:
+            sink.write_bytes(relative_path, source.read_bytes())
+
+
+def generate_editions(
+    entries,
+    esv_cache,
+    editions,
+    inline_critical=True,
+    minify=False,
+    prefetch=DEFAULT_PREFETCH_MODE,
+    precompress=False,
+):
+    """Build several editions of the site from one load of the data; returns a report per edition.
+
+    Pages are rendered once per translation set and prefetch mode against a placeholder URL and
+    retargeted to each edition's host, so editions that differ only by host share the rendering
+    and the critical CSS work. ``prefetch`` applies to editions that do not set their own.
+    Output roots outside the source tree also get the static pages and assets.
+    """
+    validate_editions(editions)
+    validate_entries(entries)
+    stylesheet_rules = load_stylesheet_rules() if inline_critical else None
+    critical_css_cache = {}
+    exports = build_dataset_exports(entries)
+    slugs = [slugify_entry(entry) for entry in entries]
+
+    editions_by_rendering = {}
+    for edition in editions:
+        rendering = (tuple(edition["translations"]), edition.get("prefetch", prefetch))
+        editions_by_rendering.setdefault(rendering, []).append(edition)
+
+    reports = {}
+    for (translations, edition_prefetch), group in editions_by_rendering.items():
+        edition_esv_cache = esv_cache if "ESV" in translations else {}
+        page_stats = {}
+        for edition in group:
+            copy_static_files(edition["output_root"], "ESV" in translations)
+            reports[edition["name"]] = {"pages": len(entries)}
+            page_stats[edition["name"]] = ({}, {"bytes_before": 0, "bytes_after": 0})
+
+        for index, slug in enumerate(slugs):
+            template, critical_css = render_entry_at(
+                entries,
+                index,
+                edition_esv_cache,
+                EDITION_SITE_URL_PLACEHOLDER,
+                stylesheet_rules,
+                critical_css_cache,
+                edition_prefetch,
+            )
+            fragment = render_fragment_at(entries, index, edition_esv_cache, EDITION_SITE_URL_PLACEHOLDER)
+            for edition in group:
+                critical_css_bytes, minify_bytes = page_stats[edition["name"]]
+                if critical_css is not None:
+                    critical_css_bytes[slug] = len(critical_css.encode("utf-8"))
+                html = template.replace(EDITION_SITE_URL_PLACEHOLDER, edition["site_url"])
+                edition_fragment = {
+                    **fragment,
+                    "canonical": fragment["canonical"].replace(EDITION_SITE_URL_PLACEHOLDER, edition["site_url"]),
+                }
+                write_entry_page(
+                    as_sink(edition["output_root"]), slug, html, edition_fragment, minify, minify_bytes
+                )
+
+        started = time.perf_counter()
+        postings = build_postings(entries, edition_esv_cache)
+        docs = [build_doc(entry) for entry in entries]
+        indexing_seconds = time.perf_counter() - started
+        for edition in group:
+            report = reports[edition["name"]]
+            critical_css_bytes, minify_bytes = page_stats[edition["name"]]
+            add_page_reports(report, critical_css_bytes, minify, minify_bytes)
+            write_site_indexes(
+                entries,
+                as_sink(edition["output_root"]),
+                edition["site_url"],
+                report,
+                postings,
+                docs,
+                indexing_seconds,
+                exports,
+                precompress,
+            )
+    return reports
+
+
+def generate_site_streaming(
+    entries,
+    esv_cache,
+    output_root,
+    site_url,
+    inline_critical=True,
+    minify=False,
+    prefetch=DEFAULT_PREFETCH_MODE,
+    precompress=False,
+):
+    """Build the site from an entry iterator, keeping only a prev/current/next window in memory.
+
+    Entries are validated as they arrive, so an invalid record stops the build part way.
+    Besides ``esv_cache``, which is passed in whole, only the per-entry slugs and the search
+    postings grow with the dataset; the columnar export needs every record at once and is
+    skipped in this mode.
+    """
+    report = {"pages": 0}
+    minify_bytes = {"bytes_before": 0, "bytes_after": 0}
+    stylesheet_rules = load_stylesheet_rules() if inline_critical else None
+    critical_css_bytes = {}
+    sink = as_sink(output_root)
 
-    write_sitemap(entries, output_root, site_url)
-    write_robots_txt(output_root, site_url)
-    write_routes_manifest(entries, output_root)
+    seen_slugs = set()
+    slugs = []
+    postings = {}
+    docs = []
+    indexing_seconds = 0.0
+    ndjson_bytes = 0
+    # The entries may be streaming from the NDJSON export itself, so it is replaced only once they are all read.
+    ndjson_partial_path = f"{NDJSON_PATH.as_posix()}.partial"
+
+    try:
+        with sink.open_text("sitemap.xml") as sitemap, sink.open_text("data/routes.json") as routes, sink.open_text(
+            ndjson_partial_path
+        ) as ndjson:
+            sitemap.write(render_sitemap_head(site_url))
+            routes.write("{")
+
+            def read_entries():
+                nonlocal indexing_seconds, ndjson_bytes
+                for ordinal, entry in enumerate(entries):
+                    validate_entry(entry, seen_slugs)
+                    slugs.append(slugify_entry(entry))
+                    sitemap.write(render_sitemap_url(f"{site_url}{build_entry_href(entry)}"))
+                    routes.write(render_route_line(entry, ordinal == 0))
+                    ndjson_line = dump_ndjson_line(entry)
+                    ndjson.write(ndjson_line)
+                    ndjson_bytes += len(ndjson_line.encode("utf-8"))
+                    started = time.perf_counter()
+                    index_entry(postings, ordinal, entry, esv_cache)
+                    docs.append(build_doc(entry))
+                    indexing_seconds += time.perf_counter() - started
+                    yield entry
+
+            for previous_entry, entry, next_entry in iter_entry_windows(read_entries()):
+                slug = slugify_entry(entry)
+                html, critical_css = render_entry_window(
+                    previous_entry, entry, next_entry, esv_cache, site_url, stylesheet_rules, prefetch=prefetch
+                )
+                if critical_css is not None:
+                    critical_css_bytes[slug] = len(critical_css.encode("utf-8"))
+                fragment = render_entry_fragment(
+                    entry, previous_entry, next_entry, lookup_esv_text(esv_cache, entry), site_url
+                )
+                write_entry_page(sink, slug, html, fragment, minify, minify_bytes)
+                report["pages"] += 1
+
+            sitemap.write(SITEMAP_CLOSE)
+            routes.write("\n}\n" if slugs else "}\n")
+            report["dataset_exports"] = {"ndjson_bytes": ndjson_bytes}
+    except BaseException:
+        sink.remove(ndjson_partial_path)
+        raise
+    sink.replace(ndjson_partial_path, NDJSON_PATH.as_posix())
+
+    # A columnar export left by an earlier list build would otherwise be published with stale data.
+    sink.remove(COLUMNAR_PATH.as_posix())
+    add_page_reports(report, critical_css_bytes, minify, minify_bytes)
+    write_robots_txt(sink, site_url)
+    report["search_index"] = write_search_files(postings, docs, sink, indexing_seconds)
+    report["service_worker"] = write_service_worker(sink, *build_output_paths(slugs, sink))
+    write_publish_files(sink, slugs, report, precompress)
+    return report
+
+
+def iter_entries(path):
+    if path.suffix == ".ndjson":
+        return iter_ndjson(path)
+    return iter_json_array(path)
+
+
+def print_build_report(report):
+    print(f"Generated {report['pages']} entry pages.")
+    critical_report = report.get("critical_css")
+    if critical_report:
+        print(
+            f"Critical CSS: {critical_report['bytes_min']}-{critical_report['bytes_max']} bytes per page "
+            f"(budget {CRITICAL_CSS_BUDGET}), {len(critical_report['over_budget'])} pages over budget"
+        )
+    minify_report = report.get("minify")
+    if minify_report:
+        print(
+            f"Minified entries/: {minify_report['bytes_before']} -> {minify_report['bytes_after']} bytes "
+            f"({minify_report['bytes_saved']} saved)"
+        )
+    export_report = report["dataset_exports"]
+    columnar_text = (
+        f"columnar {export_report['columnar_bytes']} bytes, " if "columnar_bytes" in export_report else "columnar skipped, "
+    )
+    print(f"Dataset exports: {columnar_text}NDJSON {export_report['ndjson_bytes']} bytes")
+    search_report = report["search_index"]
+    print(
+        f"Search index: {search_report['terms']} terms in {search_report['shard_count']} shards, "
+        f"{search_report['shard_bytes_total']} bytes total "
+        f"(max {search_report['shard_bytes_max']}, median {search_report['shard_bytes_median']}), "
+        f"docs in {search_report['docs_chunk_count']} chunks of {search_report['docs_bytes_total']} bytes total "
+        f"(max {search_report['docs_bytes_max']}), built in {search_report['build_seconds'] * 1000:.1f} ms"
+    )
+    worker_report = report["service_worker"]
+    print(
+        f"Precache manifest {worker_report['version']}: {worker_report['files']} files, "
+        f"{worker_report['manifest_bytes']} bytes"
+    )
+    cache_report = report["cache_policy"]
+    precompress_text = (
+        f"{cache_report['precompressed']} precompressed siblings ({', '.join(cache_report['encodings'])}, "
+        f"{cache_report['bytes_saved']} bytes saved)"
+        if cache_report["precompressed"]
+        else "no precompressed siblings"
+    )
+    print(
+        f"Cache policy: .htaccess {cache_report['htaccess_bytes']} bytes, "
+        f"{cache_report['immutable_urls']} immutable URLs, {precompress_text}"
+    )
+    publish_report = report["publish"]
+    print(
+        f"Publish manifest: {publish_report['files']} files; since last build "
+        f"{publish_report['added']} added, {publish_report['changed']} changed, "
+        f"{publish_report['removed']} removed ({publish_report['transfer_bytes']} bytes to transfer)"
+    )
+
+
+def report_validation(output_root, site_url):
+    started = time.perf_counter()
+    errors = validate_site(output_root, site_url)
+    for error in errors:
+        print(error)
+    elapsed = (time.perf_counter() - started) * 1000
+    if errors:
+        print(f"Site validation failed with {len(errors)} errors in {elapsed:.1f} ms")
+        return False
+    print(f"Site validation passed in {elapsed:.1f} ms")
+    return True
 
 
 def main():
-    entries = load_json(ENTRIES_PATH)
+    parser = argparse.ArgumentParser(description="Generate static entry pages and site data.")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=("build", "serve"),
+        default="build",
+        help="Write the site to disk (default) or serve it from memory",
+    )
+    parser.add_argument("--watch", action="store_true", help="With serve: re-render pages when data files change")
+    parser.add_argument("--port", type=int, default=8000, help="With serve: port to listen on (default: 8000)")
+    parser.add_argument("--minify", action="store_true", help="Minify the generated entry pages")
+    parser.add_argument(
+        "--no-critical-css",
+        action="store_true",
+        help="Link style.css normally instead of inlining critical CSS",
+    )
+    parser.add_argument(
+        "--prefetch",
+        choices=PREFETCH_MODES,
+        default=DEFAULT_PREFETCH_MODE,
+        help=f"Resource hints for each page's neighbours (default: {DEFAULT_PREFETCH_MODE})",
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Write .br/.gz siblings of the published text files for the .htaccess to serve (.br needs brotli)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read entries incrementally and render pages from a sliding window (skips the columnar export)",
+    )
+    parser.add_argument(
+        "--entries",
+        type=Path,
+        default=ENTRIES_PATH,
+        help="Entries file, a JSON array or .ndjson (default: data/entries.json)",
+    )
+    parser.add_argument(
+        "--editions",
+        type=Path,
+        help="Build every edition listed in this JSON file (see tools/editions.example.json)",
+    )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        help="Write the site, static files included, to one .zip/.tar/.tar.gz bundle instead of the repository",
+    )
+    args = parser.parse_args()
+    if args.stream and args.editions:
+        parser.error("--stream builds a single edition and cannot be combined with --editions")
+    if args.archive and args.editions:
+        parser.error("--archive writes a single edition and cannot be combined with --editions")
+
+    if args.command == "serve":
+        try:
+            from tools.dev_server import serve
+        except ImportError:
+            from dev_server import serve
+        serve(port=args.port, watch_files=args.watch)
+        return
+
     esv_cache = load_json(ESV_CACHE_PATH)
-    generate_site(entries, esv_cache, OUTPUT_ROOT, SITE_URL)
+    if args.editions:
+        editions = load_editions(args.editions)
+        entries = list(iter_entries(args.entries)) if args.entries.suffix == ".ndjson" else load_json(args.entries)
+        reports = generate_editions(
+            entries,
+            esv_cache,
+            editions,
+            inline_critical=not args.no_critical_css,
+            minify=args.minify,
+            prefetch=args.prefetch,
+            precompress=args.precompress,
+        )
+        failed = []
+        for edition in editions:
+            print(f"== {edition['name']} ({edition['site_url']}, {'+'.join(edition['translations'])})")
+            print_build_report(reports[edition["name"]])
+            if not report_validation(edition["output_root"], edition["site_url"]):
+                failed.append(edition["name"])
+        if failed:
+            raise SystemExit(f"Site validation failed for {', '.join(failed)}")
+        return
+
+    if args.stream:
+        build = generate_site_streaming
+        entries = iter_entries(args.entries)
+    else:
+        build = generate_site
+        entries = list(iter_entries(args.entries)) if args.entries.suffix == ".ndjson" else load_json(args.entries)
+    output_root = OUTPUT_ROOT
+    if args.archive:
+        output_root = ArchiveSink(args.archive)
+        copy_static_files(output_root)
+    report = build(
+        entries,
+        esv_cache,
+        output_root,
+        SITE_URL,
+        inline_critical=not args.no_critical_css,
+        minify=args.minify,
+        prefetch=args.prefetch,
+        precompress=args.precompress,
+    )
+    print_build_report(report)
+    if args.archive:
+        output_root.close()
+        print(f"Wrote {len(output_root.members)} files to {args.archive} ({args.archive.stat().st_size} bytes)")
+        return
+    if not report_validation(OUTPUT_ROOT, SITE_URL):
+        raise SystemExit("Site validation failed")
 
 
 if __name__ == "__main__":
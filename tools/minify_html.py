@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from html.parser import HTMLParser
+import re
+
+
+VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+)
+INLINE_TAGS = frozenset(
+    {"a", "abbr", "b", "br", "button", "cite", "code", "em", "i", "img", "input", "label", "small", "span", "strong", "sub", "sup"}
+)
+RAW_TEXT_TAGS = frozenset({"pre", "script", "style", "textarea"})
+PRESERVED_CLASSES = frozenset({"entry-text", "poem-line"})
+# End tags the HTML spec lets us drop unconditionally in the documents we emit.
+OMITTED_END_TAGS = frozenset({"html", "head", "body"})
+# A </p> may be dropped when the next tag is one of these start tags ...
+P_CLOSING_START_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "details", "div", "dl", "fieldset", "figcaption",
+        "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hgroup", "hr",
+        "main", "menu", "nav", "ol", "p", "pre", "section", "table", "ul",
+    }
+)
+# ... or when its parent closes, unless the parent is one of these.
+P_KEEPING_PARENTS = frozenset({"a", "audio", "del", "ins", "map", "noscript", "video"})
+UNQUOTED_VALUE_PATTERN = re.compile(r"^[^\s\"'=<>`&]+$")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def serialize_attribute(name, value):
+    if value is None:
+        return name
+    if UNQUOTED_VALUE_PATTERN.match(value):
+        return f"{name}={value}"
+    escaped = value.replace("&", "&amp;").replace('"', "&quot;")
+    return f'{name}="{escaped}"'
+
+
+class HtmlMinifier(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.output = []
+        self.stack = []
+        self.preserve_depth = 0
+        self.pending_end_tag = None
+        self.pending_space = False
+        self.last_tag = None
+
+    def is_preserving(self, tag, attrs):
+        if tag in RAW_TEXT_TAGS:
+            return True
+        classes = dict(attrs).get("class") or ""
+        return bool(PRESERVED_CLASSES.intersection(classes.split()))
+
+    def flush_pending(self, next_start_tag=None, next_end_tag=None):
+        if self.pending_end_tag:
+            tag, parent = self.pending_end_tag
+            droppable = (
+                (tag == "p" and next_start_tag in P_CLOSING_START_TAGS)
+                or (tag == "p" and next_end_tag is not None and parent not in P_KEEPING_PARENTS)
+                or (tag == "li" and (next_start_tag == "li" or next_end_tag is not None))
+            )
+            if not droppable:
+                self.output.append(f"</{tag}>")
+            self.pending_end_tag = None
+
+        if self.pending_space:
+            next_tag = next_start_tag or next_end_tag
+            if next_tag is None or next_tag in INLINE_TAGS or self.last_tag in INLINE_TAGS:
+                self.output.append(" ")
+            self.pending_space = False
+
+    def handle_decl(self, decl):
+        self.flush_pending()
+        self.output.append(f"<!{decl}>")
+
+    def handle_starttag(self, tag, attrs):
+        if self.preserve_depth:
+            self.output.append(self.get_starttag_text())
+        else:
+            self.flush_pending(next_start_tag=tag)
+            serialized = "".join(f" {serialize_attribute(name, value)}" for name, value in attrs)
+            self.output.append(f"<{tag}{serialized}>")
+            self.last_tag = tag
+
+        if tag not in VOID_TAGS:
+            preserves = self.is_preserving(tag, attrs)
+            self.stack.append((tag, preserves))
+            if preserves:
+                self.preserve_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in VOID_TAGS:
+            self.handle_starttag(tag, attrs)
+        else:
+            self.handle_starttag(tag, attrs)
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS:
+            return
+
+        if self.preserve_depth and not any(preserves for _, preserves in self.stack[-1:]):
+            self.output.append(f"</{tag}>")
+            self.pop_element(tag)
+            return
+
+        self.pop_element(tag)
+        if self.preserve_depth:
+            self.output.append(f"</{tag}>")
+            return
+
+        self.flush_pending(next_end_tag=tag)
+        self.last_tag = tag
+        if tag in OMITTED_END_TAGS:
+            return
+        if tag in ("p", "li"):
+            parent = self.stack[-1][0] if self.stack else None
+            self.pending_end_tag = (tag, parent)
+            return
+        self.output.append(f"</{tag}>")
+
+    def pop_element(self, tag):
+        while self.stack:
+            open_tag, preserves = self.stack.pop()
+            if preserves:
+                self.preserve_depth -= 1
+            if open_tag == tag:
+                return
+
+    def handle_data(self, data):
+        if self.preserve_depth:
+            self.output.append(data)
+            return
+        if not data.strip():
+            self.pending_space = self.pending_space or bool(data)
+            return
+        self.flush_pending()
+        self.output.append(WHITESPACE_PATTERN.sub(" ", data))
+
+    def handle_entityref(self, name):
+        if not self.preserve_depth:
+            self.flush_pending()
+        self.output.append(f"&{name};")
+
+    def handle_charref(self, name):
+        if not self.preserve_depth:
+            self.flush_pending()
+        self.output.append(f"&#{name};")
+
+    def handle_comment(self, data):
+        if self.preserve_depth:
+            self.output.append(f"<!--{data}-->")
+
+
+def minify_html(html):
+    minifier = HtmlMinifier()
+    minifier.feed(html)
+    minifier.close()
+    minifier.pending_space = False
+    minifier.flush_pending(next_end_tag="")
+    return "".join(minifier.output)
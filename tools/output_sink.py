@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import gzip
+import io
+import lzma
+import os
+from pathlib import Path, PurePosixPath
+import shutil
+import tarfile
+from tempfile import TemporaryDirectory
+import zipfile
+
+
+# Fixed timestamp (the earliest a zip entry can carry) so identical builds give identical archives.
+ARCHIVE_MTIME = 315532800
+ARCHIVE_FORMATS = {
+    ".zip": "zip",
+    ".tar": "tar",
+    ".tgz": "gz",
+    ".gz": "gz",
+    ".xz": "xz",
+}
+
+
+def as_sink(target):
+    """Return ``target`` as a sink; paths become a :class:`FileSink`."""
+    if isinstance(target, (str, os.PathLike)):
+        return FileSink(target)
+    return target
+
+
+class FileSink:
+    """Writes generated files under a directory on disk."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write_bytes(self, relative_path, data):
+        path = self.root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def write_text(self, relative_path, text):
+        self.write_bytes(relative_path, text.encode("utf-8"))
+
+    def open_text(self, relative_path):
+        path = self.root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.open("w", encoding="utf-8")
+
+    def read_bytes(self, relative_path):
+        path = self.root / relative_path
+        return path.read_bytes() if path.is_file() else None
+
+    def list_files(self, directory):
+        return sorted(
+            path.relative_to(self.root).as_posix()
+            for path in (self.root / directory).glob("*")
+            if path.is_file()
+        )
+
+    def remove(self, relative_path):
+        (self.root / relative_path).unlink(missing_ok=True)
+
+    def replace(self, source_path, target_path):
+        os.replace(self.root / source_path, self.root / target_path)
+
+    def close(self):
+        pass
+
+
+class _SinkTextBuffer(io.StringIO):
+    def __init__(self, sink, relative_path):
+        super().__init__()
+        self._sink = sink
+        self._relative_path = relative_path
+
+    def close(self):
+        if not self.closed:
+            self._sink.write_text(self._relative_path, self.getvalue())
+        super().close()
+
+
+class MemorySink:
+    """Keeps generated files in a dict of relative POSIX path to bytes; nothing touches disk."""
+
+    def __init__(self):
+        self.files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write_bytes(self, relative_path, data):
+        self.files[PurePosixPath(relative_path).as_posix()] = bytes(data)
+
+    def write_text(self, relative_path, text):
+        self.write_bytes(relative_path, text.encode("utf-8"))
+
+    def open_text(self, relative_path):
+        return _SinkTextBuffer(self, relative_path)
+
+    def read_bytes(self, relative_path):
+        return self.files.get(PurePosixPath(relative_path).as_posix())
+
+    def list_files(self, directory):
+        prefix = f"{PurePosixPath(directory).as_posix()}/"
+        return sorted(
+            path
+            for path in self.files
+            if path.startswith(prefix) and "/" not in path[len(prefix):]
+        )
+
+    def remove(self, relative_path):
+        self.files.pop(PurePosixPath(relative_path).as_posix(), None)
+
+    def replace(self, source_path, target_path):
+        data = self.files.pop(PurePosixPath(source_path).as_posix())
+        self.files[PurePosixPath(target_path).as_posix()] = data
+
+    def close(self):
+        pass
+
+
+class ArchiveSink(FileSink):
+    """Collects generated files and writes them as one tar or zip archive on close.
+
+    Files are spooled to a temporary directory rather than held in memory, so later overwrites,
+    removals and reads behave as on disk; on close each one is streamed into the archive, sorted
+    and with a fixed timestamp.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.format = ARCHIVE_FORMATS.get(self.path.suffix)
+        if self.format is None:
+            raise ValueError(f"Unsupported archive type: {self.path.name} (use .zip, .tar, .tar.gz or .tar.xz)")
+        self._spool = TemporaryDirectory(prefix="archive-sink-")
+        super().__init__(self._spool.name)
+        self.members = []
+        self.closed = False
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.members = sorted(
+                path.relative_to(self.root).as_posix() for path in self.root.rglob("*") if path.is_file()
+            )
+            self.write_archive()
+        finally:
+            self._spool.cleanup()
+
+    def write_archive(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.format == "zip":
+            with zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for relative_path in self.members:
+                    info = zipfile.ZipInfo(relative_path, date_time=(1980, 1, 1, 0, 0, 0))
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    info.external_attr = 0o644 << 16
+                    with (self.root / relative_path).open("rb") as source, archive.open(info, "w") as member:
+                        shutil.copyfileobj(source, member)
+            return
+
+        with self.path.open("wb") as raw:
+            if self.format == "gz":
+                # gzip stamps the time and file name into its header unless told otherwise.
+                stream = gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=ARCHIVE_MTIME)
+            elif self.format == "xz":
+                stream = lzma.LZMAFile(raw, "wb")
+            else:
+                stream = raw
+            with stream, tarfile.open(fileobj=stream, mode="w|") as archive:
+                for relative_path in self.members:
+                    source_path = self.root / relative_path
+                    info = tarfile.TarInfo(relative_path)
+                    info.size = source_path.stat().st_size
+                    info.mtime = ARCHIVE_MTIME
+                    info.mode = 0o644
+                    with source_path.open("rb") as source:
+                        archive.addfile(info, source)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+try:
+    from tools.output_sink import as_sink
+except ImportError:  # Run directly as `python3 tools/generate_entry_pages.py`.
+    from output_sink import as_sink
+
+
+PUBLISH_MANIFEST_NAME = "publish-manifest.json"
+PUBLISH_DIFF_NAME = "publish-diff.json"
+MANIFEST_VERSION = 1
+
+
+def build_publish_manifest(output_root, relative_paths):
+    sink = as_sink(output_root)
+    files = {}
+    for relative_path in sorted(set(relative_paths)):
+        data = sink.read_bytes(relative_path)
+        if data is not None:
+            files[relative_path] = {"hash": hashlib.sha256(data).hexdigest(), "bytes": len(data)}
+    return {"version": MANIFEST_VERSION, "files": files}
+
+
+def load_publish_manifest(path):
+    if not path.exists():
+        return {"version": MANIFEST_VERSION, "files": {}}
+    with path.open(encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def diff_manifests(previous, current):
+    previous_files = previous.get("files", {})
+    current_files = current["files"]
+    added = sorted(path for path in current_files if path not in previous_files)
+    changed = sorted(
+        path
+        for path in current_files
+        if path in previous_files and previous_files[path]["hash"] != current_files[path]["hash"]
+    )
+    removed = sorted(path for path in previous_files if path not in current_files)
+    return {
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+        "transfer_bytes": sum(current_files[path]["bytes"] for path in added + changed),
+    }
+
+
+def write_publish_manifest(output_root, relative_paths, versioned_assets=None):
+    sink = as_sink(output_root)
+    previous_payload = sink.read_bytes(PUBLISH_MANIFEST_NAME)
+    previous = json.loads(previous_payload) if previous_payload else {"version": MANIFEST_VERSION, "files": {}}
+    manifest = build_publish_manifest(sink, relative_paths)
+    if versioned_assets:
+        # Served as immutable; the next build checks these hashes before reusing a version.
+        manifest["versioned_assets"] = versioned_assets
+    diff = diff_manifests(previous, manifest)
+
+    sink.write_text(PUBLISH_MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    sink.write_text(PUBLISH_DIFF_NAME, json.dumps(diff, indent=2) + "\n")
+    return {
+        "files": len(manifest["files"]),
+        "added": len(diff["added"]),
+        "changed": len(diff["changed"]),
+        "removed": len(diff["removed"]),
+        "transfer_bytes": diff["transfer_bytes"],
+    }
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import re
+import time
+
+try:
+    from tools.output_sink import as_sink
+except ImportError:  # Run directly as `python3 tools/generate_entry_pages.py`.
+    from output_sink import as_sink
+
+
+SEARCH_DIR = Path("data") / "search"
+INDEX_VERSION = 2
+SHARD_PREFIX_LENGTH = 2
+# Doc metadata is split by ordinal range, so a query loads only the chunks holding its matches.
+DOCS_CHUNK_SIZE = 32
+SEARCH_FIELDS = ("title", "bible_verse", "esv", "poem")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "he", "his",
+        "i", "in", "is", "it", "me", "my", "not", "of", "on", "or", "shall", "so", "that",
+        "the", "their", "them", "they", "this", "thou", "thy", "to", "unto", "was", "we",
+        "which", "with", "ye", "you",
+    }
+)
+# Ordered longest-first; the first matching suffix wins. Mirrored in search.js.
+SUFFIX_RULES = (
+    ("ations", ""),
+    ("ation", ""),
+    ("ness", ""),
+    ("ment", ""),
+    ("ings", ""),
+    ("ing", ""),
+    ("edst", ""),
+    ("eth", ""),
+    ("est", ""),
+    ("ies", "i"),
+    ("ied", "i"),
+    ("ed", ""),
+    ("es", ""),
+    ("ly", ""),
+    ("s", ""),
+)
+MIN_STEM_LENGTH = 3
+
+
+def fold_text(text):
+    return text.lower().replace("’", "'").replace("'", "")
+
+
+def stem_token(token):
+    for suffix, replacement in SUFFIX_RULES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM_LENGTH:
+            token = token[: -len(suffix)] + replacement
+            break
+    if len(token) > MIN_STEM_LENGTH and token.endswith("e"):
+        token = token[:-1]
+    if len(token) > MIN_STEM_LENGTH and token.endswith("y"):
+        token = token[:-1] + "i"
+    return token
+
+
+def tokenize(text):
+    return [
+        stem_token(token)
+        for token in TOKEN_PATTERN.findall(fold_text(text))
+        if token not in STOP_WORDS
+    ]
+
+
+def entry_search_text(entry, esv_cache):
+    esv_text = esv_cache.get(entry["mmdd"], {}).get("text", "")
+    fields = {
+        "title": entry["title"],
+        "bible_verse": entry["bible_verse"],
+        "esv": esv_text,
+        "poem": entry["poem"],
+    }
+    return " ".join(fields[name] for name in SEARCH_FIELDS if fields[name])
+
+
+def index_entry(postings, ordinal, entry, esv_cache):
+    for term in set(tokenize(entry_search_text(entry, esv_cache))):
+        postings.setdefault(term, []).append(ordinal)
+
+
+def build_postings(entries, esv_cache):
+    postings = {}
+    for ordinal, entry in enumerate(entries):
+        index_entry(postings, ordinal, entry, esv_cache)
+    return postings
+
+
+def delta_encode(ordinals):
+    deltas = []
+    previous = 0
+    for ordinal in sorted(ordinals):
+        deltas.append(ordinal - previous)
+        previous = ordinal
+    return deltas
+
+
+def delta_decode(deltas):
+    ordinals = []
+    current = 0
+    for delta in deltas:
+        current += delta
+        ordinals.append(current)
+    return ordinals
+
+
+def shard_key(term):
+    return term[:SHARD_PREFIX_LENGTH]
+
+
+def build_shards(postings):
+    shards = {}
+    for term in sorted(postings):
+        shards.setdefault(shard_key(term), {})[term] = delta_encode(postings[term])
+    return shards
+
+
+def dump_compact_json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True) + "\n"
+
+
+def build_doc(entry):
+    return [entry["mmdd"], entry["title"]]
+
+
+def docs_chunk_name(ordinal):
+    return f"docs-{ordinal // DOCS_CHUNK_SIZE}"
+
+
+def write_search_files(postings, docs, output_root, indexing_seconds=0.0):
+    started = time.perf_counter()
+    sink = as_sink(output_root)
+    search_dir = SEARCH_DIR.as_posix()
+    for stale_path in sink.list_files(search_dir):
+        if stale_path.endswith(".json"):
+            sink.remove(stale_path)
+
+    shards = build_shards(postings)
+    shard_sizes = {}
+    for prefix, terms in shards.items():
+        payload = dump_compact_json(terms).encode("utf-8")
+        sink.write_bytes(f"{search_dir}/{prefix}.json", payload)
+        shard_sizes[prefix] = len(payload)
+
+    docs_sizes = []
+    for start in range(0, len(docs), DOCS_CHUNK_SIZE):
+        payload = dump_compact_json(docs[start : start + DOCS_CHUNK_SIZE]).encode("utf-8")
+        sink.write_bytes(f"{search_dir}/{docs_chunk_name(start)}.json", payload)
+        docs_sizes.append(len(payload))
+
+    meta = {
+        "version": INDEX_VERSION,
+        "prefix_length": SHARD_PREFIX_LENGTH,
+        "fields": list(SEARCH_FIELDS),
+        "doc_count": len(docs),
+        "docs_chunk_size": DOCS_CHUNK_SIZE,
+        "shards": sorted(shards),
+    }
+    meta_payload = dump_compact_json(meta).encode("utf-8")
+    sink.write_bytes(f"{search_dir}/meta.json", meta_payload)
+
+    shard_bytes = sorted(shard_sizes.values())
+    return {
+        "build_seconds": indexing_seconds + time.perf_counter() - started,
+        "terms": sum(len(terms) for terms in shards.values()),
+        "shard_count": len(shards),
+        "shard_bytes_total": sum(shard_bytes),
+        "shard_bytes_max": shard_bytes[-1] if shard_bytes else 0,
+        "shard_bytes_median": shard_bytes[len(shard_bytes) // 2] if shard_bytes else 0,
+        "meta_bytes": len(meta_payload),
+        "docs_chunk_count": len(docs_sizes),
+        "docs_bytes_total": sum(docs_sizes),
+        "docs_bytes_max": max(docs_sizes, default=0),
+    }
+
+
+def load_search_file(output_root, name, default):
+    payload = as_sink(output_root).read_bytes(f"{SEARCH_DIR.as_posix()}/{name}.json")
+    return default if payload is None else json.loads(payload)
+
+
+def load_shard(output_root, prefix):
+    return load_search_file(output_root, prefix, {})
+
+
+def load_docs(output_root, ordinals):
+    """Return ``[mmdd, title]`` for each ordinal, reading only the doc chunks that hold them."""
+    chunks = {}
+    docs = []
+    for ordinal in ordinals:
+        name = docs_chunk_name(ordinal)
+        if name not in chunks:
+            chunks[name] = load_search_file(output_root, name, [])
+        docs.append(chunks[name][ordinal % DOCS_CHUNK_SIZE])
+    return docs
+
+
+def search(output_root, query):
+    terms = tokenize(query)
+    if not terms:
+        return []
+
+    matches = None
+    shards = {}
+    for term in terms:
+        prefix = shard_key(term)
+        if prefix not in shards:
+            shards[prefix] = load_shard(output_root, prefix)
+        ordinals = set(delta_decode(shards[prefix].get(term, [])))
+        matches = ordinals if matches is None else matches & ordinals
+        if not matches:
+            return []
+    return sorted(matches)
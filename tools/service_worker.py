@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+try:
+    from tools.output_sink import as_sink
+except ImportError:  # Run directly as `python3 tools/generate_entry_pages.py`.
+    from output_sink import as_sink
+
+
+PRECACHE_MANIFEST_NAME = "precache-manifest.json"
+SERVICE_WORKER_NAME = "sw.js"
+HASH_LENGTH = 16
+
+SERVICE_WORKER_TEMPLATE = """// Generated by tools/generate_entry_pages.py; do not edit by hand.
+const MANIFEST_VERSION = "__MANIFEST_VERSION__";
+const MANIFEST_URL = "/__MANIFEST_NAME__";
+const MANIFEST_KEY = "/__precache-manifest__";
+const CACHE_NAME = "lincoln-devotional";
+
+let manifestPromise;
+
+const normalizePath = (pathname) =>
+  pathname.endsWith("/index.html") ? pathname.slice(0, -"index.html".length) : pathname;
+
+const readStoredManifest = async (cache) => {
+  const response = await cache.match(MANIFEST_KEY);
+  return response ? response.json() : { files: {}, precache: [], entries: [] };
+};
+
+const loadManifest = () => {
+  if (!manifestPromise) {
+    manifestPromise = caches.open(CACHE_NAME).then(readStoredManifest);
+  }
+  return manifestPromise;
+};
+
+const cacheMissing = async (cache, paths) => {
+  for (const path of paths) {
+    if (await cache.match(path)) {
+      continue;
+    }
+    try {
+      const response = await fetch(path);
+      if (response.ok) {
+        await cache.put(path, response);
+      }
+    } catch (error) {
+      console.warn(`Service worker: could not cache ${path}.`, error);
+    }
+  }
+};
+
+const FRAGMENT_NAME = "fragment.json";
+
+// static-entry-nav.js swaps entries in from their fragment.json, so a visit through either
+// the page or its fragment caches both the page and the fragment of each neighbour.
+const neighbourPaths = (manifest, path) => {
+  const entryPath = path.endsWith(`/${FRAGMENT_NAME}`) ? path.slice(0, -FRAGMENT_NAME.length) : path;
+  const position = manifest.entries.indexOf(entryPath);
+  if (position === -1) {
+    return [];
+  }
+  const count = manifest.entries.length;
+  return [
+    manifest.entries[(position - 1 + count) % count],
+    manifest.entries[(position + 1) % count],
+  ].flatMap((neighbour) => [neighbour, `${neighbour}${FRAGMENT_NAME}`]);
+};
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    (async () => {
+      const response = await fetch(`${MANIFEST_URL}?v=${MANIFEST_VERSION}`, { cache: "no-store" });
+      if (!response.ok) {
+        throw new Error(`Failed to load precache manifest: ${response.status}`);
+      }
+      const manifest = await response.json();
+      const cache = await caches.open(CACHE_NAME);
+      const previous = await readStoredManifest(cache);
+
+      // Only files whose content hash changed (or that were removed) are evicted.
+      const cachedRequests = await cache.keys();
+      await Promise.all(
+        cachedRequests.map((request) => {
+          const path = new URL(request.url).pathname;
+          if (path === MANIFEST_KEY) {
+            return null;
+          }
+          const hash = manifest.files[path];
+          return hash && hash === previous.files[path] ? null : cache.delete(request);
+        })
+      );
+
+      await cacheMissing(cache, manifest.precache);
+      await cache.put(
+        MANIFEST_KEY,
+        new Response(JSON.stringify(manifest), { headers: { "Content-Type": "application/json" } })
+      );
+      manifestPromise = Promise.resolve(manifest);
+      await self.skipWaiting();
+    })()
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(self.clients.claim());
+});
+
+self.addEventListener("fetch", (event) => {
+  const { request } = event;
+  if (request.method !== "GET") {
+    return;
+  }
+
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) {
+    return;
+  }
+
+  const path = normalizePath(url.pathname);
+  event.respondWith(
+    (async () => {
+      const manifest = await loadManifest();
+      if (!(path in manifest.files)) {
+        return fetch(request);
+      }
+
+      const cache = await caches.open(CACHE_NAME);
+      const neighbours = neighbourPaths(manifest, path);
+      if (neighbours.length) {
+        event.waitUntil(cacheMissing(cache, neighbours));
+      }
+
+      const cached = await cache.match(path);
+      if (cached) {
+        return cached;
+      }
+
+      const response = await fetch(request);
+      if (response.ok) {
+        await cache.put(path, response.clone());
+      }
+      return response;
+    })()
+  );
+});
+"""
+
+
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def build_precache_manifest(output_root, precache_paths, entry_paths, lazy_paths):
+    sink = as_sink(output_root)
+    files = {}
+    for url_path, file_path in [*precache_paths, *entry_paths, *lazy_paths]:
+        data = sink.read_bytes(file_path)
+        if data is not None:
+            files[url_path] = hash_bytes(data)
+
+    version = hash_bytes(json.dumps(files, sort_keys=True).encode("utf-8"))
+    return {
+        "version": version,
+        "precache": [url_path for url_path, _ in precache_paths if url_path in files],
+        "entries": [url_path for url_path, _ in entry_paths if url_path in files],
+        "files": files,
+    }
+
+
+def render_service_worker(manifest):
+    return (
+        SERVICE_WORKER_TEMPLATE
+        .replace("__MANIFEST_VERSION__", manifest["version"])
+        .replace("__MANIFEST_NAME__", PRECACHE_MANIFEST_NAME)
+    )
+
+
+def write_service_worker(output_root, precache_paths, entry_paths, lazy_paths):
+    sink = as_sink(output_root)
+    manifest = build_precache_manifest(sink, precache_paths, entry_paths, lazy_paths)
+    manifest_payload = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    sink.write_text(PRECACHE_MANIFEST_NAME, manifest_payload)
+    sink.write_text(SERVICE_WORKER_NAME, render_service_worker(manifest))
+    return {
+        "version": manifest["version"],
+        "files": len(manifest["files"]),
+        "manifest_bytes": len(manifest_payload.encode("utf-8")),
+    }
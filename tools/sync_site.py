@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import shutil
+import time
+
+try:
+    from tools.publish_manifest import PUBLISH_MANIFEST_NAME, diff_manifests, load_publish_manifest
+except ImportError:  # Run directly as `python3 tools/sync_site.py`.
+    from publish_manifest import PUBLISH_MANIFEST_NAME, diff_manifests, load_publish_manifest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def prune_empty_parents(path, stop_at):
+    parent = path.parent
+    while parent != stop_at and parent.is_dir() and not any(parent.iterdir()):
+        parent.rmdir()
+        parent = parent.parent
+
+
+def sync_site(source_root, target_root, dry_run=False):
+    """Copy only files whose hash differs from the target's last published manifest."""
+    started = time.perf_counter()
+    source_manifest_path = source_root / PUBLISH_MANIFEST_NAME
+    if not source_manifest_path.exists():
+        raise FileNotFoundError(f"No {PUBLISH_MANIFEST_NAME} in {source_root}; run generate_entry_pages.py first")
+
+    source_manifest = load_publish_manifest(source_manifest_path)
+    target_manifest = load_publish_manifest(target_root / PUBLISH_MANIFEST_NAME)
+    diff = diff_manifests(target_manifest, source_manifest)
+
+    if not dry_run:
+        for relative_path in diff["added"] + diff["changed"]:
+            destination = target_root / relative_path
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source_root / relative_path, destination)
+
+        for relative_path in diff["removed"]:
+            destination = target_root / relative_path
+            if destination.exists():
+                destination.unlink()
+                prune_empty_parents(destination, target_root)
+
+        # Written last so an interrupted sync is retried in full next time.
+        target_root.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source_manifest_path, target_root / PUBLISH_MANIFEST_NAME)
+
+    diff["seconds"] = time.perf_counter() - started
+    return diff
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Copy the changed files of a generated site into a target directory.")
+    parser.add_argument("target", type=Path, help="Directory standing in for (or mounted from) the server")
+    parser.add_argument("--source", type=Path, default=ROOT, help="Generated site root (default: repository root)")
+    parser.add_argument("--dry-run", action="store_true", help="Report the delta without copying anything")
+    args = parser.parse_args()
+
+    result = sync_site(args.source, args.target, dry_run=args.dry_run)
+    for label in ("added", "changed", "removed"):
+        for relative_path in result[label]:
+            print(f"{label:<8} {relative_path}")
+    action = "Would transfer" if args.dry_run else "Transferred"
+    print(
+        f"{action} {len(result['added']) + len(result['changed'])} files "
+        f"({result['transfer_bytes']} bytes), removed {len(result['removed'])} "
+        f"in {result['seconds'] * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
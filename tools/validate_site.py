@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from html import unescape
+import json
+import os
+from pathlib import Path
+import posixpath
+import re
+import sys
+import time
+from urllib.parse import urlsplit
+from xml.etree import ElementTree as ET
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SITE_URL = "https://lincolndevotional.com"
+SITEMAP_NAMESPACE = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+READ_CHUNK_SIZE = 1 << 14
+# Only the tags the checks look at are tokenized; everything else is skipped.
+TAG_PATTERN = re.compile(r"<(/?)(link|script|nav|a|div)\b([^>]*)>", re.IGNORECASE)
+ATTRIBUTE_PATTERN = re.compile(r"""([^\s=/>]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?""")
+# Below this many pages a process pool costs more to start than it saves.
+PARALLEL_THRESHOLD = 64
+
+
+def parse_attributes(attribute_text):
+    attributes = {}
+    for match in ATTRIBUTE_PATTERN.finditer(attribute_text):
+        name, double_quoted, single_quoted, unquoted = match.groups()
+        value = next((value for value in (double_quoted, single_quoted, unquoted) if value is not None), "")
+        attributes[name.lower()] = unescape(value)
+    return attributes
+
+
+def iter_tags(handle):
+    """Yield ``(is_end, tag, attributes)`` for the tags the checks need, one chunk at a time."""
+    buffer = ""
+    for chunk in iter(lambda: handle.read(READ_CHUNK_SIZE), ""):
+        buffer += chunk
+        # Hold back a tag that straddles the chunk boundary until the next read.
+        cut = buffer.rfind("<")
+        if cut == -1 or buffer.find(">", cut) != -1:
+            cut = len(buffer)
+        for match in TAG_PATTERN.finditer(buffer, 0, cut):
+            is_end, tag, attribute_text = match.groups()
+            yield bool(is_end), tag.lower(), parse_attributes(attribute_text)
+        buffer = buffer[cut:]
+
+
+def scan_page(path):
+    scan = {"canonical": None, "head_links": {}, "nav_links": [], "local_refs": [], "mmdd": None}
+    in_entry_nav = False
+    with open(path, encoding="utf-8") as handle:
+        for is_end, tag, attributes in iter_tags(handle):
+            if is_end:
+                if tag == "nav":
+                    in_entry_nav = False
+            elif tag == "link":
+                rel = attributes.get("rel")
+                href = attributes.get("href")
+                if rel == "canonical":
+                    scan["canonical"] = href
+                elif rel in ("prev", "next"):
+                    scan["head_links"][rel] = href
+                elif rel in ("stylesheet", "preload", "prefetch") and href:
+                    scan["local_refs"].append(href)
+            elif tag == "script" and attributes.get("src"):
+                scan["local_refs"].append(attributes["src"])
+            elif tag == "nav" and "entry-nav" in attributes.get("class", "").split():
+                in_entry_nav = True
+            elif tag == "a" and in_entry_nav and attributes.get("href"):
+                scan["nav_links"].append(attributes["href"])
+            elif tag == "div" and attributes.get("data-entry-mmdd"):
+                scan["mmdd"] = attributes["data-entry-mmdd"]
+    return scan
+
+
+def scan_pages(paths, workers):
+    if workers > 1 and len(paths) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(paths) // (workers * 4))
+            return list(executor.map(scan_page, paths, chunksize=chunksize))
+    return [scan_page(path) for path in paths]
+
+
+def resolve_local(page_href, ref):
+    parts = urlsplit(ref)
+    if parts.scheme or parts.netloc:
+        return None
+    target = parts.path if parts.path.startswith("/") else posixpath.join(page_href, parts.path)
+    return posixpath.normpath(target).lstrip("/")
+
+
+def check_pages(output_root, site_url, slugs, scans):
+    errors = []
+    slug_set = set(slugs)
+    neighbours = {}
+
+    for slug, scan in zip(slugs, scans):
+        page = f"entries/{slug}/index.html"
+        page_href = f"/entries/{slug}/"
+        expected_canonical = f"{site_url}{page_href}"
+        if scan["canonical"] != expected_canonical:
+            errors.append(f"{page}: canonical is {scan['canonical']!r}, expected {expected_canonical!r}")
+
+        if len(scan["nav_links"]) != 2:
+            errors.append(f"{page}: expected previous and next links, found {len(scan['nav_links'])}")
+            continue
+
+        targets = []
+        for label, nav_href in zip(("prev", "next"), scan["nav_links"]):
+            target = resolve_local(page_href, nav_href)
+            target_slug = target.split("/")[1] if target and target.startswith("entries/") else None
+            if target_slug not in slug_set:
+                errors.append(f"{page}: {label} link {nav_href!r} does not resolve to a generated entry")
+            head_href = scan["head_links"].get(label)
+            if head_href != f"/{target}/":
+                errors.append(f"{page}: <link rel={label}> {head_href!r} disagrees with nav link {nav_href!r}")
+            targets.append(target_slug)
+        neighbours[slug] = tuple(targets)
+
+        for ref in scan["local_refs"]:
+            target = resolve_local(page_href, ref)
+            if target is not None and not (output_root / target).is_file():
+                errors.append(f"{page}: referenced file {ref!r} is missing")
+
+    for slug, (previous_slug, next_slug) in neighbours.items():
+        if next_slug in neighbours and neighbours[next_slug][0] != slug:
+            errors.append(f"entries/{slug}/index.html: next page {next_slug} does not link back as previous")
+        if previous_slug in neighbours and neighbours[previous_slug][1] != slug:
+            errors.append(f"entries/{slug}/index.html: previous page {previous_slug} does not link forward as next")
+    return errors
+
+
+def check_routes(output_root, slugs, scans):
+    routes_path = output_root / "data" / "routes.json"
+    if not routes_path.exists():
+        return ["data/routes.json is missing"]
+    with routes_path.open(encoding="utf-8") as handle:
+        routes = json.load(handle)
+
+    errors = []
+    page_mmdds = {scan["mmdd"]: f"/entries/{slug}/" for slug, scan in zip(slugs, scans)}
+    route_hrefs = set(routes.values())
+    page_hrefs = {f"/entries/{slug}/" for slug in slugs}
+    for href in sorted(route_hrefs - page_hrefs):
+        errors.append(f"data/routes.json: {href} has no generated page")
+    for href in sorted(page_hrefs - route_hrefs):
+        errors.append(f"data/routes.json: generated page {href} is not routed")
+    for mmdd, href in sorted(routes.items()):
+        if href in page_hrefs and page_mmdds.get(mmdd) != href:
+            errors.append(f"data/routes.json: {mmdd} routes to {href}, which is not the page for that date")
+    return errors
+
+
+def check_fragments(output_root, site_url, slugs, scans):
+    errors = []
+    for slug, scan in zip(slugs, scans):
+        fragment_file = f"entries/{slug}/fragment.json"
+        fragment_path = output_root / fragment_file
+        if not fragment_path.is_file():
+            errors.append(f"{fragment_file} is missing")
+            continue
+        with fragment_path.open(encoding="utf-8") as handle:
+            fragment = json.load(handle)
+
+        expected = {
+            "href": f"/entries/{slug}/",
+            "canonical": f"{site_url}/entries/{slug}/",
+            "mmdd": scan["mmdd"],
+            **scan["head_links"],
+        }
+        for key, value in expected.items():
+            if fragment.get(key) != value:
+                errors.append(f"{fragment_file}: {key} is {fragment.get(key)!r}, page has {value!r}")
+        if "entry-card" not in fragment.get("article", ""):
+            errors.append(f"{fragment_file}: article is missing the entry card")
+    return errors
+
+
+def check_sitemap(output_root, site_url, slugs):
+    sitemap_path = output_root / "sitemap.xml"
+    if not sitemap_path.exists():
+        return ["sitemap.xml is missing"]
+
+    entry_prefix = f"{site_url}/entries/"
+    listed = set()
+    for _, element in ET.iterparse(sitemap_path):
+        if element.tag == f"{SITEMAP_NAMESPACE}loc" and element.text and element.text.startswith(entry_prefix):
+            listed.add(element.text)
+        element.clear()
+
+    generated = {f"{entry_prefix}{slug}/" for slug in slugs}
+    errors = [f"sitemap.xml: {url} has no generated page" for url in sorted(listed - generated)]
+    errors.extend(f"sitemap.xml: generated page {url} is not listed" for url in sorted(generated - listed))
+    return errors
+
+
+def validate_site(output_root, site_url=SITE_URL, workers=None):
+    """Check that the generated pages, routes and sitemap agree; returns error strings."""
+    workers = workers or os.cpu_count() or 1
+    entries_dir = output_root / "entries"
+    slugs = sorted(path.parent.name for path in entries_dir.glob("*/index.html"))
+    if not slugs:
+        return [f"No entry pages found under {entries_dir}"]
+
+    scans = scan_pages([str(entries_dir / slug / "index.html") for slug in slugs], workers)
+    errors = check_pages(output_root, site_url, slugs, scans)
+    errors.extend(check_fragments(output_root, site_url, slugs, scans))
+    errors.extend(check_routes(output_root, slugs, scans))
+    errors.extend(check_sitemap(output_root, site_url, slugs))
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate links and manifests in the generated site.")
+    parser.add_argument("--root", type=Path, default=ROOT, help="Generated site root (default: repository root)")
+    parser.add_argument("--site-url", default=SITE_URL, help=f"Canonical site URL (default: {SITE_URL})")
+    parser.add_argument("--workers", type=int, help="Parser processes (default: CPU count)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    errors = validate_site(args.root, args.site_url, args.workers)
+    elapsed = (time.perf_counter() - started) * 1000
+    for error in errors:
+        print(error)
+    if errors:
+        print(f"Site validation failed with {len(errors)} errors in {elapsed:.1f} ms")
+        sys.exit(1)
+    print(f"Site validation passed in {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 import sys
 import os
+import argparse
+import cProfile
+import functools
 import json
 import re
 import difflib
+import time
 from typing import List, Dict, Tuple, Optional
 
 # Add venv site-packages to path
@@ -13,22 +17,112 @@ try:
 except ImportError:
     pass
 
+DEFAULT_ENTRIES_PATH = 'data/entries.json'
+DEFAULT_REVIEW_PATH = 'docs/verse_review.md'
+
+# Method name -> phase label. Phases nest (get_chapter_data includes its kjv.get and
+# normalize_text calls), so cumulative times overlap rather than sum to the total.
+PROFILED_PHASES = {
+    'load_bible': 'load_bible (SWORD parsing)',
+    'build_book_map': 'build_book_map',
+    'get_chapter_data': 'get_chapter_data',
+    'get_verse_text': 'kjv.get',
+    'normalize_text': 'normalize_text',
+    'strict_ratio': 'SequenceMatcher: strict ratio',
+    'subsequence_ratio': 'SequenceMatcher: subsequence blocks',
+    'longest_match': 'SequenceMatcher: longest match in chapter',
+}
+
+class PhaseProfiler:
+    """Cumulative wall time and call counts per verifier phase, plus per-entry timings."""
+
+    def __init__(self):
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.entries: List[Dict] = []
+
+    def instrument(self, obj, phases: Dict[str, str] = PROFILED_PHASES):
+        for method_name, label in phases.items():
+            setattr(obj, method_name, self.timed(label, getattr(obj, method_name)))
+
+    def timed(self, label: str, func):
+        stats = self.phases.setdefault(label, {'calls': 0, 'seconds': 0.0})
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats['seconds'] += time.perf_counter() - started
+                stats['calls'] += 1
+        return wrapper
+
+    def record_entry(self, entry: Dict, seconds: float, chapter_size: Tuple[int, int]):
+        self.entries.append({
+            'mmdd': entry.get('mmdd'),
+            'verse_ref': entry.get('verse_ref'),
+            'seconds': seconds,
+            'chapter_verses': chapter_size[0],
+            'chapter_chars': chapter_size[1],
+        })
+
+    def summary(self, top: int = 10) -> Dict:
+        entry_seconds = sum(item['seconds'] for item in self.entries)
+        phases = {
+            label: {
+                'calls': stats['calls'],
+                'seconds': round(stats['seconds'], 6),
+                'mean_ms': round(stats['seconds'] * 1000 / stats['calls'], 4) if stats['calls'] else 0.0,
+            }
+            for label, stats in sorted(self.phases.items(), key=lambda item: -item[1]['seconds'])
+        }
+        slowest = sorted(self.entries, key=lambda item: -item['seconds'])[:top]
+        return {
+            'entries': len(self.entries),
+            'entry_seconds': round(entry_seconds, 6),
+            'phases': phases,
+            'slowest_entries': [dict(item, seconds=round(item['seconds'], 6)) for item in slowest],
+        }
+
+    def print_summary(self, top: int = 10):
+        summary = self.summary(top)
+        print(f"Profiled {summary['entries']} entries in {summary['entry_seconds']:.3f}s (phases nest; times overlap)")
+        for label, stats in summary['phases'].items():
+            print(f"  {label:<42} {stats['seconds']:>9.3f}s {stats['calls']:>9} calls {stats['mean_ms']:>9.3f} ms/call")
+        print("Slowest entries:")
+        for item in summary['slowest_entries']:
+            print(
+                f"  {item['mmdd']} {item['verse_ref']:<28} {item['seconds'] * 1000:>8.1f} ms "
+                f"(chapter: {item['chapter_verses']} verses, {item['chapter_chars']} chars)"
+            )
+
 class BibleVerifier:
-    def __init__(self, entries_path: str, bible_path: str):
+    def __init__(self, entries_path: Optional[str], bible_path: Optional[str],
+                 profiler: Optional[PhaseProfiler] = None, bible=None):
         self.entries_path = entries_path
         self.bible_path = bible_path
         self.entries = []
         self.kjv = None
         self.book_map = {} 
         self.bible_structure = None
+        self.profiler = profiler
+        self.last_chapter_size = (0, 0)
         
         self.manual_review_list = []
         self.corrections_count = 0
         self.expanded_refs_count = 0
         self.verified_count = 0
         
-        self.load_entries()
-        self.load_bible()
+        if profiler:
+            profiler.instrument(self)
+        if entries_path:
+            self.load_entries()
+        if bible is None:
+            self.load_bible()
+        else:
+            # An already-loaded Bible (or any object with pysword's get/get_structure)
+            self.kjv = bible
+            self.bible_structure = bible.get_structure()
         self.build_book_map()
 
     def load_entries(self):
@@ -171,7 +265,20 @@ class BibleVerifier:
                 parts.append(f"{s}-{e}")
         return ", ".join(parts)
 
+    def strict_ratio(self, norm_entry: str, target_norm_text: str) -> float:
+        return difflib.SequenceMatcher(None, norm_entry, target_norm_text).ratio()
+
+    def subsequence_ratio(self, target_norm_text: str, norm_entry: str) -> float:
+        block_matcher = difflib.SequenceMatcher(None, target_norm_text, norm_entry)
+        matched_len = sum(m.size for m in block_matcher.get_matching_blocks())
+        return matched_len / len(norm_entry) if len(norm_entry) > 0 else 0
+
+    def longest_match(self, norm_full_text: str, norm_entry: str):
+        matcher = difflib.SequenceMatcher(None, norm_full_text, norm_entry)
+        return matcher.find_longest_match(0, len(norm_full_text), 0, len(norm_entry))
+
     def verify_entry(self, entry):
+        self.last_chapter_size = (0, 0)
         ref = entry.get('verse_ref')
         text = entry.get('bible_verse')
         mmdd = entry.get('mmdd')
@@ -191,6 +298,7 @@ class BibleVerifier:
              return
              
         raw_verses, norm_full_text, norm_v_map = self.get_chapter_data(book_key, parsed['chapter'])
+        self.last_chapter_size = (len(raw_verses), len(norm_full_text))
         
         if not raw_verses:
              self.manual_review_list.append({'entry': entry, 'reason': f"Empty chapter: {book_key} {parsed['chapter']}"})
@@ -204,8 +312,7 @@ class BibleVerifier:
         
         norm_entry = self.normalize_text(text)
         
-        strict_matcher = difflib.SequenceMatcher(None, norm_entry, target_norm_text)
-        strict_ratio = strict_matcher.ratio()
+        strict_ratio = self.strict_ratio(norm_entry, target_norm_text)
         
         if strict_ratio > 0.85:
              new_text = " ".join([raw_verses[v] for v in parsed['verses'] if v in raw_verses])
@@ -219,10 +326,7 @@ class BibleVerifier:
 
         # Check for Subsequence / Edited Match (e.g. "Verse part A... Verse part B")
         # We check against target_norm_text (the verses in ref)
-        block_matcher = difflib.SequenceMatcher(None, target_norm_text, norm_entry)
-        matches = block_matcher.get_matching_blocks()
-        matched_len = sum(m.size for m in matches)
-        subseq_ratio = matched_len / len(norm_entry) if len(norm_entry) > 0 else 0
+        subseq_ratio = self.subsequence_ratio(target_norm_text, norm_entry)
         
         if subseq_ratio > 0.90:
              # High subsequence match implies valid editing/skipping
@@ -231,8 +335,7 @@ class BibleVerifier:
              self.verified_count += 1
              return
 
-        matcher = difflib.SequenceMatcher(None, norm_full_text, norm_entry)
-        match = matcher.find_longest_match(0, len(norm_full_text), 0, len(norm_entry))
+        match = self.longest_match(norm_full_text, norm_entry)
         
         match_ratio = match.size / len(norm_entry) if len(norm_entry) > 0 else 0
         
@@ -274,17 +377,29 @@ class BibleVerifier:
             'entry_len': len(norm_entry)
         })
 
-    def run(self):
-        print(f"Processing {len(self.entries)} entries...")
+    def verify_all(self):
         for entry in self.entries:
+            if not self.profiler:
+                self.verify_entry(entry)
+                continue
+            started = time.perf_counter()
             self.verify_entry(entry)
+            self.profiler.record_entry(entry, time.perf_counter() - started, self.last_chapter_size)
+
+    def run(self, write_outputs: bool = True, review_path: Optional[str] = None):
+        print(f"Processing {len(self.entries)} entries...")
+        self.verify_all()
             
         print(f"Verified: {self.verified_count}")
         print(f"Corrections (Text only): {self.corrections_count}")
         print(f"Ref Expansions: {self.expanded_refs_count}")
         print(f"Manual Review: {len(self.manual_review_list)}")
+        if not write_outputs:
+            return
         
-        with open('docs/verse_review.md', 'w') as f:
+        review_path = review_path or default_review_path(self.entries_path)
+        os.makedirs(os.path.dirname(review_path) or '.', exist_ok=True)
+        with open(review_path, 'w', encoding='utf-8') as f:
             f.write("# Verse Review Report\n\n")
             f.write(f"- Verified: {self.verified_count}\n")
             f.write(f"- Corrections: {self.corrections_count}\n")
@@ -300,9 +415,53 @@ class BibleVerifier:
                 f.write(f"- Entry Text: {e.get('bible_verse')}\n")
                 f.write("\n")
                 
-        with open('data/entries.json', 'w', encoding='utf-8') as f:
+        with open(self.entries_path, 'w', encoding='utf-8') as f:
             json.dump(self.entries, f, indent=2, ensure_ascii=False)
 
+def default_review_path(entries_path: str) -> str:
+    # The checked-in dataset keeps its report in docs/; any other file gets one alongside it.
+    if os.path.abspath(entries_path) == os.path.abspath(DEFAULT_ENTRIES_PATH):
+        return DEFAULT_REVIEW_PATH
+    return f"{os.path.splitext(entries_path)[0]}.verse_review.md"
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify entry verse text against the KJV SWORD module.")
+    parser.add_argument('--entries', default=DEFAULT_ENTRIES_PATH,
+                        help="Entries file, verified and rewritten in place (default: data/entries.json)")
+    parser.add_argument('--review',
+                        help="Review report path (default: docs/verse_review.md for data/entries.json, "
+                             "otherwise <entries>.verse_review.md next to the entries file)")
+    parser.add_argument('--bible', default='data/kjv-bible', help="SWORD module directory (default: data/kjv-bible)")
+    parser.add_argument('--profile', action='store_true',
+                        help="Time each phase and entry; skips writing entries.json and the review report")
+    parser.add_argument('--profile-json', default='docs/verse_profile.json',
+                        help="With --profile: JSON summary path (default: docs/verse_profile.json)")
+    parser.add_argument('--cprofile', help="With --profile: also write a cProfile dump here (view with pstats/snakeviz)")
+    parser.add_argument('--top', type=int, default=10, help="With --profile: slowest entries to report (default: 10)")
+    args = parser.parse_args()
+
+    if not args.profile:
+        BibleVerifier(args.entries, args.bible).run(review_path=args.review)
+        return
+
+    profiler = PhaseProfiler()
+    cprofiler = cProfile.Profile() if args.cprofile else None
+    started = time.perf_counter()
+    if cprofiler:
+        cprofiler.enable()
+    verifier = BibleVerifier(args.entries, args.bible, profiler)
+    verifier.run(write_outputs=False)
+    if cprofiler:
+        cprofiler.disable()
+        cprofiler.dump_stats(args.cprofile)
+
+    summary = profiler.summary(args.top)
+    summary['total_seconds'] = round(time.perf_counter() - started, 6)
+    profiler.print_summary(args.top)
+    os.makedirs(os.path.dirname(args.profile_json) or '.', exist_ok=True)
+    with open(args.profile_json, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    print(f"Profile summary written to {args.profile_json}" + (f", cProfile dump to {args.cprofile}" if cprofiler else ""))
+
 if __name__ == "__main__":
-    verifier = BibleVerifier('data/entries.json', 'data/kjv-bible')
-    verifier.run()
+    main()